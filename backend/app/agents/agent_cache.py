@@ -0,0 +1,121 @@
+"""
+Process-level cache of compiled agents.
+
+Building an agent (loading the prompt, creating the LLM client, binding tools
+and compiling the LangGraph StateGraph) is much more expensive than running a
+short investigation. Warm Lambda containers and long-running workers keep the
+compiled graph here and only rebuild it when the agent configuration or its
+system prompt changes.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from ..entity.AgentConfig import AgentConfig
+from ..utils.ttl_cache import TTLCache
+
+_agent_cache: Optional[TTLCache] = None
+
+
+def compute_config_hash(agent_config: AgentConfig) -> str:
+    """
+    Compute a stable version hash for an agent configuration.
+
+    Any change to a field of the config (model, tools, prompt_id, ...) yields
+    a different hash, so the cached agent is rebuilt automatically.
+
+    Args:
+        agent_config: The agent configuration
+
+    Returns:
+        Hex digest identifying this version of the configuration
+    """
+    payload = json.dumps(
+        dataclasses.asdict(agent_config), sort_keys=True, default=str
+    ).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def compute_agent_version(agent_config: AgentConfig) -> str:
+    """
+    Compute a version identifier covering the config and its system prompt.
+
+    The prompt is read through the prompt cache, so an updated prompt produces
+    a new version once save_prompt invalidates it (or its TTL expires).
+
+    Args:
+        agent_config: The agent configuration
+
+    Returns:
+        "<config hash>-<prompt hash>"
+    """
+    from ..db_commands.prompt_commands import load_prompt
+
+    prompt = load_prompt(agent_config.prompt_id)
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+    return f"{compute_config_hash(agent_config)}-{prompt_hash}"
+
+
+def get_agent_cache() -> TTLCache:
+    """
+    Get the process-wide compiled agent cache.
+
+    Size and TTL are read from AGENT_CACHE_MAX_SIZE and AGENT_CACHE_TTL_SECONDS
+    the first time the cache is created.
+    """
+    global _agent_cache
+    if _agent_cache is None:
+        _agent_cache = TTLCache(
+            max_size=int(os.getenv("AGENT_CACHE_MAX_SIZE", "32")),
+            ttl_seconds=float(os.getenv("AGENT_CACHE_TTL_SECONDS", "900")),
+        )
+    return _agent_cache
+
+
+def get_or_create_agent(agent_config: AgentConfig) -> Any:
+    """
+    Return the compiled agent for a configuration, building it on a cache miss.
+
+    Args:
+        agent_config: The agent configuration
+
+    Returns:
+        Compiled LangGraph agent workflow
+    """
+    from ..tools.tool_loader import gather_agent_tools
+    from .agent_factory import instantiate_agent
+
+    cache_key = (agent_config.config_id, compute_agent_version(agent_config))
+
+    def build_agent() -> Any:
+        tools = gather_agent_tools(agent_config)
+        return instantiate_agent(agent_config, tools)
+
+    return get_agent_cache().get_or_set(cache_key, build_agent)
+
+
+def invalidate_agent(config_id: Optional[str] = None) -> int:
+    """
+    Drop cached agents so the next request rebuilds them.
+
+    Args:
+        config_id: Only invalidate agents built from this config (all if None)
+
+    Returns:
+        Number of cached agents removed
+    """
+    cache = get_agent_cache()
+    if config_id is None:
+        removed = len(cache)
+        cache.clear()
+        return removed
+
+    return cache.invalidate_where(lambda key: key[0] == config_id)
+
+
+def get_agent_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters for the compiled agent cache."""
+    return get_agent_cache().stats()
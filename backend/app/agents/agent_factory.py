@@ -1,9 +1,11 @@
-from typing import Any, Dict, Optional
-
-from langchain_aws import ChatBedrock
+import os
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..entity.AgentConfig import AgentConfig
+from ..entity.AgentEvent import (AgentEvent, FinalVerdict, IterationCompleted,
+                                 TokenDelta, ToolCallFinished, ToolCallStarted)
 from .agent_workflow import create_agent_workflow
+from .llm_factory import create_llm
 
 
 def instantiate_agent(agent_config: AgentConfig, tools: Dict[str, Any]) -> Any:
@@ -29,50 +31,24 @@ def instantiate_agent(agent_config: AgentConfig, tools: Dict[str, Any]) -> Any:
     system_prompt = load_prompt(agent_config.prompt_id)
 
     # 2. Initialize the LLM based on agent config
-    if agent_config.llm_provider == "anthropic":
-        from langchain_anthropic import ChatAnthropic
-
-        llm = ChatAnthropic(
-            model=agent_config.model_id,
-            temperature=float(
-                agent_config.temperature
-            ),  # Ensure float for JSON serialization
-            max_tokens=int(agent_config.max_tokens),
-        )
-    elif agent_config.llm_provider == "openai":
-        from langchain_openai import ChatOpenAI
-
-        llm = ChatOpenAI(
-            model=agent_config.model_id,
-            temperature=float(
-                agent_config.temperature
-            ),  # Ensure float for JSON serialization
-            max_tokens=int(agent_config.max_tokens),
-        )
-    elif agent_config.llm_provider == "bedrock":
-        llm = ChatBedrock(
-            model_id=agent_config.model_id,
-            model_kwargs={
-                "temperature": float(
-                    agent_config.temperature
-                ),  # Ensure float for JSON serialization
-                "max_tokens": int(agent_config.max_tokens),
-            },
-        )
-    else:
-        raise ValueError(f"Unsupported LLM provider: {agent_config.llm_provider}")
-
-    # 3. Bind tools to LLM if any tools are available
-    if tools:
-        tool_list = list(tools.values())
-        llm = llm.bind_tools(tool_list)
+    llm = create_llm(
+        llm_provider=agent_config.llm_provider,
+        model_id=agent_config.model_id,
+        temperature=agent_config.temperature,
+        max_tokens=agent_config.max_tokens,
+    )
 
-    # 4. Create the StateGraph workflow
+    # 3. Create the StateGraph workflow (binds the tools to the LLM)
     agent_workflow = create_agent_workflow(
         llm=llm,
         tools=tools,
         system_prompt=system_prompt,
         max_iterations=agent_config.max_iterations,
+        max_tool_concurrency=int(agent_config.max_tool_concurrency),
+        context_token_budget=int(
+            agent_config.context_token_budget or os.getenv("CONTEXT_TOKEN_BUDGET", "0")
+        ),
+        context_keep_turns=int(os.getenv("CONTEXT_KEEP_TURNS", "2")),
     )
 
     return agent_workflow
@@ -95,48 +71,266 @@ def invoke_agent(agent: Any, user_input: str) -> Dict[str, Any]:
         ValueError: If user_input is empty
         RuntimeError: If agent execution fails
     """
+    initial_state = _build_initial_state(agent, user_input)
+
+    try:
+        # Invoke the workflow (the agent is the compiled graph)
+        final_state = agent.invoke(initial_state)
+
+        return _format_execution_result(final_state)
+
+    except Exception as e:
+        raise RuntimeError(f"Agent execution failed: {str(e)}") from e
+
+
+async def ainvoke_agent(agent: Any, user_input: str) -> Dict[str, Any]:
+    """
+    Async variant of invoke_agent.
+
+    The graph runs with ainvoke, so LLM requests and tool calls are awaited
+    instead of blocking a thread; many executions can share one event loop.
+
+    Args:
+        agent: The instantiated LangGraph agent
+        user_input: User's input/query for the agent
+
+    Returns:
+        Same dictionary as invoke_agent
+
+    Raises:
+        ValueError: If user_input is empty
+        RuntimeError: If agent execution fails
+    """
+    initial_state = _build_initial_state(agent, user_input)
+
+    try:
+        final_state = await agent.ainvoke(initial_state)
+        return _format_execution_result(final_state)
+
+    except Exception as e:
+        raise RuntimeError(f"Agent execution failed: {str(e)}") from e
+
+
+# LangGraph stream modes used by stream_agent/astream_agent
+STREAM_MODES = ["messages", "updates", "custom"]
+
+
+def stream_agent(agent: Any, user_input: str) -> Iterator[AgentEvent]:
+    """
+    Execute the agent and yield events as they happen.
+
+    Built on the compiled graph's stream(): model tokens arrive as TokenDelta,
+    tools as ToolCallStarted/ToolCallFinished, each model call as
+    IterationCompleted, and the run ends with a FinalVerdict carrying the same
+    result, metadata and full_state as invoke_agent. Only state deltas are
+    processed; the messages they add are collected for the transcript.
+
+    Args:
+        agent: The instantiated LangGraph agent
+        user_input: User's input/query for the agent
+
+    Yields:
+        AgentEvent instances
+
+    Raises:
+        ValueError: If user_input is empty
+        RuntimeError: If agent execution fails
+    """
+    initial_state = _build_initial_state(agent, user_input)
+    tracker = _StreamTracker(initial_state)
+
+    try:
+        for mode, payload in agent.stream(initial_state, stream_mode=STREAM_MODES):
+            yield from tracker.handle(mode, payload)
+    except Exception as e:
+        raise RuntimeError(f"Agent execution failed: {str(e)}") from e
+
+    yield tracker.final_verdict()
+
+
+async def astream_agent(agent: Any, user_input: str) -> AsyncIterator[AgentEvent]:
+    """
+    Async variant of stream_agent, built on the compiled graph's astream().
+
+    Args:
+        agent: The instantiated LangGraph agent
+        user_input: User's input/query for the agent
+
+    Yields:
+        AgentEvent instances
+
+    Raises:
+        ValueError: If user_input is empty
+        RuntimeError: If agent execution fails
+    """
+    initial_state = _build_initial_state(agent, user_input)
+    tracker = _StreamTracker(initial_state)
+
+    try:
+        async for mode, payload in agent.astream(
+            initial_state, stream_mode=STREAM_MODES
+        ):
+            for event in tracker.handle(mode, payload):
+                yield event
+    except Exception as e:
+        raise RuntimeError(f"Agent execution failed: {str(e)}") from e
+
+    yield tracker.final_verdict()
+
+
+class _StreamTracker:
+    """
+    Turns LangGraph stream chunks into AgentEvents.
+
+    Keeps what the final metadata needs (counters, the latest tool results and
+    the latest model answer) and the messages, which the graph only ever
+    appends (operator.add), so the transcript matches invoke_agent's.
+    """
+
+    def __init__(self, initial_state: Dict[str, Any]):
+        self.iterations = 0
+        self.messages: List[Any] = list(initial_state["messages"])
+        self.tool_results: List[Dict[str, Any]] = []
+        self.token_usage: List[Dict[str, Any]] = []
+        self.result: Any = ""
+
+    def handle(self, mode: str, payload: Any) -> List[AgentEvent]:
+        if mode == "messages":
+            chunk, metadata = payload
+            if metadata.get("langgraph_node") != "agent":
+                return []
+            text = _chunk_text(chunk)
+            return (
+                [TokenDelta(text=text, iteration=self.iterations + 1)] if text else []
+            )
+
+        if mode == "custom":
+            if payload.get("event") == "tool_call_started":
+                return [
+                    ToolCallStarted(
+                        tool_call_id=payload["tool_call_id"],
+                        tool_name=payload["tool_name"],
+                        args=payload["args"],
+                    )
+                ]
+            if payload.get("event") == "tool_call_finished":
+                return [
+                    ToolCallFinished(
+                        tool_call_id=payload["tool_call_id"],
+                        tool_name=payload["tool_name"],
+                        output=payload["output"],
+                        failed=payload["failed"],
+                        duration_ms=payload["duration_ms"],
+                    )
+                ]
+            return []
+
+        events = []
+        if mode == "updates":
+            for node, update in payload.items():
+                if not update:
+                    continue
+                messages = update.get("messages", [])
+                self.messages.extend(messages)
+
+                if node == "agent":
+                    self.iterations = update.get("iteration_count", self.iterations)
+                    self.token_usage.extend(update.get("token_usage", []))
+                    response = messages[-1]
+                    self.result = (
+                        response.content
+                        if hasattr(response, "content")
+                        else str(response)
+                    )
+                    tool_calls = getattr(response, "tool_calls", None) or []
+                    events.append(
+                        IterationCompleted(
+                            iteration=self.iterations, tool_calls=len(tool_calls)
+                        )
+                    )
+                elif node == "tools":
+                    self.tool_results = update.get("tool_results", [])
+        return events
+
+    def final_verdict(self) -> FinalVerdict:
+        return FinalVerdict(
+            result=self.result,
+            metadata={
+                "iterations": self.iterations,
+                "tool_calls": len(self.tool_results),
+                "tool_results": self.tool_results,
+                "total_messages": len(self.messages),
+                **_token_usage_metadata(self.token_usage),
+            },
+            full_state={
+                "messages": self.messages,
+                "iteration_count": self.iterations,
+                "tool_results": self.tool_results,
+                "token_usage": self.token_usage,
+            },
+        )
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text of a streamed message chunk (string or content blocks)."""
+    content = getattr(chunk, "content", "")
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "")
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+def _build_initial_state(agent: Any, user_input: str) -> Dict[str, Any]:
+    """Validate the inputs and prepare the initial StateGraph state."""
     if not user_input:
         raise ValueError("user_input cannot be empty")
 
     if not agent:
         raise ValueError("agent cannot be None")
 
-    try:
-        # Prepare initial state for the StateGraph
-        from langchain_core.messages import HumanMessage
+    from langchain_core.messages import HumanMessage
 
-        initial_state = {
-            "messages": [HumanMessage(content=user_input)],
-            "user_input": user_input,
-            "tool_results": [],
-            "final_output": "",
-            "iteration_count": 0,
-        }
+    return {
+        "messages": [HumanMessage(content=user_input)],
+        "user_input": user_input,
+        "tool_results": [],
+        "final_output": "",
+        "iteration_count": 0,
+        "token_usage": [],
+    }
 
-        # Invoke the workflow (the agent is the compiled graph)
-        final_state = agent.invoke(initial_state)
 
-        # TODO: persist the whole agent iteration like tool calls, messages, etc. to AWS S3
+def _token_usage_metadata(token_usage: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Per-iteration token usage and its totals for the execution metadata."""
+    return {
+        "input_tokens": sum(usage["input_tokens"] for usage in token_usage),
+        "output_tokens": sum(usage["output_tokens"] for usage in token_usage),
+        "token_usage": token_usage,
+    }
 
-        # Extract the final response
-        final_message = final_state["messages"][-1]
-        result_content = (
-            final_message.content
-            if hasattr(final_message, "content")
-            else str(final_message)
-        )
 
-        # Format output for persistence to AWS S3
-        return {
-            "result": result_content,
-            "metadata": {
-                "iterations": final_state.get("iteration_count", 0),
-                "tool_calls": len(final_state.get("tool_results", [])),
-                "tool_results": final_state.get("tool_results", []),
-                "total_messages": len(final_state.get("messages", [])),
-            },
-            "full_state": final_state,
-        }
+def _format_execution_result(final_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the final response and execution metadata from the graph state."""
+    final_message = final_state["messages"][-1]
+    result_content = (
+        final_message.content
+        if hasattr(final_message, "content")
+        else str(final_message)
+    )
 
-    except Exception as e:
-        raise RuntimeError(f"Agent execution failed: {str(e)}") from e
+    # full_state is persisted as the execution transcript (see
+    # infra/transcript_store.py) when a transcript store is configured
+    return {
+        "result": result_content,
+        "metadata": {
+            "iterations": final_state.get("iteration_count", 0),
+            "tool_calls": len(final_state.get("tool_results", [])),
+            "tool_results": final_state.get("tool_results", []),
+            "total_messages": len(final_state.get("messages", [])),
+            **_token_usage_metadata(final_state.get("token_usage", [])),
+        },
+        "full_state": final_state,
+    }
@@ -1,11 +1,20 @@
+import asyncio
+import json
 import operator
-from typing import Annotated, Any, Dict, List, TypedDict
+import time
+from typing import Annotated, Any, Dict, List, Tuple, TypedDict
 
 from langchain_core.messages import (AIMessage, BaseMessage, HumanMessage,
                                      ToolMessage)
+from langchain_core.runnables import RunnableLambda
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langgraph.config import get_stream_writer
 from langgraph.graph import END, StateGraph
 from langgraph.prebuilt import ToolNode
 
+from ..tools.tool_loader import get_tool_schemas
+from .context_budget import count_message_tokens, fit_messages_to_budget
+
 
 class AgentState(TypedDict):
     """
@@ -17,27 +26,88 @@ class AgentState(TypedDict):
     tool_results: List[Dict[str, Any]]
     final_output: str
     iteration_count: int
+    # Tokens in/out of each model call, appended by the agent node
+    token_usage: Annotated[List[Dict[str, Any]], operator.add]
+
+
+def serialize_tool_output(output: Any) -> str:
+    """
+    Render a tool result as ToolMessage content.
+
+    Text results pass through; structured results (tool_output_format
+    "json") are sent to the model as compact JSON.
+    """
+    if isinstance(output, str):
+        return output
+    return json.dumps(output, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _emit_tool_started(writer: Any, tool_call: Dict[str, Any]) -> float:
+    """Emit a tool_call_started custom stream event; returns the start time."""
+    if writer is not None:
+        writer(
+            {
+                "event": "tool_call_started",
+                "tool_call_id": tool_call.get("id"),
+                "tool_name": tool_call["name"],
+                "args": tool_call["args"],
+            }
+        )
+    return time.perf_counter()
+
+
+def _emit_tool_finished(
+    writer: Any, tool_call: Dict[str, Any], output: Any, failed: bool, started: float
+) -> None:
+    """Emit a tool_call_finished custom stream event."""
+    if writer is not None:
+        writer(
+            {
+                "event": "tool_call_finished",
+                "tool_call_id": tool_call.get("id"),
+                "tool_name": tool_call["name"],
+                "output": serialize_tool_output(output),
+                "failed": failed,
+                "duration_ms": (time.perf_counter() - started) * 1000,
+            }
+        )
 
 
 def create_agent_workflow(
-    llm: Any, tools: Dict[str, Any], system_prompt: str, max_iterations: int = 10
+    llm: Any,
+    tools: Dict[str, Any],
+    system_prompt: str,
+    max_iterations: int = 10,
+    max_tool_concurrency: int = 1,
+    context_token_budget: int = 0,
+    context_keep_turns: int = 2,
 ):
     """
     Create a LangGraph StateGraph workflow for the agent.
 
+    Tools are bound to the LLM here (once), using schemas cached per tool set.
+    Before each model call the message history is fitted to
+    context_token_budget (see context_budget.py); the tokens in/out of each
+    call are recorded in the state's token_usage.
+
     Args:
-        llm: The language model instance (e.g., ChatAnthropic)
+        llm: The language model instance without tools bound (e.g., ChatAnthropic)
         tools: Dictionary of available tools
         system_prompt: The system prompt for the agent
         max_iterations: Maximum number of agent loop iterations
+        max_tool_concurrency: Maximum tool calls executed in parallel within
+            one turn (1 runs them sequentially)
+        context_token_budget: Maximum estimated input tokens per model call
+            (0 sends the full history)
+        context_keep_turns: Latest tool turns always sent verbatim
 
     Returns:
         Compiled LangGraph application
     """
     from langgraph.graph import END, StateGraph
 
-    # Bind tools to LLM
-    llm_with_tools = llm.bind_tools(list(tools.values()))
+    # Bind tools to LLM (schemas are converted once per tool set)
+    llm_with_tools = llm.bind_tools(get_tool_schemas(tools)) if tools else llm
 
     def should_continue(state: AgentState) -> str:
         """
@@ -57,65 +127,186 @@ def create_agent_workflow(
         # Otherwise continue to tools
         return "continue"
 
-    def call_model(state: AgentState) -> Dict[str, Any]:
+    def prepare_messages(state: AgentState) -> Tuple[List[Any], Dict[str, int]]:
         """
-        Call the LLM with current state.
+        Messages sent to the LLM: the system prompt followed by the history,
+        fitted to the context token budget. Also returns the trimming stats.
         """
-        messages = state["messages"]
-
-        # Add system prompt if this is the first call
-        if len(messages) == 1:
-            messages = [{"role": "system", "content": system_prompt}, *messages]
+        messages = [{"role": "system", "content": system_prompt}, *state["messages"]]
+        return fit_messages_to_budget(
+            messages, context_token_budget, keep_turns=context_keep_turns
+        )
 
-        response = llm_with_tools.invoke(messages)
+    def build_model_update(
+        state: AgentState, response: Any, stats: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """
+        Turn the model response into the state update returned by the agent
+        node. Token counts come from the provider's usage metadata, or are
+        estimated when the provider reports none.
+        """
+        iteration = state.get("iteration_count", 0) + 1
+        usage = getattr(response, "usage_metadata", None) or {}
 
         return {
             "messages": [response],
-            "iteration_count": state.get("iteration_count", 0) + 1,
+            "iteration_count": iteration,
+            "token_usage": [
+                {
+                    "iteration": iteration,
+                    "input_tokens": usage.get("input_tokens", stats["sent_tokens"]),
+                    "output_tokens": usage.get(
+                        "output_tokens", count_message_tokens(response)
+                    ),
+                    "estimated": not usage,
+                    "context_tokens": stats["context_tokens"],
+                    "summarised_messages": stats["summarised"],
+                    "dropped_messages": stats["dropped"],
+                }
+            ],
         }
 
+    def call_model(state: AgentState) -> Dict[str, Any]:
+        """
+        Call the LLM with current state.
+        """
+        messages, stats = prepare_messages(state)
+        response = llm_with_tools.invoke(messages)
+
+        return build_model_update(state, response, stats)
+
+    async def acall_model(state: AgentState) -> Dict[str, Any]:
+        """
+        Async variant of call_model, used when the graph runs via ainvoke.
+        """
+        messages, stats = prepare_messages(state)
+        response = await llm_with_tools.ainvoke(messages)
+
+        return build_model_update(state, response, stats)
+
+    def run_tool_call(tool_call: Dict[str, Any], writer: Any = None) -> Any:
+        """
+        Execute a single tool call, capturing errors as the tool output.
+
+        Started/finished events go to the graph's custom stream (``writer``).
+        """
+        tool_name = tool_call["name"]
+        tool_args = tool_call["args"]
+        started = _emit_tool_started(writer, tool_call)
+        failed = True
+
+        try:
+            if tool_name in tools:
+                output = tools[tool_name].invoke(tool_args)
+                failed = False
+            else:
+                output = f"Error: Tool '{tool_name}' not found in available tools"
+        except Exception as e:
+            output = f"Error executing tool '{tool_name}': {str(e)}"
+
+        _emit_tool_finished(writer, tool_call, output, failed, started)
+        return output
+
+    async def arun_tool_call(tool_call: Dict[str, Any], writer: Any = None) -> Any:
+        """
+        Async variant of run_tool_call. Tools without a native coroutine are
+        run in the default executor by LangChain.
+        """
+        tool_name = tool_call["name"]
+        tool_args = tool_call["args"]
+        started = _emit_tool_started(writer, tool_call)
+        failed = True
+
+        try:
+            if tool_name in tools:
+                output = await tools[tool_name].ainvoke(tool_args)
+                failed = False
+            else:
+                output = f"Error: Tool '{tool_name}' not found in available tools"
+        except Exception as e:
+            output = f"Error executing tool '{tool_name}': {str(e)}"
+
+        _emit_tool_finished(writer, tool_call, output, failed, started)
+        return output
+
+    def build_tool_update(
+        tool_calls: List[Dict[str, Any]], tool_outputs: List[Any]
+    ) -> Dict[str, Any]:
+        """
+        Turn tool outputs into the state update returned by the tools node.
+        """
+        tool_results = []
+        tool_messages = []
+
+        for tool_call, tool_output in zip(tool_calls, tool_outputs):
+            tool_results.append({"tool_name": tool_call["name"], "output": tool_output})
+
+            # Create tool message
+            tool_message = ToolMessage(
+                content=serialize_tool_output(tool_output), tool_call_id=tool_call["id"]
+            )
+            tool_messages.append(tool_message)
+
+        # Only return the new messages: the operator.add reducer appends them
+        # to the existing history
+        return {"tool_results": tool_results, "messages": tool_messages}
+
     def call_tools(state: AgentState) -> Dict[str, Any]:
         """
         Execute tools based on the model's tool calls.
+
+        Independent tool calls from the same turn run in parallel (up to
+        max_tool_concurrency); results keep the order of the tool calls.
         """
-        messages = state["messages"]
-        last_message = messages[-1]
+        last_message = state["messages"][-1]
 
-        tool_results = []
+        tool_calls = getattr(last_message, "tool_calls", None) or []
+        writer = get_stream_writer()
 
         # Execute each tool call
-        if hasattr(last_message, "tool_calls"):
-            for tool_call in last_message.tool_calls:
-                tool_name = tool_call["name"]
-                tool_args = tool_call["args"]
-
-                # Execute the tool
-                try:
-                    if tool_name in tools:
-                        tool_output = tools[tool_name].invoke(tool_args)
-                    else:
-                        tool_output = (
-                            f"Error: Tool '{tool_name}' not found in available tools"
-                        )
-                except Exception as e:
-                    tool_output = f"Error executing tool '{tool_name}': {str(e)}"
-
-                tool_results.append({"tool_name": tool_name, "output": tool_output})
-
-                # Create tool message
-                tool_message = ToolMessage(
-                    content=str(tool_output), tool_call_id=tool_call["id"]
+        if max_tool_concurrency > 1 and len(tool_calls) > 1:
+            max_workers = min(max_tool_concurrency, len(tool_calls))
+            with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+                tool_outputs = list(
+                    executor.map(
+                        lambda tool_call: run_tool_call(tool_call, writer), tool_calls
+                    )
                 )
-                messages.append(tool_message)
+        else:
+            tool_outputs = [
+                run_tool_call(tool_call, writer) for tool_call in tool_calls
+            ]
+
+        return build_tool_update(tool_calls, tool_outputs)
+
+    async def acall_tools(state: AgentState) -> Dict[str, Any]:
+        """
+        Async variant of call_tools: tool calls are awaited concurrently,
+        bounded by max_tool_concurrency, and keep the order of the tool calls.
+        """
+        last_message = state["messages"][-1]
+
+        tool_calls = getattr(last_message, "tool_calls", None) or []
+        writer = get_stream_writer()
+        semaphore = asyncio.Semaphore(max(1, max_tool_concurrency))
+
+        async def run_bounded(tool_call: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await arun_tool_call(tool_call, writer)
+
+        tool_outputs = await asyncio.gather(
+            *(run_bounded(tool_call) for tool_call in tool_calls)
+        )
 
-        return {"tool_results": tool_results, "messages": messages}
+        return build_tool_update(tool_calls, list(tool_outputs))
 
     # Build the graph
     workflow = StateGraph(AgentState)
 
-    # Add nodes
-    workflow.add_node("agent", call_model)
-    workflow.add_node("tools", call_tools)
+    # Add nodes (each with a sync and an async implementation, so the graph
+    # supports both invoke and ainvoke)
+    workflow.add_node("agent", RunnableLambda(call_model, afunc=acall_model))
+    workflow.add_node("tools", RunnableLambda(call_tools, afunc=acall_tools))
 
     # Set entry point
     workflow.set_entry_point("agent")
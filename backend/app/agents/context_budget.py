@@ -0,0 +1,206 @@
+"""
+Token budget for the messages sent to the LLM on each agent iteration.
+
+The agent's message history grows with every tool round (a search_internet
+result alone is 1KB+), and the whole history is sent on every call, so long
+investigations run into provider context limits and their cost grows
+quadratically. Before each model call, fit_messages_to_budget() shrinks the
+history to the agent's context_token_budget:
+
+1. Tool outputs of older turns are summarised: long text is cut to an
+   excerpt and long string fields of JSON outputs are shortened, so the
+   structure (status, url, ...) survives.
+2. If that is not enough, older turns are dropped whole, oldest first. A turn
+   is an AI message and the ToolMessages answering its tool calls, so no
+   tool call is left without its result (providers reject those).
+
+The system prompt, the user's claim and the latest turns are always sent
+verbatim. Only the request is trimmed; the graph state keeps the full
+history.
+
+Token counts are estimates (about 4 characters per token); the exact usage
+reported by the provider is recorded per iteration in the metadata.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+CHARS_PER_TOKEN = 4
+# Role markers and separators the providers add around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+TRIMMED_MARKER = "[trimmed to fit the context budget]"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _content_text(content: Any) -> str:
+    """Text of a message content (string or content blocks)."""
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def count_message_tokens(message: Any) -> int:
+    """
+    Estimate the tokens a message takes in the model request.
+
+    Args:
+        message: LangChain message or {"role", "content"} dict
+
+    Returns:
+        Estimated token count, including tool call arguments
+    """
+    if isinstance(message, dict):
+        return MESSAGE_OVERHEAD_TOKENS + estimate_tokens(
+            _content_text(message.get("content", ""))
+        )
+
+    tokens = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(_content_text(message.content))
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        tokens += estimate_tokens(tool_call["name"]) + estimate_tokens(
+            _content_text(tool_call["args"])
+        )
+    return tokens
+
+
+def summarise_tool_output(content: str, max_chars: int) -> str:
+    """
+    Shorten a tool output for an older turn.
+
+    JSON outputs keep their structure with long strings cut to an excerpt;
+    text outputs keep their first ``max_chars`` characters.
+
+    Args:
+        content: ToolMessage content
+        max_chars: Length of the excerpts
+
+    Returns:
+        The summarised content (``content`` itself if it is already short)
+    """
+    if len(content) <= max_chars + len(TRIMMED_MARKER):
+        return content
+
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        payload = None
+
+    if isinstance(payload, (dict, list)):
+
+        def shorten(value: Any) -> Any:
+            if isinstance(value, str) and len(value) > max_chars:
+                return f"{value[:max_chars]}… {TRIMMED_MARKER}"
+            if isinstance(value, dict):
+                return {key: shorten(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [shorten(item) for item in value]
+            return value
+
+        summary = json.dumps(
+            shorten(payload), separators=(",", ":"), ensure_ascii=False
+        )
+        if len(summary) < len(content):
+            return summary
+
+    return f"{content[:max_chars]}… {TRIMMED_MARKER}"
+
+
+def _split_turns(messages: List[Any]) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Split a message list into its fixed head and its turns.
+
+    Returns:
+        Number of leading messages that are always kept (system prompt and
+        the user's input), and the (start, end) range of each turn
+    """
+    head = 0
+    while head < len(messages) and not isinstance(
+        messages[head], (AIMessage, ToolMessage)
+    ):
+        head += 1
+
+    turns = []
+    for position in range(head, len(messages)):
+        if isinstance(messages[position], AIMessage) or not turns:
+            turns.append([position, position + 1])
+        else:
+            turns[-1][1] = position + 1
+    return head, [(start, end) for start, end in turns]
+
+
+def fit_messages_to_budget(
+    messages: List[Any],
+    budget: Optional[int],
+    keep_turns: int = 2,
+    excerpt_chars: int = 300,
+) -> Tuple[List[Any], Dict[str, int]]:
+    """
+    Trim the messages of a model call to a token budget.
+
+    Args:
+        messages: Messages for the LLM (system prompt first, if any)
+        budget: Maximum estimated input tokens (0 or None disables trimming)
+        keep_turns: Number of latest turns sent verbatim
+        excerpt_chars: Length of the excerpts of summarised tool outputs
+
+    Returns:
+        The messages to send, and stats: context_tokens (before trimming),
+        sent_tokens, summarised and dropped (message counts)
+    """
+    token_counts = [count_message_tokens(message) for message in messages]
+    total = sum(token_counts)
+    stats = {
+        "context_tokens": total,
+        "sent_tokens": total,
+        "summarised": 0,
+        "dropped": 0,
+    }
+    if not budget or budget < 0 or total <= budget:
+        return messages, stats
+
+    head, turns = _split_turns(messages)
+    older_turns = turns[: max(0, len(turns) - keep_turns)]
+    trimmed = list(messages)
+    summarised = set()
+
+    # 1. Summarise the tool outputs of older turns, oldest first
+    for start, end in older_turns:
+        for position in range(start, end):
+            if total <= budget:
+                break
+            message = trimmed[position]
+            if not isinstance(message, ToolMessage) or not isinstance(
+                message.content, str
+            ):
+                continue
+            summary = summarise_tool_output(message.content, excerpt_chars)
+            if summary is message.content:
+                continue
+            trimmed[position] = message.model_copy(update={"content": summary})
+            tokens = count_message_tokens(trimmed[position])
+            total -= token_counts[position] - tokens
+            token_counts[position] = tokens
+            summarised.add(position)
+
+    # 2. Drop older turns whole, oldest first
+    dropped_until = head
+    for start, end in older_turns:
+        if total <= budget:
+            break
+        total -= sum(token_counts[start:end])
+        dropped_until = end
+        stats["dropped"] += end - start
+
+    if dropped_until > head:
+        # Kept turns start with an AI message, so the conversation still
+        # alternates user -> assistant after the user's input
+        trimmed = trimmed[:head] + trimmed[dropped_until:]
+
+    stats["sent_tokens"] = total
+    stats["summarised"] = sum(position >= dropped_until for position in summarised)
+    return trimmed, stats
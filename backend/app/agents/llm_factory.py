@@ -0,0 +1,75 @@
+from functools import lru_cache
+from typing import Any
+
+from langchain_aws import ChatBedrock
+
+
+def create_llm(
+    llm_provider: str, model_id: str, temperature: float, max_tokens: int
+) -> Any:
+    """
+    Create a chat model client for the given provider.
+
+    Args:
+        llm_provider: "anthropic", "openai" or "bedrock"
+        model_id: Provider model identifier
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in the response
+
+    Returns:
+        LangChain chat model
+
+    Raises:
+        ValueError: If the provider is not supported
+    """
+    if llm_provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model=model_id,
+            temperature=float(temperature),  # Ensure float for JSON serialization
+            max_tokens=int(max_tokens),
+        )
+    elif llm_provider == "openai":
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(
+            model=model_id,
+            temperature=float(temperature),  # Ensure float for JSON serialization
+            max_tokens=int(max_tokens),
+        )
+    elif llm_provider == "bedrock":
+        return ChatBedrock(
+            model_id=model_id,
+            model_kwargs={
+                "temperature": float(
+                    temperature
+                ),  # Ensure float for JSON serialization
+                "max_tokens": int(max_tokens),
+            },
+        )
+    else:
+        raise ValueError(f"Unsupported LLM provider: {llm_provider}")
+
+
+@lru_cache(maxsize=16)
+def get_shared_llm(
+    llm_provider: str, model_id: str, temperature: float, max_tokens: int
+) -> Any:
+    """
+    Get a process-wide chat model client, created on first use.
+
+    LangChain chat models are stateless between calls, so tools that call an
+    LLM (e.g. summary_long_text) share one client and its HTTP connection
+    pool instead of building a new client per call.
+
+    Args:
+        llm_provider: "anthropic", "openai" or "bedrock"
+        model_id: Provider model identifier
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in the response
+
+    Returns:
+        LangChain chat model
+    """
+    return create_llm(llm_provider, model_id, temperature, max_tokens)
@@ -0,0 +1,468 @@
+"""
+Exact-match cache of agent verdicts.
+
+Viral claims reach the agent thousands of times with the same (or trivially
+different) text. The verdict of a successful investigation is cached under the
+normalised claim, the config_id and the agent version (config + prompt hash,
+see agent_cache.compute_agent_version), so a repeated claim is answered
+without running the LLM until the entry expires or the agent changes.
+
+Caching is opt-in (VERDICT_CACHE_ENABLED=true). Entries live in an in-memory
+LRU with a TTL and, when VERDICT_CACHE_TABLE is set, in DynamoDB so they are
+shared across workers and cold starts. An entry holds the verdict and a small
+summary of the execution (config hash, iteration/tool counts, token totals);
+the tool results stay in the execution history it points to.
+
+Rewordings of a claim miss the exact key, so cached claims are also indexed
+in a MinHash/LSH near-duplicate index (utils/minhash_index.py, one per config
+version). Verdicts are only reused for exact matches: a claim at least
+NEAR_DUPLICATE_SEED_THRESHOLD similar to a cached one runs the agent with the
+earlier verdict attached as context (seed_agent_input), since small edits
+such as a negation or a changed number flip the verdict while barely moving
+the similarity ("is safe" / "is not safe" score about 0.9). A claim leaves the
+index when its verdict is evicted or expires from the in-memory cache, or
+when a query finds its verdict gone; a full index (NEAR_DUPLICATE_MAX_ENTRIES)
+drops its oldest claim. With NEAR_DUPLICATE_INDEX_DIR set, the indexes are
+snapshotted to disk and reloaded after a cold start.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import unicodedata
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ..entity.AgentConfig import AgentConfig
+from ..utils.minhash_index import MinHashLSHIndex
+from ..utils.ttl_cache import TTLCache
+from .agent_cache import compute_agent_version, compute_config_hash
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# Leading/trailing quotes, punctuation and whitespace don't change a claim
+_EDGE_CHARACTERS = " \t\n\"'`“”‘’.,!?;:…"
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+
+_verdict_cache: Optional[TTLCache] = None
+
+# Execution metadata kept with a cached verdict
+_SUMMARY_METADATA = (
+    "iterations",
+    "tool_calls",
+    "total_messages",
+    "input_tokens",
+    "output_tokens",
+)
+
+# Near-duplicate index per "<config_id>:<agent version>" scope, and the number
+# of claims added to or removed from each since its last snapshot
+_near_duplicate_indexes: Dict[str, MinHashLSHIndex] = {}
+_unsaved_changes: Dict[str, int] = {}
+_index_lock = threading.Lock()
+
+
+def is_verdict_cache_enabled() -> bool:
+    """Verdict caching is off unless VERDICT_CACHE_ENABLED is "true"."""
+    return os.getenv("VERDICT_CACHE_ENABLED", "false").lower() == "true"
+
+
+def get_verdict_cache_ttl_seconds() -> float:
+    """Lifetime of a cached verdict (VERDICT_CACHE_TTL_SECONDS, default 3600)."""
+    return float(os.getenv("VERDICT_CACHE_TTL_SECONDS", "3600"))
+
+
+def get_verdict_cache() -> TTLCache:
+    """
+    Get the in-memory verdict cache.
+
+    Configured by VERDICT_CACHE_MAX_SIZE (default 4096) and
+    VERDICT_CACHE_TTL_SECONDS (default 3600; 0 disables expiry).
+    """
+    global _verdict_cache
+    if _verdict_cache is None:
+        _verdict_cache = TTLCache(
+            max_size=int(os.getenv("VERDICT_CACHE_MAX_SIZE", "4096")),
+            ttl_seconds=get_verdict_cache_ttl_seconds(),
+            on_evict=_forget_near_duplicate,
+        )
+    return _verdict_cache
+
+
+def get_verdict_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters for the in-memory verdict cache."""
+    return get_verdict_cache().stats()
+
+
+def normalize_claim(text: str) -> str:
+    """
+    Normalise a claim for exact matching.
+
+    Applies Unicode NFKC, case folding, whitespace collapsing and strips
+    surrounding quotes/punctuation, so "Bleach cures COVID!" and
+    "  bleach cures covid " share a cache entry.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _WHITESPACE.sub(" ", text)
+    return text.strip(_EDGE_CHARACTERS)
+
+
+def compute_verdict_scope(agent_config: AgentConfig) -> str:
+    """Scope of cached verdicts: "<config_id>:<agent version>"."""
+    return f"{agent_config.config_id}:{compute_agent_version(agent_config)}"
+
+
+def compute_verdict_cache_key(agent_config: AgentConfig, user_input: str) -> str:
+    """Cache key: config_id, agent version and hash of the normalised claim."""
+    return _cache_key(compute_verdict_scope(agent_config), normalize_claim(user_input))
+
+
+def _cache_key(scope: str, claim: str) -> str:
+    return f"{scope}:{hashlib.sha256(claim.encode('utf-8')).hexdigest()}"
+
+
+def lookup_verdict(
+    agent_config: AgentConfig, user_input: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Find the cached verdict of the same (normalised) claim.
+
+    Near-duplicates are never reused: a reworded claim misses here and is
+    handed to seed_agent_input instead.
+
+    Args:
+        agent_config: The agent configuration
+        user_input: The user's input/query
+
+    Returns:
+        Execution result shaped like invoke_agent's (result, metadata), with
+        metadata["cache_hit"] = True and metadata["cached_execution_id"], or
+        None on a miss (or when caching is disabled)
+    """
+    if not is_verdict_cache_enabled():
+        return None
+
+    entry = _get_verdict_entry(compute_verdict_cache_key(agent_config, user_input))
+    if entry is None:
+        return None
+
+    metadata = {
+        **entry["metadata"],
+        "cache_hit": True,
+        "cached_execution_id": entry["execution_id"],
+        "cached_at": entry["cached_at"],
+    }
+    return {"result": entry["result"], "metadata": metadata}
+
+
+def seed_agent_input(
+    agent_config: AgentConfig, user_input: str
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Attach the verdict of a similar, already verified claim to the agent input.
+
+    Called on a cache miss. Claims at least NEAR_DUPLICATE_SEED_THRESHOLD
+    similar to a cached claim are likely rewordings, so the agent gets the
+    earlier verdict as a starting point but still decides whether it applies.
+
+    Args:
+        agent_config: The agent configuration
+        user_input: The user's input/query
+
+    Returns:
+        (input to run the agent with, {"execution_id", "similarity"} of the
+        seeding verdict or None if no similar claim was found)
+    """
+    if not is_verdict_cache_enabled():
+        return user_input, None
+
+    match = _find_near_duplicate(
+        compute_verdict_scope(agent_config),
+        user_input,
+        get_near_duplicate_seed_threshold(),
+    )
+    if match is None:
+        return user_input, None
+
+    entry, similarity = match
+    seeded_input = (
+        f"{user_input}\n\n"
+        f"A similar claim (similarity {similarity:.2f}) was verified earlier:\n"
+        f'"{entry.get("claim", "")}"\n'
+        f"Earlier verdict:\n{entry['result']}\n\n"
+        "Reuse the earlier findings only if they apply to this exact claim; "
+        "small wording changes (e.g. a negation) can change the verdict."
+    )
+    return seeded_input, {
+        "execution_id": entry["execution_id"],
+        "similarity": round(similarity, 3),
+    }
+
+
+def store_verdict(
+    agent_config: AgentConfig,
+    user_input: str,
+    execution_id: str,
+    execution_result: Dict[str, Any],
+) -> bool:
+    """
+    Cache the verdict of a successful execution.
+
+    Executions where a tool failed are not cached, so a transient tool error
+    doesn't pin a degraded verdict for the whole TTL.
+
+    Args:
+        agent_config: The agent configuration
+        user_input: The user's input/query
+        execution_id: Execution that produced the verdict
+        execution_result: Result from invoke_agent
+
+    Returns:
+        True if the verdict was cached
+    """
+    if not is_verdict_cache_enabled():
+        return False
+
+    metadata = execution_result.get("metadata", {})
+    if _has_tool_errors(metadata):
+        return False
+
+    scope = compute_verdict_scope(agent_config)
+    claim = normalize_claim(user_input)
+    cache_key = _cache_key(scope, claim)
+    entry = {
+        "execution_id": execution_id,
+        "claim": claim,
+        "result": execution_result.get("result"),
+        "metadata": {
+            "config_hash": compute_config_hash(agent_config),
+            **{key: metadata[key] for key in _SUMMARY_METADATA if key in metadata},
+        },
+        "cached_at": datetime.utcnow().isoformat(),
+    }
+    get_verdict_cache().set(cache_key, entry)
+    _persist_verdict(cache_key, entry, agent_config.config_id)
+    _index_near_duplicate(scope, cache_key, user_input)
+    return True
+
+
+def invalidate_verdicts(config_id: Optional[str] = None) -> int:
+    """
+    Drop in-memory verdicts (of one config, or all if config_id is None).
+
+    Persisted verdicts and index snapshots are left to expire; a changed
+    config or prompt already yields a new cache key.
+
+    Returns:
+        Number of verdicts removed
+    """
+    with _index_lock:
+        for scope in list(_near_duplicate_indexes):
+            if config_id is None or scope.split(":", 1)[0] == config_id:
+                del _near_duplicate_indexes[scope]
+                _unsaved_changes.pop(scope, None)
+
+    cache = get_verdict_cache()
+    if config_id is None:
+        removed = len(cache)
+        cache.clear()
+        return removed
+    return cache.invalidate_where(lambda key: key.split(":", 1)[0] == config_id)
+
+
+def is_near_duplicate_detection_enabled() -> bool:
+    """Near-duplicate matching is on unless NEAR_DUPLICATE_ENABLED is "false"."""
+    return os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() != "false"
+
+
+def get_near_duplicate_seed_threshold() -> float:
+    """
+    Similarity (estimated Jaccard of character shingles) from which a cached
+    claim seeds the agent (NEAR_DUPLICATE_SEED_THRESHOLD, default 0.5).
+    """
+    return float(os.getenv("NEAR_DUPLICATE_SEED_THRESHOLD", "0.5"))
+
+
+def get_near_duplicate_index(agent_config: AgentConfig) -> MinHashLSHIndex:
+    """Get the near-duplicate index of the agent's current version."""
+    return _index_for_scope(compute_verdict_scope(agent_config))
+
+
+def save_near_duplicate_indexes() -> int:
+    """
+    Snapshot indexes with unsaved changes to NEAR_DUPLICATE_INDEX_DIR.
+
+    Snapshots are also written every NEAR_DUPLICATE_SNAPSHOT_EVERY added or
+    removed claims; call this on shutdown to keep the rest.
+
+    Returns:
+        Number of indexes written
+    """
+    with _index_lock:
+        pending = [
+            (scope, _near_duplicate_indexes[scope])
+            for scope, count in _unsaved_changes.items()
+            if count and scope in _near_duplicate_indexes
+        ]
+    return sum(1 for scope, index in pending if _save_index(scope, index))
+
+
+def _near_duplicate_text(user_input: str) -> str:
+    """Claim text that is shingled: normalised, punctuation removed."""
+    text = _PUNCTUATION.sub(" ", normalize_claim(user_input))
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _get_verdict_entry(cache_key: str) -> Optional[Dict[str, Any]]:
+    cache = get_verdict_cache()
+    entry = cache.get(cache_key)
+    if entry is None:
+        entry = _load_persisted_verdict(cache_key)
+        if entry is not None:
+            cache.set(cache_key, entry)
+    return entry
+
+
+def _find_near_duplicate(
+    scope: str, user_input: str, threshold: float
+) -> Optional[Tuple[Dict[str, Any], float]]:
+    """Most similar cached verdict at or above ``threshold`` and its similarity."""
+    if not is_near_duplicate_detection_enabled():
+        return None
+
+    index = _index_for_scope(scope)
+    if not len(index):
+        return None
+
+    for cache_key, similarity in index.query(
+        _near_duplicate_text(user_input), threshold
+    ):
+        entry = _get_verdict_entry(cache_key)
+        if entry is not None:
+            return entry, similarity
+        _remove_near_duplicate(scope, index, cache_key)  # Its verdict expired
+    return None
+
+
+def _index_for_scope(scope: str) -> MinHashLSHIndex:
+    with _index_lock:
+        index = _near_duplicate_indexes.get(scope)
+        if index is None:
+            # A config has one live version: drop indexes of older versions
+            config_prefix = scope.split(":", 1)[0] + ":"
+            for old_scope in list(_near_duplicate_indexes):
+                if old_scope.startswith(config_prefix):
+                    del _near_duplicate_indexes[old_scope]
+                    _unsaved_changes.pop(old_scope, None)
+
+            index = _load_index(scope)
+            _near_duplicate_indexes[scope] = index
+        return index
+
+
+def _index_near_duplicate(scope: str, cache_key: str, user_input: str) -> None:
+    if not is_near_duplicate_detection_enabled():
+        return
+
+    index = _index_for_scope(scope)
+    max_entries = int(os.getenv("NEAR_DUPLICATE_MAX_ENTRIES", "20000"))
+    while len(index) >= max_entries:
+        oldest_key = index.oldest_key()
+        if oldest_key is None:
+            break
+        _remove_near_duplicate(scope, index, oldest_key)
+    if index.add(cache_key, _near_duplicate_text(user_input)):
+        _record_index_change(scope, index)
+
+
+def _remove_near_duplicate(scope: str, index: MinHashLSHIndex, cache_key: str) -> None:
+    if index.remove(cache_key):
+        _record_index_change(scope, index)
+
+
+def _forget_near_duplicate(cache_key: str, entry: Dict[str, Any]) -> None:
+    """Verdict cache eviction callback: unindex the claim whose verdict left."""
+    scope = cache_key.rsplit(":", 1)[0]
+    with _index_lock:
+        index = _near_duplicate_indexes.get(scope)
+    if index is not None:
+        _remove_near_duplicate(scope, index, cache_key)
+
+
+def _record_index_change(scope: str, index: MinHashLSHIndex) -> None:
+    """Count a change to the index, snapshotting it every few changes."""
+    with _index_lock:
+        _unsaved_changes[scope] = _unsaved_changes.get(scope, 0) + 1
+        due = _unsaved_changes[scope] >= int(
+            os.getenv("NEAR_DUPLICATE_SNAPSHOT_EVERY", "50")
+        )
+    if due:
+        _save_index(scope, index)
+
+
+def _snapshot_path(scope: str) -> Optional[str]:
+    directory = os.getenv("NEAR_DUPLICATE_INDEX_DIR", "")
+    if not directory:
+        return None
+    return os.path.join(directory, re.sub(r"[^\w.-]", "_", scope) + ".npz")
+
+
+def _load_index(scope: str) -> MinHashLSHIndex:
+    path = _snapshot_path(scope)
+    try:
+        return MinHashLSHIndex.load_or_create(path)
+    except Exception as e:
+        # A corrupt snapshot only costs the previously indexed claims
+        logger.warning(f"Failed to load near-duplicate index {path}: {str(e)}")
+        return MinHashLSHIndex()
+
+
+def _save_index(scope: str, index: MinHashLSHIndex) -> bool:
+    path = _snapshot_path(scope)
+    if not path:
+        return False
+    try:
+        with _index_lock:
+            _unsaved_changes[scope] = 0
+        index.save(path)
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to save near-duplicate index {path}: {str(e)}")
+        return False
+
+
+def _has_tool_errors(metadata: Dict[str, Any]) -> bool:
+    return any(
+        str(tool_result.get("output", "")).startswith("Error")
+        for tool_result in metadata.get("tool_results", [])
+    )
+
+
+def _load_persisted_verdict(cache_key: str) -> Optional[Dict[str, Any]]:
+    from ..db_commands.verdict_commands import (get_verdicts_table_name,
+                                                load_verdict)
+
+    if not get_verdicts_table_name():
+        return None
+    try:
+        return load_verdict(cache_key)
+    except Exception as e:
+        # The persistent tier is an optimisation; fall back to the agent
+        logger.warning(str(e))
+        return None
+
+
+def _persist_verdict(cache_key: str, entry: Dict[str, Any], config_id: str) -> None:
+    from ..db_commands.verdict_commands import (get_verdicts_table_name,
+                                                save_verdict)
+
+    if not get_verdicts_table_name():
+        return
+    try:
+        ttl_seconds = int(get_verdict_cache_ttl_seconds())
+        save_verdict(cache_key, entry, config_id, ttl_seconds or None)
+    except Exception as e:
+        logger.warning(str(e))
@@ -1,11 +1,31 @@
+import copy
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
-from infra.dynamodb_client import get_dynamodb_resource
+from infra.dynamodb_client import get_dynamodb_table
 
 from ..entity.AgentConfig import (AgentConfig, KnowledgeBaseConfig,
                                   SubAgentConfig)
+from ..utils.ttl_cache import TTLCache
+
+# Marker cached for config_ids that do not exist (negative caching)
+_NOT_FOUND = object()
+
+_config_cache: Optional[TTLCache] = None
+
+# Attributes read by iter_agent_config_summaries
+SUMMARY_ATTRIBUTES = (
+    "config_id",
+    "name",
+    "description",
+    "prompt_id",
+    "llm_provider",
+    "model_id",
+)
 
 
 def get_table_name() -> str:
@@ -13,6 +33,193 @@ def get_table_name() -> str:
     return os.getenv("AGENT_CONFIG_TABLE", "agent-configs")
 
 
+def get_agent_config_cache() -> TTLCache:
+    """
+    Get the read-through cache used by get_agent_config.
+
+    Configured by AGENT_CONFIG_CACHE_MAX_SIZE (default 256) and
+    AGENT_CONFIG_CACHE_TTL_SECONDS (default 60; 0 disables expiry).
+    """
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = TTLCache(
+            max_size=int(os.getenv("AGENT_CONFIG_CACHE_MAX_SIZE", "256")),
+            ttl_seconds=float(os.getenv("AGENT_CONFIG_CACHE_TTL_SECONDS", "60")),
+        )
+    return _config_cache
+
+
+def invalidate_agent_config_cache(config_id: Optional[str] = None) -> None:
+    """
+    Drop cached agent configs so the next read goes to DynamoDB.
+
+    Called automatically by create/update/delete_agent_config.
+
+    Args:
+        config_id: Config to invalidate (all configs if None)
+    """
+    cache = get_agent_config_cache()
+    if config_id is None:
+        cache.clear()
+    else:
+        cache.invalidate_where(lambda key: key[1] == config_id)
+
+
+def get_agent_config_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters for the agent config cache."""
+    return get_agent_config_cache().stats()
+
+
+def knowledge_base_config_to_item(kb: KnowledgeBaseConfig) -> Dict[str, Any]:
+    """Convert a KnowledgeBaseConfig to a DynamoDB item map."""
+    return {
+        "enabled": kb.enabled,
+        "vector_store": kb.vector_store,
+        "index_name": kb.index_name,
+        "embedding_model": kb.embedding_model,
+        "top_k": kb.top_k,
+    }
+
+
+def knowledge_base_config_from_item(item: Dict[str, Any]) -> KnowledgeBaseConfig:
+    """Build a KnowledgeBaseConfig from a DynamoDB item map or JSON dict."""
+    return KnowledgeBaseConfig(
+        enabled=bool(item.get("enabled", KnowledgeBaseConfig.enabled)),
+        vector_store=item.get("vector_store", KnowledgeBaseConfig.vector_store),
+        index_name=item.get("index_name", KnowledgeBaseConfig.index_name),
+        embedding_model=item.get(
+            "embedding_model", KnowledgeBaseConfig.embedding_model
+        ),
+        top_k=int(item.get("top_k", KnowledgeBaseConfig.top_k)),
+    )
+
+
+def sub_agent_config_to_item(sub_agent: SubAgentConfig) -> Dict[str, Any]:
+    """Convert a SubAgentConfig to a DynamoDB item map (floats as Decimal)."""
+    return {
+        "name": sub_agent.name,
+        "description": sub_agent.description,
+        "config_id": sub_agent.config_id,
+        "agent_config_id": sub_agent.agent_config_id,
+        "tools": sub_agent.tools,
+        "prompt_id": sub_agent.prompt_id,
+        "knowledge_base": (
+            knowledge_base_config_to_item(sub_agent.knowledge_base)
+            if sub_agent.knowledge_base
+            else None
+        ),
+        "llm_provider": sub_agent.llm_provider,
+        "model_id": sub_agent.model_id,
+        "temperature": Decimal(str(sub_agent.temperature)),
+        "max_tokens": sub_agent.max_tokens,
+        "max_iterations": sub_agent.max_iterations,
+    }
+
+
+def sub_agent_config_from_item(item: Dict[str, Any]) -> SubAgentConfig:
+    """Build a SubAgentConfig from a DynamoDB item map or JSON dict."""
+    return SubAgentConfig(
+        name=item["name"],
+        description=item["description"],
+        config_id=item["config_id"],
+        agent_config_id=item["agent_config_id"],
+        tools=item.get("tools") or [],
+        prompt_id=item.get("prompt_id", SubAgentConfig.prompt_id),
+        # Empty maps (e.g. "knowledge_base": {}) mean "not set"
+        knowledge_base=(
+            knowledge_base_config_from_item(item["knowledge_base"])
+            if item.get("knowledge_base")
+            else None
+        ),
+        llm_provider=item.get("llm_provider", SubAgentConfig.llm_provider),
+        model_id=item.get("model_id", SubAgentConfig.model_id),
+        temperature=float(item.get("temperature", SubAgentConfig.temperature)),
+        max_tokens=int(item.get("max_tokens", SubAgentConfig.max_tokens)),
+        max_iterations=int(item.get("max_iterations", SubAgentConfig.max_iterations)),
+    )
+
+
+def agent_config_to_item(agent_config: AgentConfig) -> Dict[str, Any]:
+    """
+    Convert an AgentConfig to a DynamoDB item.
+
+    Floats are stored as Decimal (DynamoDB rejects floats); nested configs
+    become maps.
+    """
+    return {
+        "config_id": agent_config.config_id,
+        "name": agent_config.name,
+        "description": agent_config.description,
+        "tools": agent_config.tools,
+        "prompt_id": agent_config.prompt_id,
+        "sub_agents": [
+            sub_agent_config_to_item(sub_agent) for sub_agent in agent_config.sub_agents
+        ],
+        "knowledge_base": (
+            knowledge_base_config_to_item(agent_config.knowledge_base)
+            if agent_config.knowledge_base
+            else None
+        ),
+        "llm_provider": agent_config.llm_provider,
+        "model_id": agent_config.model_id,
+        "temperature": Decimal(str(agent_config.temperature)),
+        "max_tokens": agent_config.max_tokens,
+        "max_iterations": agent_config.max_iterations,
+        "max_tool_concurrency": agent_config.max_tool_concurrency,
+        "summary_llm_provider": agent_config.summary_llm_provider,
+        "summary_model_id": agent_config.summary_model_id,
+        "tool_output_format": agent_config.tool_output_format,
+        "context_token_budget": agent_config.context_token_budget,
+    }
+
+
+def agent_config_from_item(item: Dict[str, Any]) -> AgentConfig:
+    """
+    Build an AgentConfig from a DynamoDB item or JSON dict.
+
+    Missing keys take the AgentConfig defaults. DynamoDB returns every
+    number as Decimal, so numbers are coerced back to their declared types:
+    a config read back from the table compares (and hashes) equal to the
+    one that was saved. The int()/float() calls on Decimal are most of the
+    decode time (~2us per config with two sub-agents); that is the price of
+    a stable config hash, and small next to the DynamoDB read itself.
+    """
+    return AgentConfig(
+        name=item["name"],
+        description=item["description"],
+        config_id=item["config_id"],
+        tools=item.get("tools") or [],
+        prompt_id=item.get("prompt_id", AgentConfig.prompt_id),
+        sub_agents=[
+            sub_agent_config_from_item(sub_agent)
+            for sub_agent in item.get("sub_agents") or []
+        ],
+        knowledge_base=(
+            knowledge_base_config_from_item(item["knowledge_base"])
+            if item.get("knowledge_base")
+            else None
+        ),
+        llm_provider=item.get("llm_provider", AgentConfig.llm_provider),
+        model_id=item.get("model_id", AgentConfig.model_id),
+        temperature=float(item.get("temperature", AgentConfig.temperature)),
+        max_tokens=int(item.get("max_tokens", AgentConfig.max_tokens)),
+        max_iterations=int(item.get("max_iterations", AgentConfig.max_iterations)),
+        max_tool_concurrency=int(
+            item.get("max_tool_concurrency", AgentConfig.max_tool_concurrency)
+        ),
+        summary_llm_provider=item.get(
+            "summary_llm_provider", AgentConfig.summary_llm_provider
+        ),
+        summary_model_id=item.get("summary_model_id", AgentConfig.summary_model_id),
+        tool_output_format=item.get(
+            "tool_output_format", AgentConfig.tool_output_format
+        ),
+        context_token_budget=int(
+            item.get("context_token_budget", AgentConfig.context_token_budget)
+        ),
+    )
+
+
 def create_agent_config(agent_config: AgentConfig) -> None:
     """
     Create a new agent configuration in DynamoDB.
@@ -23,75 +230,23 @@ def create_agent_config(agent_config: AgentConfig) -> None:
     Raises:
         Exception: If creation fails
     """
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(get_table_name())
+    table = get_dynamodb_table(get_table_name())
 
     try:
-        # Convert dataclass to dict (convert floats to Decimal for DynamoDB)
-        item = {
-            "config_id": agent_config.config_id,
-            "name": agent_config.name,
-            "description": agent_config.description,
-            "tools": agent_config.tools,
-            "prompt_id": agent_config.prompt_id,
-            "knowledge_base": (
-                {
-                    "enabled": agent_config.knowledge_base.enabled,
-                    "vector_store": agent_config.knowledge_base.vector_store,
-                    "index_name": agent_config.knowledge_base.index_name,
-                    "embedding_model": agent_config.knowledge_base.embedding_model,
-                    "top_k": agent_config.knowledge_base.top_k,
-                }
-                if agent_config.knowledge_base
-                else None
-            ),
-            "llm_provider": agent_config.llm_provider,
-            "model_id": agent_config.model_id,
-            "temperature": Decimal(
-                str(agent_config.temperature)
-            ),  # Convert float to Decimal
-            "max_tokens": agent_config.max_tokens,
-            "max_iterations": agent_config.max_iterations,
-            "sub_agents": [
-                {
-                    "name": sa.name,
-                    "description": sa.description,
-                    "config_id": sa.config_id,
-                    "agent_config_id": sa.agent_config_id,
-                    "tools": sa.tools,
-                    "prompt_id": sa.prompt_id,
-                    "knowledge_base": (
-                        {
-                            "enabled": sa.knowledge_base.enabled,
-                            "vector_store": sa.knowledge_base.vector_store,
-                            "index_name": sa.knowledge_base.index_name,
-                            "embedding_model": sa.knowledge_base.embedding_model,
-                            "top_k": sa.knowledge_base.top_k,
-                        }
-                        if sa.knowledge_base
-                        else None
-                    ),
-                    "llm_provider": sa.llm_provider,
-                    "model_id": sa.model_id,
-                    "temperature": Decimal(
-                        str(sa.temperature)
-                    ),  # Convert float to Decimal
-                    "max_tokens": sa.max_tokens,
-                    "max_iterations": sa.max_iterations,
-                }
-                for sa in agent_config.sub_agents
-            ],
-        }
-
-        table.put_item(Item=item)
+        table.put_item(Item=agent_config_to_item(agent_config))
     except Exception as e:
         raise Exception(f"Failed to create agent config: {str(e)}")
+    finally:
+        invalidate_agent_config_cache(agent_config.config_id)
 
 
 def get_agent_config(config_id: str) -> Optional[AgentConfig]:
     """
     Retrieve an agent configuration by config_id.
 
+    Reads through a TTL cache (see get_agent_config_cache); missing config_ids
+    are cached too, for AGENT_CONFIG_NEGATIVE_CACHE_TTL_SECONDS (default 10).
+
     Args:
         config_id: The agent configuration ID
 
@@ -101,8 +256,30 @@ def get_agent_config(config_id: str) -> Optional[AgentConfig]:
     Raises:
         Exception: If retrieval fails
     """
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(get_table_name())
+    cache = get_agent_config_cache()
+    cache_key = (get_table_name(), config_id)
+
+    cached = cache.get(cache_key)
+    if cached is _NOT_FOUND:
+        return None
+    if cached is not None:
+        # Callers may modify the returned config; keep the cached copy intact
+        return copy.deepcopy(cached)
+
+    agent_config = _fetch_agent_config(config_id)
+    if agent_config is None:
+        negative_ttl = float(os.getenv("AGENT_CONFIG_NEGATIVE_CACHE_TTL_SECONDS", "10"))
+        if negative_ttl > 0:
+            cache.set(cache_key, _NOT_FOUND, ttl_seconds=negative_ttl)
+        return None
+
+    cache.set(cache_key, agent_config)
+    return copy.deepcopy(agent_config)
+
+
+def _fetch_agent_config(config_id: str) -> Optional[AgentConfig]:
+    """Read an agent configuration from DynamoDB, bypassing the cache."""
+    table = get_dynamodb_table(get_table_name())
 
     try:
         response = table.get_item(Key={"config_id": config_id})
@@ -110,70 +287,7 @@ def get_agent_config(config_id: str) -> Optional[AgentConfig]:
         if "Item" not in response:
             return None
 
-        item = response["Item"]
-
-        # Convert knowledge_base dict to KnowledgeBaseConfig
-        kb = item.get("knowledge_base")
-        knowledge_base = (
-            KnowledgeBaseConfig(
-                enabled=kb.get("enabled", False),
-                vector_store=kb.get("vector_store", "chroma"),
-                index_name=kb.get("index_name", ""),
-                embedding_model=kb.get("embedding_model", "text-embedding-3-small"),
-                top_k=kb.get("top_k", 5),
-            )
-            if kb
-            else None
-        )
-
-        # Convert sub_agents dicts to SubAgentConfig objects
-        sub_agents = [
-            SubAgentConfig(
-                name=sa["name"],
-                description=sa["description"],
-                config_id=sa["config_id"],
-                agent_config_id=sa["agent_config_id"],
-                tools=sa.get("tools", []),
-                prompt_id=sa.get("prompt_id", ""),
-                knowledge_base=(
-                    KnowledgeBaseConfig(
-                        enabled=sa["knowledge_base"].get("enabled", False),
-                        vector_store=sa["knowledge_base"].get("vector_store", "chroma"),
-                        index_name=sa["knowledge_base"].get("index_name", ""),
-                        embedding_model=sa["knowledge_base"].get(
-                            "embedding_model", "text-embedding-3-small"
-                        ),
-                        top_k=sa["knowledge_base"].get("top_k", 5),
-                    )
-                    if sa.get("knowledge_base")
-                    else None
-                ),
-                llm_provider=sa.get("llm_provider", "anthropic"),
-                model_id=sa.get("model_id", "claude-3-5-sonnet-20241022"),
-                temperature=float(
-                    sa.get("temperature", 0.7)
-                ),  # Convert Decimal to float
-                max_tokens=sa.get("max_tokens", 4096),
-                max_iterations=sa.get("max_iterations", 10),
-            )
-            for sa in item.get("sub_agents", [])
-        ]
-
-        # Convert to AgentConfig dataclass
-        return AgentConfig(
-            name=item["name"],
-            description=item["description"],
-            config_id=item["config_id"],
-            tools=item.get("tools", []),
-            prompt_id=item.get("prompt_id", ""),
-            sub_agents=sub_agents,
-            knowledge_base=knowledge_base,
-            llm_provider=item.get("llm_provider", "anthropic"),
-            model_id=item.get("model_id", "claude-3-5-sonnet-20241022"),
-            temperature=float(item.get("temperature", 0.7)),  # Convert Decimal to float
-            max_tokens=item.get("max_tokens", 4096),
-            max_iterations=item.get("max_iterations", 10),
-        )
+        return agent_config_from_item(response["Item"])
     except Exception as e:
         raise Exception(f"Failed to get agent config: {str(e)}")
 
@@ -203,101 +317,198 @@ def delete_agent_config(config_id: str) -> None:
     Raises:
         Exception: If deletion fails
     """
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(get_table_name())
+    table = get_dynamodb_table(get_table_name())
 
     try:
         table.delete_item(Key={"config_id": config_id})
     except Exception as e:
         raise Exception(f"Failed to delete agent config: {str(e)}")
+    finally:
+        invalidate_agent_config_cache(config_id)
 
 
-def list_agent_configs() -> List[AgentConfig]:
+def scan_agent_config_pages(
+    page_size: Optional[int] = None,
+    segments: int = 1,
+    attributes: Optional[Sequence[str]] = None,
+) -> Iterator[List[Dict[str, Any]]]:
     """
-    List all agent configurations.
+    Scan the agent config table page by page.
 
-    Returns:
-        List of AgentConfig objects
+    Follows LastEvaluatedKey until the whole table has been read. With
+    segments > 1 the table is read as a parallel scan (Segment/TotalSegments),
+    one thread per segment; pages are yielded as they arrive, in no
+    particular order, and at most ``segments`` pages are buffered. Closing the
+    generator early stops the scan.
+
+    Args:
+        page_size: Maximum items per Scan call (DynamoDB also caps pages at 1MB)
+        segments: Number of parallel scan segments
+        attributes: Attributes to fetch (ProjectionExpression); all if None
+
+    Yields:
+        Lists of raw DynamoDB items
 
     Raises:
-        Exception: If listing fails
+        Exception: If a scan fails
     """
-    dynamodb = get_dynamodb_resource()
-    table = dynamodb.Table(get_table_name())
+    table = get_dynamodb_table(get_table_name())
 
-    try:
-        response = table.scan()
-        items = response.get("Items", [])
+    scan_kwargs: Dict[str, Any] = {}
+    if page_size:
+        scan_kwargs["Limit"] = page_size
+    if attributes:
+        # Placeholders, since attribute names like "name" are reserved words
+        names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+        scan_kwargs["ProjectionExpression"] = ", ".join(names)
+        scan_kwargs["ExpressionAttributeNames"] = names
 
-        configs = []
-        for item in items:
-            # Convert knowledge_base dict to KnowledgeBaseConfig
-            kb = item.get("knowledge_base")
-            knowledge_base = (
-                KnowledgeBaseConfig(
-                    enabled=kb.get("enabled", False),
-                    vector_store=kb.get("vector_store", "chroma"),
-                    index_name=kb.get("index_name", ""),
-                    embedding_model=kb.get("embedding_model", "text-embedding-3-small"),
-                    top_k=kb.get("top_k", 5),
-                )
-                if kb
-                else None
-            )
-
-            sub_agents = [
-                SubAgentConfig(
-                    name=sa["name"],
-                    description=sa["description"],
-                    config_id=sa["config_id"],
-                    agent_config_id=sa["agent_config_id"],
-                    tools=sa.get("tools", []),
-                    prompt_id=sa.get("prompt_id", ""),
-                    knowledge_base=(
-                        KnowledgeBaseConfig(
-                            enabled=sa["knowledge_base"].get("enabled", False),
-                            vector_store=sa["knowledge_base"].get(
-                                "vector_store", "chroma"
-                            ),
-                            index_name=sa["knowledge_base"].get("index_name", ""),
-                            embedding_model=sa["knowledge_base"].get(
-                                "embedding_model", "text-embedding-3-small"
-                            ),
-                            top_k=sa["knowledge_base"].get("top_k", 5),
-                        )
-                        if sa.get("knowledge_base")
-                        else None
-                    ),
-                    llm_provider=sa.get("llm_provider", "anthropic"),
-                    model_id=sa.get("model_id", "claude-3-5-sonnet-20241022"),
-                    temperature=float(
-                        sa.get("temperature", 0.7)
-                    ),  # Convert Decimal to float
-                    max_tokens=sa.get("max_tokens", 4096),
-                    max_iterations=sa.get("max_iterations", 10),
-                )
-                for sa in item.get("sub_agents", [])
-            ]
-
-            configs.append(
-                AgentConfig(
-                    name=item["name"],
-                    description=item["description"],
-                    config_id=item["config_id"],
-                    tools=item.get("tools", []),
-                    prompt_id=item.get("prompt_id", ""),
-                    sub_agents=sub_agents,
-                    knowledge_base=knowledge_base,
-                    llm_provider=item.get("llm_provider", "anthropic"),
-                    model_id=item.get("model_id", "claude-3-5-sonnet-20241022"),
-                    temperature=float(
-                        item.get("temperature", 0.7)
-                    ),  # Convert Decimal to float
-                    max_tokens=item.get("max_tokens", 4096),
-                    max_iterations=item.get("max_iterations", 10),
-                )
-            )
-
-        return configs
+    try:
+        if segments > 1:
+            yield from _parallel_scan(table, scan_kwargs, segments)
+        else:
+            yield from _scan_segment(table, scan_kwargs)
     except Exception as e:
         raise Exception(f"Failed to list agent configs: {str(e)}")
+
+
+def _scan_segment(
+    table: Any,
+    scan_kwargs: Dict[str, Any],
+    segment: Optional[int] = None,
+    total_segments: Optional[int] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the non-empty pages of a (segment of a) table scan."""
+    kwargs = dict(scan_kwargs)
+    if total_segments:
+        kwargs.update(Segment=segment, TotalSegments=total_segments)
+
+    while True:
+        response = table.scan(**kwargs)
+        if response.get("Items"):
+            yield response["Items"]
+        if "LastEvaluatedKey" not in response:
+            return
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _parallel_scan(
+    table: Any, scan_kwargs: Dict[str, Any], segments: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the pages of a parallel scan, one worker thread per segment."""
+    pages: "queue.Queue[Any]" = queue.Queue(maxsize=segments)
+    stop = threading.Event()
+    segment_done = object()
+
+    def put(page: Any) -> bool:
+        # Bounded put that gives up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan(segment: int) -> None:
+        try:
+            for page in _scan_segment(table, scan_kwargs, segment, segments):
+                if not put(page):
+                    return
+            put(segment_done)
+        except Exception as e:
+            put(e)
+
+    executor = ThreadPoolExecutor(max_workers=segments)
+    try:
+        for segment in range(segments):
+            executor.submit(scan, segment)
+
+        remaining = segments
+        while remaining:
+            page = pages.get()
+            if page is segment_done:
+                remaining -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                yield page
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+
+
+def iter_agent_configs(
+    page_size: Optional[int] = None, segments: int = 1
+) -> Iterator[AgentConfig]:
+    """
+    Stream all agent configurations, one page in memory at a time.
+
+    Args:
+        page_size: Maximum items per Scan call
+        segments: Number of parallel scan segments (see scan_agent_config_pages)
+
+    Yields:
+        AgentConfig objects
+
+    Raises:
+        Exception: If listing fails
+    """
+    for items in scan_agent_config_pages(page_size=page_size, segments=segments):
+        for item in items:
+            try:
+                agent_config = agent_config_from_item(item)
+            except Exception as e:
+                raise Exception(f"Failed to list agent configs: {str(e)}")
+
+            yield agent_config
+
+
+def iter_agent_config_summaries(
+    page_size: Optional[int] = None,
+    segments: int = 1,
+    attributes: Sequence[str] = SUMMARY_ATTRIBUTES,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream summary attributes of all agent configurations.
+
+    Only ``attributes`` are read from DynamoDB (a projection), so listing
+    configs doesn't transfer their prompts, tools and sub-agents.
+
+    Args:
+        page_size: Maximum items per Scan call
+        segments: Number of parallel scan segments (see scan_agent_config_pages)
+        attributes: Attributes to fetch (default SUMMARY_ATTRIBUTES)
+
+    Yields:
+        Dictionaries with the requested attributes
+
+    Raises:
+        Exception: If listing fails
+    """
+    for items in scan_agent_config_pages(
+        page_size=page_size, segments=segments, attributes=attributes
+    ):
+        yield from items
+
+
+def list_agent_configs(segments: Optional[int] = None) -> List[AgentConfig]:
+    """
+    List all agent configurations.
+
+    Reads every page of the table. Prefer iter_agent_configs (or
+    iter_agent_config_summaries) for large tables.
+
+    Args:
+        segments: Number of parallel scan segments (default
+            AGENT_CONFIG_SCAN_SEGMENTS, then 1)
+
+    Returns:
+        List of AgentConfig objects
+
+    Raises:
+        Exception: If listing fails
+    """
+    if segments is None:
+        segments = int(os.getenv("AGENT_CONFIG_SCAN_SEGMENTS", "1"))
+    return list(iter_agent_configs(segments=segments))
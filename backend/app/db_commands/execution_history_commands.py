@@ -1,27 +1,98 @@
+import base64
+import binascii
+import json
+import logging
 import os
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from infra.dynamodb_client import get_dynamodb_resource
+from infra.dynamodb_client import get_dynamodb_table
+from infra.transcript_store import (compress_transcript, decompress_transcript,
+                                    get_transcript_compression,
+                                    get_transcript_store)
+
+logger = logging.getLogger(__name__)
+
+# Metadata fields kept only in the transcript when a transcript store is set
+TRANSCRIPT_ONLY_FIELDS = ("tool_results", "token_usage")
+
+# Values convert_decimals_to_float never needs to look into
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Global secondary index: config_id (hash) + timestamp (range)
+EXECUTION_CONFIG_INDEX = "config_id-index"
+
+# Attributes read by query_execution_history when listing summaries
+EXECUTION_SUMMARY_ATTRIBUTES = (
+    "execution_id",
+    "config_id",
+    "timestamp",
+    "user_input",
+    "result",
+)
 
 
 def convert_decimals_to_float(obj: Any) -> Any:
     """
     Recursively convert Decimal objects to float for JSON serialization.
 
+    Only containers holding a Decimal are rebuilt; the others (and all other
+    values) are returned as is, so the result may share lists and dicts with
+    obj.
+
     Args:
         obj: Object that may contain Decimal values
 
     Returns:
         Object with all Decimals converted to floats
     """
-    if isinstance(obj, Decimal):
+    cls = obj.__class__
+    if cls is Decimal:
         return float(obj)
-    elif isinstance(obj, dict):
+    if cls is dict:
+        converted = None
+        for key, value in obj.items():
+            if value.__class__ not in _PLAIN_TYPES:
+                new_value = convert_decimals_to_float(value)
+                if new_value is not value:
+                    if converted is None:
+                        converted = dict(obj)
+                    converted[key] = new_value
+        return obj if converted is None else converted
+    if cls is list:
+        converted = None
+        for i, value in enumerate(obj):
+            if value.__class__ not in _PLAIN_TYPES:
+                new_value = convert_decimals_to_float(value)
+                if new_value is not value:
+                    if converted is None:
+                        converted = list(obj)
+                    converted[i] = new_value
+        return obj if converted is None else converted
+    if isinstance(obj, dict):
         return {key: convert_decimals_to_float(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
+    if isinstance(obj, list):
         return [convert_decimals_to_float(item) for item in obj]
+    return obj
+
+
+def convert_floats_to_decimal(obj: Any) -> Any:
+    """
+    Recursively convert floats to Decimal, which DynamoDB requires for numbers.
+
+    Args:
+        obj: Object that may contain float values
+
+    Returns:
+        Object with all floats converted to Decimals
+    """
+    if isinstance(obj, float):
+        return Decimal(str(obj))
+    elif isinstance(obj, dict):
+        return {key: convert_floats_to_decimal(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_floats_to_decimal(item) for item in obj]
     else:
         return obj
 
@@ -54,42 +125,204 @@ def save_execution_history(
     Raises:
         Exception: If DynamoDB write fails
     """
-    dynamodb = get_dynamodb_resource()
-    table_name = table_name or get_execution_table_name()
-    table = dynamodb.Table(table_name)
-
-    # Create execution item
-    timestamp = datetime.utcnow().isoformat()
+    table = get_dynamodb_table(table_name or get_execution_table_name())
 
     try:
-        # Convert any Decimal values to float for proper serialization
-        metadata = convert_decimals_to_float(result.get("metadata", {}))
-        result_content = convert_decimals_to_float(result.get("result"))
-
         table.put_item(
-            Item={
-                "execution_id": execution_id,
-                "config_id": config_id,
-                "user_input": user_input,
-                "result": result_content,
-                "metadata": metadata,
-                "timestamp": timestamp,
-            }
+            Item=_build_execution_item(config_id, execution_id, user_input, result)
         )
         return execution_id
     except Exception as e:
         raise Exception(f"Failed to save execution history to DynamoDB: {str(e)}")
 
 
+def save_execution_histories(
+    records: List[Dict[str, Any]], table_name: str = None
+) -> List[str]:
+    """
+    Save many agent executions to DynamoDB using batched writes.
+
+    Items are sent through the table's batch_writer, which groups them into
+    BatchWriteItem calls of up to 25 items and resends unprocessed items.
+
+    Args:
+        records: Dicts with config_id, execution_id, user_input and result
+            (the execution result from invoke_agent)
+        table_name: DynamoDB table name (optional, uses env var if not provided)
+
+    Returns:
+        execution_ids that were saved, in input order
+
+    Raises:
+        Exception: If DynamoDB write fails
+    """
+    if not records:
+        return []
+
+    table = get_dynamodb_table(table_name or get_execution_table_name())
+
+    try:
+        with table.batch_writer() as batch:
+            for record in records:
+                batch.put_item(
+                    Item=_build_execution_item(
+                        config_id=record["config_id"],
+                        execution_id=record["execution_id"],
+                        user_input=record["user_input"],
+                        result=record["result"],
+                    )
+                )
+        return [record["execution_id"] for record in records]
+    except Exception as e:
+        raise Exception(f"Failed to batch save execution history to DynamoDB: {str(e)}")
+
+
+def _build_execution_item(
+    config_id: str, execution_id: str, user_input: str, result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the DynamoDB item for one execution.
+
+    With a transcript store configured, the full transcript is written there
+    and the item keeps a pointer plus the summary metadata (tool names, counts,
+    token totals) instead of the tool results.
+    """
+    metadata = dict(result.get("metadata", {}))
+    transcript = None
+
+    store = get_transcript_store()
+    if store is not None:
+        try:
+            transcript = _write_transcript(
+                store, config_id, execution_id, user_input, result
+            )
+        except Exception as e:
+            # The execution is still saved, with its transcript inline
+            logger.warning(
+                f"Failed to write transcript of execution {execution_id}: {str(e)}"
+            )
+
+    if transcript is not None:
+        metadata["tool_names"] = [
+            tool_result["tool_name"] for tool_result in metadata.get("tool_results", [])
+        ]
+        for field in TRANSCRIPT_ONLY_FIELDS:
+            metadata.pop(field, None)
+
+    item = {
+        "execution_id": execution_id,
+        "config_id": config_id,
+        "user_input": user_input,
+        # DynamoDB rejects floats (e.g. similarity scores in the metadata)
+        "result": convert_floats_to_decimal(result.get("result")),
+        "metadata": convert_floats_to_decimal(metadata),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+    if transcript is not None:
+        item["transcript"] = transcript
+    return item
+
+
+def _write_transcript(
+    store: Any,
+    config_id: str,
+    execution_id: str,
+    user_input: str,
+    result: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Serialise, compress and store the transcript of one execution.
+
+    Returns:
+        The pointer saved in the DynamoDB item (backend, key, compression
+        and sizes)
+    """
+    from langchain_core.messages import messages_to_dict
+
+    transcript = {
+        "execution_id": execution_id,
+        "config_id": config_id,
+        "user_input": user_input,
+        "result": result.get("result"),
+        "metadata": result.get("metadata", {}),
+    }
+    full_state = result.get("full_state") or {}
+    if full_state.get("messages"):
+        transcript["messages"] = messages_to_dict(full_state["messages"])
+
+    data = json.dumps(
+        transcript, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+    codec = get_transcript_compression()
+    compressed = compress_transcript(data, codec)
+
+    key = f"{config_id}/{execution_id}.json.{'zst' if codec == 'zstd' else 'gz'}"
+    store.put(key, compressed)
+
+    return {
+        "backend": store.backend,
+        "key": key,
+        "compression": codec,
+        "size_bytes": len(compressed),
+        "raw_bytes": len(data),
+    }
+
+
+def load_execution_transcript(execution: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Load the full transcript of an execution history item.
+
+    Items saved without a transcript store already hold everything inline;
+    their result and metadata are returned as the transcript.
+
+    Args:
+        execution: Item returned by load_execution_history,
+            list_execution_history or query_execution_history
+
+    Returns:
+        Transcript dictionary: execution_id, config_id, user_input, result,
+        metadata (with tool_results and token_usage) and, for executions that
+        ran the agent (invoked or streamed), messages (LangChain message
+        dicts, see messages_from_dict)
+
+    Raises:
+        Exception: If the transcript can't be read
+    """
+    pointer = execution.get("transcript")
+    if not pointer:
+        return {
+            key: execution.get(key)
+            for key in ("execution_id", "config_id", "user_input", "result", "metadata")
+        }
+
+    store = get_transcript_store()
+    if store is None or store.backend != pointer["backend"]:
+        raise Exception(
+            f"Transcript store '{pointer['backend']}' is not configured "
+            "(see TRANSCRIPT_STORE)"
+        )
+
+    try:
+        data = decompress_transcript(store.get(pointer["key"]), pointer["compression"])
+        return json.loads(data)
+    except Exception as e:
+        raise Exception(f"Failed to load execution transcript: {str(e)}")
+
+
 def load_execution_history(
-    execution_id: str, table_name: str = None
+    execution_id: str, table_name: str = None, include_transcript: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Load a specific execution history from DynamoDB.
 
+    Transcripts offloaded to the transcript store are only fetched when
+    include_transcript is set (or later via load_execution_transcript).
+
     Args:
         execution_id: Unique execution ID
         table_name: DynamoDB table name (optional, uses env var if not provided)
+        include_transcript: Restore the full metadata (tool results, token
+            usage) and the messages from the transcript store
 
     Returns:
         Execution history as dictionary, or None if not found
@@ -97,9 +330,7 @@ def load_execution_history(
     Raises:
         Exception: If DynamoDB retrieval fails
     """
-    dynamodb = get_dynamodb_resource()
-    table_name = table_name or get_execution_table_name()
-    table = dynamodb.Table(table_name)
+    table = get_dynamodb_table(table_name or get_execution_table_name())
 
     try:
         response = table.get_item(Key={"execution_id": execution_id})
@@ -107,69 +338,174 @@ def load_execution_history(
         if "Item" not in response:
             return None
 
-        return response["Item"]
+        execution = response["Item"]
     except Exception as e:
         raise Exception(f"Failed to load execution history from DynamoDB: {str(e)}")
 
+    if include_transcript and execution.get("transcript"):
+        transcript = load_execution_transcript(execution)
+        execution["metadata"] = transcript.get("metadata", {})
+        execution["messages"] = transcript.get("messages", [])
 
-def list_execution_history(
-    config_id: str, table_name: str = None, max_results: int = 100
-) -> List[Dict[str, Any]]:
+    return execution
+
+
+def _encode_page_token(last_evaluated_key: Dict[str, Any]) -> str:
+    """Encode a LastEvaluatedKey as an opaque, URL-safe page token."""
+    data = json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def _decode_page_token(page_token: str, config_id: str) -> Dict[str, Any]:
+    """
+    Decode a page token back into an ExclusiveStartKey.
+
+    Raises:
+        ValueError: If the token is malformed or belongs to another config
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(page_token.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Invalid page token")
+    if not isinstance(key, dict) or key.get("config_id") != config_id:
+        raise ValueError("Invalid page token")
+    return key
+
+
+def _format_timestamp(value: Union[str, datetime]) -> str:
+    """Timestamps are stored as ISO 8601 strings (UTC), which sort correctly."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def query_execution_history(
+    config_id: str,
+    limit: int = 50,
+    page_token: Optional[str] = None,
+    start_time: Optional[Union[str, datetime]] = None,
+    end_time: Optional[Union[str, datetime]] = None,
+    attributes: Optional[Sequence[str]] = None,
+    newest_first: bool = True,
+    table_name: str = None,
+) -> Dict[str, Any]:
     """
-    List execution history for a specific agent config.
+    Get one page of execution history for an agent config.
+
+    Queries the config_id-index GSI, so DynamoDB orders the executions by
+    timestamp and applies the time range; nothing is filtered or sorted
+    client-side. Pass the returned next_page_token back to get the next page.
 
     Args:
         config_id: Agent configuration ID
+        limit: Maximum number of executions in the page
+        page_token: Token from the previous page (None for the first page)
+        start_time: Only executions at or after this time (ISO string or
+            UTC datetime)
+        end_time: Only executions at or before this time
+        attributes: Attributes to return (e.g. EXECUTION_SUMMARY_ATTRIBUTES);
+            all if None
+        newest_first: Order by timestamp descending (default) or ascending
         table_name: DynamoDB table name (optional, uses env var if not provided)
-        max_results: Maximum number of results to return
 
     Returns:
-        List of execution history dictionaries
+        Dictionary with "items" (execution history dictionaries) and
+        "next_page_token" (None on the last page)
 
     Raises:
+        ValueError: If page_token is invalid
         Exception: If DynamoDB query fails
     """
-    dynamodb = get_dynamodb_resource()
-    table_name = table_name or get_execution_table_name()
-    table = dynamodb.Table(table_name)
-
+    table = get_dynamodb_table(table_name or get_execution_table_name())
+
+    # "timestamp" is a DynamoDB reserved word
+    names = {"#config_id": "config_id", "#timestamp": "timestamp"}
+    values: Dict[str, Any] = {":config_id": config_id}
+    key_condition = "#config_id = :config_id"
+    if start_time is not None and end_time is not None:
+        key_condition += " AND #timestamp BETWEEN :start_time AND :end_time"
+    elif start_time is not None:
+        key_condition += " AND #timestamp >= :start_time"
+    elif end_time is not None:
+        key_condition += " AND #timestamp <= :end_time"
+    if start_time is not None:
+        values[":start_time"] = _format_timestamp(start_time)
+    if end_time is not None:
+        values[":end_time"] = _format_timestamp(end_time)
+
+    query_kwargs: Dict[str, Any] = {
+        "IndexName": EXECUTION_CONFIG_INDEX,
+        "KeyConditionExpression": key_condition,
+        "ExpressionAttributeValues": values,
+        "ScanIndexForward": not newest_first,
+    }
+    if attributes:
+        projection = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+        names.update(projection)
+        query_kwargs["ProjectionExpression"] = ", ".join(projection)
+    query_kwargs["ExpressionAttributeNames"] = names
+    if page_token:
+        query_kwargs["ExclusiveStartKey"] = _decode_page_token(page_token, config_id)
+
+    executions: List[Dict[str, Any]] = []
+    last_evaluated_key = None
     try:
-        # Query by config_id using GSI (Global Secondary Index)
-        # Note: This requires a GSI on config_id
-        response = table.query(
-            IndexName="config_id-index",
-            KeyConditionExpression="config_id = :config_id",
-            ExpressionAttributeValues={":config_id": config_id},
-            Limit=max_results,
-            ScanIndexForward=False,  # Sort descending by sort key
-        )
+        # A page can come back short (1MB response limit); keep reading
+        # until it is full, asking only for the executions still missing
+        while len(executions) < limit:
+            response = table.query(Limit=limit - len(executions), **query_kwargs)
+            executions.extend(response.get("Items", []))
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if last_evaluated_key is None:
+                break
+            query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+    except Exception as e:
+        raise Exception(f"Failed to list execution history from DynamoDB: {str(e)}")
 
-        executions = response.get("Items", [])
+    return {
+        "items": executions,
+        "next_page_token": (
+            _encode_page_token(last_evaluated_key) if last_evaluated_key else None
+        ),
+    }
 
-        # Sort by timestamp descending (most recent first)
-        executions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
 
-        return executions
-    except Exception as e:
-        # Fallback to scan if GSI doesn't exist yet
-        try:
-            response = table.scan(
-                FilterExpression="config_id = :config_id",
-                ExpressionAttributeValues={":config_id": config_id},
-                Limit=max_results,
-            )
-            executions = response.get("Items", [])
-            executions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-            return executions
-        except Exception as scan_error:
-            raise Exception(
-                f"Failed to list execution history from DynamoDB: {str(scan_error)}"
-            )
+def list_execution_history(
+    config_id: str,
+    table_name: str = None,
+    max_results: int = 100,
+    start_time: Optional[Union[str, datetime]] = None,
+    end_time: Optional[Union[str, datetime]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    List the most recent execution history for a specific agent config.
+
+    Use query_execution_history to page through more executions.
+
+    Args:
+        config_id: Agent configuration ID
+        table_name: DynamoDB table name (optional, uses env var if not provided)
+        max_results: Maximum number of results to return
+        start_time: Only executions at or after this time
+        end_time: Only executions at or before this time
+
+    Returns:
+        List of execution history dictionaries, most recent first
+
+    Raises:
+        Exception: If DynamoDB query fails
+    """
+    page = query_execution_history(
+        config_id,
+        limit=max_results,
+        start_time=start_time,
+        end_time=end_time,
+        table_name=table_name,
+    )
+    return page["items"]
 
 
 def delete_execution_history(execution_id: str, table_name: str = None) -> None:
     """
-    Delete a specific execution history from DynamoDB.
+    Delete a specific execution history from DynamoDB, and its transcript.
 
     Args:
         execution_id: Unique execution ID
@@ -178,11 +514,21 @@ def delete_execution_history(execution_id: str, table_name: str = None) -> None:
     Raises:
         Exception: If DynamoDB deletion fails
     """
-    dynamodb = get_dynamodb_resource()
-    table_name = table_name or get_execution_table_name()
-    table = dynamodb.Table(table_name)
+    table = get_dynamodb_table(table_name or get_execution_table_name())
 
     try:
-        table.delete_item(Key={"execution_id": execution_id})
+        response = table.delete_item(
+            Key={"execution_id": execution_id}, ReturnValues="ALL_OLD"
+        )
     except Exception as e:
         raise Exception(f"Failed to delete execution history from DynamoDB: {str(e)}")
+
+    pointer = response.get("Attributes", {}).get("transcript")
+    store = get_transcript_store()
+    if pointer and store is not None and store.backend == pointer["backend"]:
+        try:
+            store.delete(pointer["key"])
+        except Exception as e:
+            logger.warning(
+                f"Failed to delete transcript of execution {execution_id}: {str(e)}"
+            )
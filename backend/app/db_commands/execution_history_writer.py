@@ -0,0 +1,462 @@
+"""
+Write-behind persistence of execution history.
+
+Handlers hand finished executions to ExecutionHistoryWriter.submit(), which
+builds the DynamoDB item (timestamp, transcript) and queues it; a background
+thread drains the bounded in-process queue and writes the items in
+batch_writer batches of up to 25 (items arriving within
+EXECUTION_HISTORY_LINGER_MS of each other share a batch).
+
+- Throttling errors are retried with exponential backoff and jitter.
+- Batches that still fail (DynamoDB unavailable, retries exhausted) are
+  appended to a local spool file (JSON Lines) and replayed after the next
+  successful write, or when the next writer starts. A replay first claims
+  the spool by renaming it, so new failures start a fresh file. Appends are
+  not safe across processes, so every process needs its own spool path (the
+  default includes the pid).
+- A full queue applies backpressure: the item is written synchronously by
+  the caller, as without the writer.
+- The queue is flushed at interpreter exit and on SIGTERM. Lambda freezes the
+  execution environment (and this thread) between invocations, so Lambda
+  entrypoints should call flush_execution_history() before returning, or
+  after the response is streamed.
+
+Until a queued item is written, its execution_id (returned to the client and
+recorded by the verdict cache) has no history, and a spool in an ephemeral
+/tmp can be lost with the environment. Write-behind is therefore off unless
+EXECUTION_HISTORY_WRITE_BEHIND=true, for long-running workers that flush
+before exit.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import signal
+import threading
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from infra.dynamodb_client import get_dynamodb_table
+
+from .execution_history_commands import (_build_execution_item,
+                                         get_execution_table_name)
+
+logger = logging.getLogger(__name__)
+
+# DynamoDB BatchWriteItem accepts at most 25 items per call
+BATCH_SIZE = 25
+THROTTLING_ERRORS = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+}
+
+_STOP = object()
+
+_writer: Optional["ExecutionHistoryWriter"] = None
+_writer_lock = threading.Lock()
+
+
+def is_write_behind_enabled() -> bool:
+    """Write-behind is off unless EXECUTION_HISTORY_WRITE_BEHIND is "true"."""
+    return os.getenv("EXECUTION_HISTORY_WRITE_BEHIND", "false").lower() == "true"
+
+
+def get_default_spool_path() -> str:
+    """
+    Spool file of this process: EXECUTION_HISTORY_SPOOL_PATH (default
+    /tmp/execution-history-{pid}.spool), with "{pid}" replaced by the pid.
+    """
+    path = os.getenv(
+        "EXECUTION_HISTORY_SPOOL_PATH", "/tmp/execution-history-{pid}.spool"
+    )
+    return path.replace("{pid}", str(os.getpid()))
+
+
+def _is_throttling(error: Exception) -> bool:
+    return (
+        isinstance(error, ClientError)
+        and error.response.get("Error", {}).get("Code") in THROTTLING_ERRORS
+    )
+
+
+def _encode_number(value: Any) -> Any:
+    """JSON encoding of the Decimals in a DynamoDB item (for the spool file)."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ExecutionHistoryWriter:
+    """
+    Background writer of execution history items.
+
+    Args:
+        table_name: DynamoDB table name (optional, uses env var if not provided)
+        max_queue_size: Items buffered before submit() writes synchronously
+        linger_seconds: How long a batch waits for more items
+        max_retries: Retries of a throttled batch before it is spooled
+        backoff_seconds: First retry delay (doubles per retry, with jitter)
+        spool_path: Local file for batches that could not be written; must
+            not be shared with another running process (default
+            get_default_spool_path())
+    """
+
+    def __init__(
+        self,
+        table_name: str = None,
+        max_queue_size: int = 10000,
+        linger_seconds: float = 0.02,
+        max_retries: int = 5,
+        backoff_seconds: float = 0.05,
+        spool_path: Optional[str] = None,
+    ):
+        self.table_name = table_name
+        self.linger_seconds = linger_seconds
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.spool_path = spool_path or get_default_spool_path()
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._outstanding = 0
+        self._idle = threading.Condition()
+        self._spool_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "submitted": 0,
+            "written": 0,
+            "batches": 0,
+            "retries": 0,
+            "spooled": 0,
+            "replayed": 0,
+            "failed": 0,
+            "synchronous": 0,
+        }
+
+    def submit(
+        self, config_id: str, execution_id: str, user_input: str, result: Dict[str, Any]
+    ) -> str:
+        """
+        Build the item of an execution and queue it for persistence.
+
+        The item (and its timestamp) is built here, in the caller's thread,
+        so the stored timestamp is the submit time, not the write time.
+
+        Args:
+            config_id: Agent configuration ID
+            execution_id: Unique execution ID
+            user_input: User's input
+            result: Execution result from invoke_agent
+
+        Returns:
+            execution_id that will be saved
+
+        Raises:
+            Exception: If the item can't be built, or the queue is full and
+                the synchronous write fails
+        """
+        item = _build_execution_item(config_id, execution_id, user_input, result)
+        self._ensure_started()
+
+        with self._idle:
+            self._outstanding += 1
+        try:
+            self._queue.put_nowait(item)
+            self._count("submitted")
+        except queue.Full:
+            with self._idle:
+                self._outstanding -= 1
+                self._idle.notify_all()
+            self._count("synchronous")
+            table = get_dynamodb_table(self.table_name or get_execution_table_name())
+            try:
+                table.put_item(Item=item)
+            except Exception as e:
+                raise Exception(
+                    f"Failed to save execution history to DynamoDB: {str(e)}"
+                ) from e
+
+        return execution_id
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted item is written (or spooled).
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._outstanding == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush the queue and stop the background thread.
+
+        Items still queued after the timeout are spooled.
+
+        Args:
+            timeout: Maximum seconds to wait for the flush
+        """
+        if not self.flush(timeout):
+            self._spool_queued()
+
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="execution-history-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _count(self, stat: str, count: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[stat] += count
+
+    def _run(self) -> None:
+        try:
+            # Claims left behind by a previous writer that died mid-replay
+            for claim_path in self._abandoned_claims():
+                self._replay_claim(claim_path)
+            self._replay_spool()
+        except Exception as e:
+            logger.error(f"Failed to replay spooled execution history: {str(e)}")
+
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            # Coalesce the items that arrive within the linger time
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.linger_seconds
+            while len(batch) < BATCH_SIZE:
+                try:
+                    item = self._queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Execution history writer failed: {str(e)}")
+            finally:
+                with self._idle:
+                    self._outstanding -= len(batch)
+                    self._idle.notify_all()
+
+            if stop:
+                return
+
+    def _write_batch(self, items: List[Dict[str, Any]]) -> None:
+        if self._write_items(items):
+            self._count("written", len(items))
+            self._replay_spool()
+        else:
+            self._spool(items)
+
+    def _write_items(self, items: List[Dict[str, Any]]) -> bool:
+        """Batch-write items, retrying throttled batches. Returns success."""
+        table = get_dynamodb_table(self.table_name or get_execution_table_name())
+        delay = self.backoff_seconds
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                # Puts are idempotent, so a partly written batch can be resent
+                with table.batch_writer(overwrite_by_pkeys=["execution_id"]) as batch:
+                    for item in items:
+                        batch.put_item(Item=item)
+                self._count("batches")
+                return True
+            except Exception as e:
+                if not _is_throttling(e) or attempt == self.max_retries:
+                    logger.warning(
+                        f"Failed to write {len(items)} execution history items: "
+                        f"{str(e)}"
+                    )
+                    return False
+                self._count("retries")
+                time.sleep(delay * random.uniform(0.5, 1.5))
+                delay = min(delay * 2, 5.0)
+        return False
+
+    def _spool(self, items: List[Dict[str, Any]]) -> None:
+        """Append items to the spool file for a later replay."""
+        try:
+            with self._spool_lock:
+                with open(self.spool_path, "a", encoding="utf-8") as f:
+                    for item in items:
+                        f.write(json.dumps(item, default=_encode_number) + "\n")
+            self._count("spooled", len(items))
+        except Exception as e:
+            self._count("failed", len(items))
+            logger.error(
+                f"Failed to spool {len(items)} execution history items to "
+                f"{self.spool_path}: {str(e)}"
+            )
+
+    def _spool_queued(self) -> None:
+        """Spool the items left in the queue (shutdown timed out)."""
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                items.append(item)
+
+        if items:
+            self._spool(items)
+        with self._idle:
+            self._outstanding -= len(items)
+            self._idle.notify_all()
+
+    def _replay_spool(self) -> None:
+        """Claim the spool file and write its items back to DynamoDB."""
+        claim_path = f"{self.spool_path}.{uuid.uuid4().hex}.replay"
+        try:
+            with self._spool_lock:
+                # Atomic claim; new failures start a fresh file
+                os.rename(self.spool_path, claim_path)
+        except FileNotFoundError:
+            return  # Nothing spooled
+        except Exception as e:
+            logger.error(f"Failed to claim spool file {self.spool_path}: {str(e)}")
+            return
+        self._replay_claim(claim_path)
+
+    def _abandoned_claims(self) -> List[str]:
+        """Claimed spool files that were never fully replayed."""
+        directory = os.path.dirname(os.path.abspath(self.spool_path))
+        prefix = os.path.basename(self.spool_path) + "."
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return []
+        return [
+            os.path.join(directory, name)
+            for name in sorted(names)
+            if name.startswith(prefix) and name.endswith(".replay")
+        ]
+
+    def _replay_claim(self, claim_path: str) -> None:
+        """Write a claimed spool file's items, re-spooling what still fails."""
+        try:
+            with open(claim_path, "r", encoding="utf-8") as f:
+                items = [
+                    json.loads(line, parse_float=Decimal) for line in f if line.strip()
+                ]
+        except FileNotFoundError:
+            return  # Removed since it was claimed; nothing left to replay
+        except Exception as e:
+            logger.error(f"Failed to read spool file {claim_path}: {str(e)}")
+            return
+
+        try:
+            for start in range(0, len(items), BATCH_SIZE):
+                batch = items[start : start + BATCH_SIZE]
+                if not self._write_items(batch):
+                    self._spool(items[start:])
+                    break
+                self._count("replayed", len(batch))
+            os.remove(claim_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to replay spool file {claim_path}: {str(e)}")
+
+
+def get_execution_history_writer() -> ExecutionHistoryWriter:
+    """
+    Get the process-wide execution history writer.
+
+    Configured by EXECUTION_HISTORY_QUEUE_SIZE (default 10000),
+    EXECUTION_HISTORY_LINGER_MS (default 20), EXECUTION_HISTORY_MAX_RETRIES
+    (default 5) and EXECUTION_HISTORY_SPOOL_PATH (see get_default_spool_path).
+    The queue is flushed at exit and on SIGTERM.
+    """
+    global _writer
+    if _writer is not None:
+        return _writer
+
+    with _writer_lock:
+        if _writer is None:
+            _writer = ExecutionHistoryWriter(
+                max_queue_size=int(os.getenv("EXECUTION_HISTORY_QUEUE_SIZE", "10000")),
+                linger_seconds=float(os.getenv("EXECUTION_HISTORY_LINGER_MS", "20"))
+                / 1000,
+                max_retries=int(os.getenv("EXECUTION_HISTORY_MAX_RETRIES", "5")),
+                spool_path=get_default_spool_path(),
+            )
+            atexit.register(_shutdown_writer)
+            _install_sigterm_handler()
+        return _writer
+
+
+def flush_execution_history(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until queued execution history is written.
+
+    Call at the end of a Lambda invocation: the environment is frozen once
+    the handler returns, and a frozen writer thread makes no progress.
+
+    Args:
+        timeout: Maximum seconds to wait (None waits indefinitely)
+
+    Returns:
+        True if everything was written (or spooled) within the timeout
+    """
+    if _writer is None:
+        return True
+    return _writer.flush(timeout)
+
+
+def _shutdown_writer() -> None:
+    """Flush and stop the writer (EXECUTION_HISTORY_SHUTDOWN_TIMEOUT, default 5s)."""
+    if _writer is not None:
+        _writer.close(float(os.getenv("EXECUTION_HISTORY_SHUTDOWN_TIMEOUT", "5")))
+
+
+def _install_sigterm_handler() -> None:
+    """Flush on SIGTERM, then defer to the previous handler."""
+    if threading.current_thread() is not threading.main_thread():
+        return  # Signal handlers can only be set from the main thread
+
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def handle_sigterm(signum: int, frame: Any) -> None:
+        _shutdown_writer()
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
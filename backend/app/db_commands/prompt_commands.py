@@ -1,6 +1,14 @@
 import os
+from typing import Any, Dict, Optional
 
-from infra.dynamodb_client import get_dynamodb_resource
+from infra.dynamodb_client import get_dynamodb_table
+
+from ..utils.ttl_cache import TTLCache
+
+# Marker cached for prompt_ids that do not exist (negative caching)
+_NOT_FOUND = object()
+
+_prompt_cache: Optional[TTLCache] = None
 
 
 def get_prompts_table_name() -> str:
@@ -8,6 +16,43 @@ def get_prompts_table_name() -> str:
     return os.getenv("PROMPTS_TABLE", "ai-prompts")
 
 
+def get_prompt_cache() -> TTLCache:
+    """
+    Get the read-through cache used by load_prompt.
+
+    Configured by PROMPT_CACHE_MAX_SIZE (default 128) and
+    PROMPT_CACHE_TTL_SECONDS (default 300; 0 disables expiry).
+    """
+    global _prompt_cache
+    if _prompt_cache is None:
+        _prompt_cache = TTLCache(
+            max_size=int(os.getenv("PROMPT_CACHE_MAX_SIZE", "128")),
+            ttl_seconds=float(os.getenv("PROMPT_CACHE_TTL_SECONDS", "300")),
+        )
+    return _prompt_cache
+
+
+def invalidate_prompt_cache(prompt_id: Optional[str] = None) -> None:
+    """
+    Drop cached prompts so the next load goes to DynamoDB.
+
+    Called automatically by save_prompt.
+
+    Args:
+        prompt_id: Prompt to invalidate (all prompts if None)
+    """
+    cache = get_prompt_cache()
+    if prompt_id is None:
+        cache.clear()
+    else:
+        cache.invalidate_where(lambda key: key[1] == prompt_id)
+
+
+def get_prompt_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters for the prompt cache."""
+    return get_prompt_cache().stats()
+
+
 def save_prompt(prompt_id: str, content: str, table_name: str = None) -> None:
     """
     Save a prompt to DynamoDB.
@@ -20,9 +65,7 @@ def save_prompt(prompt_id: str, content: str, table_name: str = None) -> None:
     Raises:
         Exception: If DynamoDB write fails
     """
-    dynamodb = get_dynamodb_resource()
-    table_name = table_name or get_prompts_table_name()
-    table = dynamodb.Table(table_name)
+    table = get_dynamodb_table(table_name or get_prompts_table_name())
 
     try:
         table.put_item(
@@ -30,12 +73,17 @@ def save_prompt(prompt_id: str, content: str, table_name: str = None) -> None:
         )
     except Exception as e:
         raise Exception(f"Failed to save prompt {prompt_id} to DynamoDB: {str(e)}")
+    finally:
+        invalidate_prompt_cache(prompt_id)
 
 
 def load_prompt(prompt_id: str, table_name: str = None) -> str:
     """
     Load a prompt from DynamoDB by prompt_id.
 
+    Reads through a TTL cache (see get_prompt_cache); missing prompt_ids are
+    cached too, for PROMPT_NEGATIVE_CACHE_TTL_SECONDS (default 10).
+
     Args:
         prompt_id: The prompt identifier (e.g., "fake-news-detector-v1")
         table_name: DynamoDB table name (optional, uses env var if not provided)
@@ -46,16 +94,32 @@ def load_prompt(prompt_id: str, table_name: str = None) -> str:
     Raises:
         Exception: If prompt not found or DynamoDB error
     """
-    dynamodb = get_dynamodb_resource()
     table_name = table_name or get_prompts_table_name()
-    table = dynamodb.Table(table_name)
+    cache = get_prompt_cache()
+    cache_key = (table_name, prompt_id)
+
+    cached = cache.get(cache_key)
+    if cached is _NOT_FOUND:
+        raise Exception(
+            f"Failed to load prompt {prompt_id} from DynamoDB: "
+            f"Prompt {prompt_id} not found"
+        )
+    if cached is not None:
+        return cached
+
+    table = get_dynamodb_table(table_name)
 
     try:
         response = table.get_item(Key={"prompt_id": prompt_id})
 
         if "Item" not in response:
+            negative_ttl = float(os.getenv("PROMPT_NEGATIVE_CACHE_TTL_SECONDS", "10"))
+            if negative_ttl > 0:
+                cache.set(cache_key, _NOT_FOUND, ttl_seconds=negative_ttl)
             raise Exception(f"Prompt {prompt_id} not found")
 
-        return response["Item"]["content"]
+        content = response["Item"]["content"]
+        cache.set(cache_key, content)
+        return content
     except Exception as e:
         raise Exception(f"Failed to load prompt {prompt_id} from DynamoDB: {str(e)}")
@@ -0,0 +1,86 @@
+import os
+import time
+from typing import Optional
+
+from infra.dynamodb_client import get_dynamodb_table
+
+
+def get_summaries_table_name() -> str:
+    """
+    Get the DynamoDB summary cache table name from environment.
+
+    Persistent summary caching is disabled when SUMMARY_CACHE_TABLE is unset.
+    """
+    return os.getenv("SUMMARY_CACHE_TABLE", "")
+
+
+def load_summary(cache_key: str, table_name: str = None) -> Optional[str]:
+    """
+    Load a memoised summary from DynamoDB.
+
+    Args:
+        cache_key: Summary cache key (content hash, max_length and model)
+        table_name: DynamoDB table name (optional, uses env var if not provided)
+
+    Returns:
+        The summary, or None if not cached or expired
+
+    Raises:
+        Exception: If DynamoDB read fails
+    """
+    table = get_dynamodb_table(table_name or get_summaries_table_name())
+
+    try:
+        response = table.get_item(Key={"cache_key": cache_key})
+        item = response.get("Item")
+        if not item:
+            return None
+
+        # DynamoDB TTL deletes expired items lazily; don't serve them meanwhile
+        expires_at = item.get("expires_at")
+        if expires_at is not None and int(expires_at) <= int(time.time()):
+            return None
+
+        return item["summary"]
+    except Exception as e:
+        raise Exception(f"Failed to load summary {cache_key} from DynamoDB: {str(e)}")
+
+
+def save_summary(
+    cache_key: str,
+    summary: str,
+    model_id: str,
+    max_length: int,
+    ttl_seconds: Optional[int] = None,
+    table_name: str = None,
+) -> None:
+    """
+    Save a summary to DynamoDB.
+
+    Args:
+        cache_key: Summary cache key (content hash, max_length and model)
+        summary: The summary text
+        model_id: Model that produced the summary
+        max_length: Requested maximum summary length in words
+        ttl_seconds: Lifetime of the item (stored in the "expires_at" TTL
+            attribute); None keeps it forever
+        table_name: DynamoDB table name (optional, uses env var if not provided)
+
+    Raises:
+        Exception: If DynamoDB write fails
+    """
+    table = get_dynamodb_table(table_name or get_summaries_table_name())
+
+    item = {
+        "cache_key": cache_key,
+        "summary": summary,
+        "model_id": model_id,
+        "max_length": max_length,
+    }
+    if ttl_seconds:
+        item["expires_at"] = int(time.time()) + int(ttl_seconds)
+
+    try:
+        table.put_item(Item=item)
+    except Exception as e:
+        raise Exception(f"Failed to save summary {cache_key} to DynamoDB: {str(e)}")
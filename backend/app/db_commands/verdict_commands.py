@@ -0,0 +1,87 @@
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+from infra.dynamodb_client import get_dynamodb_table
+
+
+def get_verdicts_table_name() -> str:
+    """
+    Get the DynamoDB verdict cache table name from environment.
+
+    Persistent verdict caching is disabled when VERDICT_CACHE_TABLE is unset.
+    """
+    return os.getenv("VERDICT_CACHE_TABLE", "")
+
+
+def load_verdict(cache_key: str, table_name: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached verdict from DynamoDB.
+
+    Args:
+        cache_key: Verdict cache key (see agents/verdict_cache.py)
+        table_name: DynamoDB table name (optional, uses env var if not provided)
+
+    Returns:
+        The cached entry (execution_id, result, metadata, cached_at), or None
+        if not cached or expired
+
+    Raises:
+        Exception: If DynamoDB read fails
+    """
+    table = get_dynamodb_table(table_name or get_verdicts_table_name())
+
+    try:
+        response = table.get_item(Key={"cache_key": cache_key})
+        item = response.get("Item")
+        if not item:
+            return None
+
+        # DynamoDB TTL deletes expired items lazily; don't serve them meanwhile
+        expires_at = item.get("expires_at")
+        if expires_at is not None and int(expires_at) <= int(time.time()):
+            return None
+
+        # The payload is stored as JSON so floats/nesting need no conversion
+        return json.loads(item["payload"])
+    except Exception as e:
+        raise Exception(f"Failed to load verdict {cache_key} from DynamoDB: {str(e)}")
+
+
+def save_verdict(
+    cache_key: str,
+    entry: Dict[str, Any],
+    config_id: str,
+    ttl_seconds: Optional[int] = None,
+    table_name: str = None,
+) -> None:
+    """
+    Save a verdict to DynamoDB.
+
+    Args:
+        cache_key: Verdict cache key (see agents/verdict_cache.py)
+        entry: Cached entry (execution_id, claim, result, summary metadata,
+            cached_at); tool results are not stored
+        config_id: Agent configuration ID that produced the verdict
+        ttl_seconds: Lifetime of the item (stored in the "expires_at" TTL
+            attribute); None keeps it forever
+        table_name: DynamoDB table name (optional, uses env var if not provided)
+
+    Raises:
+        Exception: If DynamoDB write fails
+    """
+    table = get_dynamodb_table(table_name or get_verdicts_table_name())
+
+    item = {
+        "cache_key": cache_key,
+        "config_id": config_id,
+        "payload": json.dumps(entry, default=str),
+    }
+    if ttl_seconds:
+        item["expires_at"] = int(time.time()) + int(ttl_seconds)
+
+    try:
+        table.put_item(Item=item)
+    except Exception as e:
+        raise Exception(f"Failed to save verdict {cache_key} to DynamoDB: {str(e)}")
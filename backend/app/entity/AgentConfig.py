@@ -58,3 +58,17 @@ class AgentConfig:
     temperature: float = 0.7
     max_tokens: int = 4096
     max_iterations: int = 10  # Max agent loop iterations
+    max_tool_concurrency: int = 1  # Parallel tool calls per turn (1 = sequential)
+
+    # Summariser used by summary_long_text (empty = SUMMARY_LLM_PROVIDER /
+    # SUMMARY_MODEL_ID environment defaults)
+    summary_llm_provider: str = ""
+    summary_model_id: str = ""
+
+    # Output of search_internet / verify_on_platform: "text" or "json"
+    # (compact structured payloads; empty = TOOL_OUTPUT_FORMAT, then "text")
+    tool_output_format: str = ""
+
+    # Maximum estimated input tokens per model call; older tool outputs are
+    # summarised or dropped to fit (0 = CONTEXT_TOKEN_BUDGET, then unlimited)
+    context_token_budget: int = 0
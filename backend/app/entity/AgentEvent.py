@@ -0,0 +1,93 @@
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field
+from typing import Any, ClassVar, Dict, Optional
+
+
+@dataclass
+class AgentEvent:
+    """
+    Base class for events yielded while an agent runs (see stream_agent).
+    """
+
+    type: ClassVar[str] = "event"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the event (e.g. for SSE/WebSocket), including its type."""
+        return {"type": self.type, **asdict(self)}
+
+
+@dataclass
+class TokenDelta(AgentEvent):
+    """
+    A piece of text generated by the model.
+    """
+
+    type: ClassVar[str] = "token"
+
+    text: str
+    iteration: int  # Model call the token belongs to (1-based)
+
+
+@dataclass
+class ToolCallStarted(AgentEvent):
+    """
+    A tool call began executing.
+    """
+
+    type: ClassVar[str] = "tool_call_started"
+
+    tool_call_id: Optional[str]
+    tool_name: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ToolCallFinished(AgentEvent):
+    """
+    A tool call completed (failed=True if the output is an error message).
+    """
+
+    type: ClassVar[str] = "tool_call_finished"
+
+    tool_call_id: Optional[str]
+    tool_name: str
+    output: str
+    failed: bool = False
+    duration_ms: float = 0.0
+
+
+@dataclass
+class IterationCompleted(AgentEvent):
+    """
+    A model call finished; tool_calls is the number of tools it requested.
+    """
+
+    type: ClassVar[str] = "iteration"
+
+    iteration: int
+    tool_calls: int = 0
+
+
+@dataclass
+class FinalVerdict(AgentEvent):
+    """
+    The agent's final answer, with the same metadata as invoke_agent.
+
+    full_state (the messages of the run) is persisted as the execution
+    transcript but not serialised by to_dict.
+    """
+
+    type: ClassVar[str] = "final_verdict"
+
+    result: Any
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    full_state: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "result": deepcopy(self.result),
+            "metadata": deepcopy(self.metadata),
+        }
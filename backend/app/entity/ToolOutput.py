@@ -0,0 +1,47 @@
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ToolOutput:
+    """
+    Base class for structured tool payloads (tool_output_format "json").
+    """
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the payload, leaving out empty fields to keep it compact."""
+        return {
+            key: value
+            for key, value in asdict(self).items()
+            if value is not None and value != [] and value != ""
+        }
+
+
+@dataclass
+class PlatformVerificationOutput(ToolOutput):
+    """
+    Verification platform result for one claim.
+    """
+
+    status: str  # "TRUE", "FALSE" or "UNVERIFIED"
+    claim: Optional[str] = None
+    match_confidence: Optional[float] = None  # Share of the fact-check matched
+    matched_fact_check: Optional[str] = None
+    verified_by: Optional[str] = None
+    source_confidence: Optional[str] = None  # Fact-checker's own confidence
+    summary: Optional[str] = None
+    sources: List[str] = field(default_factory=list)
+
+
+@dataclass
+class WebSearchOutput(ToolOutput):
+    """
+    Keyword search result for one web page.
+    """
+
+    url: str
+    keyword: str
+    found: bool
+    snippet: str  # Context around the keyword (or the start of the page)
+    snippet_offsets: Optional[List[int]] = None  # [start, end) in the page text
+    text_length: int = 0
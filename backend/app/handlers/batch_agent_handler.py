@@ -0,0 +1,206 @@
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Tuple
+
+from ..agents.agent_cache import get_or_create_agent
+from ..agents.agent_factory import invoke_agent
+from ..agents.verdict_cache import (lookup_verdict, seed_agent_input,
+                                    store_verdict)
+from ..utils.config_utils import get_agent_by_config_id
+from ..utils.stats_utils import summarize_latencies
+
+# DynamoDB BatchWriteItem accepts at most 25 items per call
+PERSIST_BATCH_SIZE = 25
+
+
+def handle_batch_agent_request(
+    config_id: str,
+    user_inputs: Iterable[str],
+    max_workers: int = 8,
+    persist: bool = True,
+) -> Dict[str, Any]:
+    """
+    Handle a batch of standalone agent requests sharing one agent configuration.
+
+    The agent is instantiated once and the inputs are verified concurrently by
+    a bounded worker pool. ``user_inputs`` may be a generator: at most
+    ``2 * max_workers`` items are in flight, so a long stream is never fully
+    materialised. Execution history is written in batches of 25 items.
+    Claims already in the verdict cache (agents/verdict_cache.py) are answered
+    without running the agent; new verdicts are only cached when their
+    history is persisted (never with persist=False).
+
+    Args:
+        config_id: The agent configuration ID
+        user_inputs: List or iterator of user inputs to verify
+        max_workers: Maximum number of agent invocations running concurrently
+        persist: Whether to save execution history to DynamoDB
+
+    Returns:
+        Dictionary containing:
+        - success: False only if the batch could not start (e.g. bad config_id)
+        - items: Per-item results in input order (index, success, execution_id,
+          result, metadata, error, latency_ms)
+        - summary: Totals, elapsed time, throughput and latency percentiles
+
+    Raises:
+        ValueError: If max_workers is less than 1
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    batch_start = time.perf_counter()
+
+    try:
+        agent_config = get_agent_by_config_id(config_id)
+        if not agent_config:
+            return {
+                "success": False,
+                "error": f"Agent configuration not found for config_id: {config_id}",
+                "items": [],
+                "summary": {},
+            }
+
+        agent = get_or_create_agent(agent_config)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to prepare agent: {str(e)}",
+            "items": [],
+            "summary": {},
+        }
+
+    items: List[Dict[str, Any]] = []
+    pending_records: List[Tuple[Dict[str, Any], Dict[str, Any], bool]] = []
+
+    def run_item(index: int, user_input: str) -> Dict[str, Any]:
+        item_start = time.perf_counter()
+        item = {
+            "index": index,
+            "success": False,
+            "execution_id": str(uuid.uuid4()),
+            "result": None,
+            "metadata": {},
+            "error": None,
+        }
+        try:
+            execution_result = lookup_verdict(agent_config, user_input)
+            if execution_result is None:
+                agent_input, seed = seed_agent_input(agent_config, user_input)
+                execution_result = invoke_agent(agent, agent_input)
+                execution_result["metadata"].update(cache_hit=False, seeded_from=seed)
+                # Cached once the record is handed to persistence (_flush_records)
+                item["_new_verdict"] = True
+            item.update(
+                success=True,
+                result=execution_result.get("result"),
+                metadata=execution_result.get("metadata", {}),
+            )
+            item["_record"] = {
+                "config_id": config_id,
+                "execution_id": item["execution_id"],
+                "user_input": user_input,
+                "result": execution_result,
+            }
+        except ValueError as e:
+            item["error"] = f"Validation error: {str(e)}"
+        except RuntimeError as e:
+            item["error"] = f"Execution error: {str(e)}"
+        except Exception as e:
+            item["error"] = f"Unexpected error: {str(e)}"
+
+        item["latency_ms"] = (time.perf_counter() - item_start) * 1000
+        return item
+
+    def collect(item: Dict[str, Any]) -> None:
+        record = item.pop("_record", None)
+        new_verdict = item.pop("_new_verdict", False)
+        if record and persist:
+            pending_records.append((item, record, new_verdict))
+        items.append(item)
+
+        if len(pending_records) >= PERSIST_BATCH_SIZE:
+            _flush_records(pending_records, agent_config)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = set()
+        for index, user_input in enumerate(user_inputs):
+            in_flight.add(executor.submit(run_item, index, user_input))
+
+            if len(in_flight) >= 2 * max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future.result())
+
+        for future in in_flight:
+            collect(future.result())
+
+    if persist:
+        _flush_records(pending_records, agent_config)
+
+    items.sort(key=lambda item: item["index"])
+    elapsed = time.perf_counter() - batch_start
+    succeeded = sum(1 for item in items if item["success"])
+
+    return {
+        "success": True,
+        "items": items,
+        "summary": {
+            "total": len(items),
+            "succeeded": succeeded,
+            "failed": len(items) - succeeded,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_per_second": round(len(items) / elapsed, 3) if elapsed else 0.0,
+            "latency_ms": summarize_latencies([item["latency_ms"] for item in items]),
+        },
+    }
+
+
+def _flush_records(
+    pending_records: List[Tuple[Dict[str, Any], Dict[str, Any], bool]],
+    agent_config: Any,
+) -> None:
+    """
+    Persist buffered execution records with one batched DynamoDB write.
+
+    With write-behind enabled, the records are handed to the background
+    writer instead (db_commands/execution_history_writer.py). Otherwise items
+    whose history could not be saved are marked as failed, mirroring the
+    standalone handler where a persistence failure fails the request.
+
+    New verdicts (the third tuple element) are cached only once their record
+    has been handed to persistence, so the verdict cache never points at an
+    execution_id without history.
+    """
+    from ..db_commands.execution_history_commands import \
+        save_execution_histories
+    from ..db_commands.execution_history_writer import (
+        get_execution_history_writer, is_write_behind_enabled)
+
+    if not pending_records:
+        return
+
+    try:
+        if is_write_behind_enabled():
+            writer = get_execution_history_writer()
+            for _, record, _ in pending_records:
+                writer.submit(**record)
+        else:
+            save_execution_histories([record for _, record, _ in pending_records])
+    except Exception as e:
+        for item, _, _ in pending_records:
+            item["success"] = False
+            item["error"] = f"Persistence error: {str(e)}"
+        pending_records.clear()
+        return
+
+    for _, record, new_verdict in pending_records:
+        if new_verdict:
+            store_verdict(
+                agent_config,
+                record["user_input"],
+                record["execution_id"],
+                record["result"],
+            )
+    pending_records.clear()
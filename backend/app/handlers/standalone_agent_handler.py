@@ -1,9 +1,14 @@
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator
 
-from ..agents.agent_factory import instantiate_agent, invoke_agent
-from ..tools.tool_loader import gather_agent_tools
+from ..agents.agent_cache import get_or_create_agent
+from ..agents.agent_factory import (ainvoke_agent, astream_agent, invoke_agent,
+                                    stream_agent)
+from ..agents.verdict_cache import (lookup_verdict, seed_agent_input,
+                                    store_verdict)
+from ..entity.AgentEvent import AgentEvent, FinalVerdict
 from ..utils.config_utils import get_agent_by_config_id
 
 
@@ -48,16 +53,22 @@ def handle_standalone_agent_request(config_id: str, user_input: str) -> Dict[str
                 "metadata": {},
             }
 
-        # Step 2: Gather all tools (MCP + custom)
-        tools = gather_agent_tools(agent_config)
+        # Step 2: Answer repeated claims from the verdict cache (see
+        # agents/verdict_cache.py)
+        execution_result = lookup_verdict(agent_config, user_input)
 
-        # Step 3: Instantiate the agent
-        agent = instantiate_agent(agent_config, tools)
+        if execution_result is None:
+            # Step 3: Gather tools and instantiate the agent (reused while the
+            # config is unchanged, see agents/agent_cache.py)
+            agent = get_or_create_agent(agent_config)
 
-        # Step 4: Invoke the agent with user input
-        execution_result = invoke_agent(agent, user_input)
+            # Step 4: Invoke the agent with user input (plus the verdict of a
+            # similar claim, if any)
+            agent_input, seed = seed_agent_input(agent_config, user_input)
+            execution_result = invoke_agent(agent, agent_input)
+            execution_result["metadata"].update(cache_hit=False, seeded_from=seed)
 
-        # Step 5: Persist the execution history to DynamoDB
+        # Step 5: Persist the execution history to DynamoDB (cache hits too)
         saved_execution_id = _persist_execution_to_dynamodb(
             config_id=config_id,
             execution_id=execution_id,
@@ -65,6 +76,11 @@ def handle_standalone_agent_request(config_id: str, user_input: str) -> Dict[str
             result=execution_result,
         )
 
+        if not execution_result["metadata"]["cache_hit"]:
+            store_verdict(
+                agent_config, user_input, saved_execution_id, execution_result
+            )
+
         return {
             "success": True,
             "execution_id": saved_execution_id,
@@ -95,12 +111,271 @@ def handle_standalone_agent_request(config_id: str, user_input: str) -> Dict[str
         }
 
 
+async def ahandle_standalone_agent_request(
+    config_id: str, user_input: str
+) -> Dict[str, Any]:
+    """
+    Async variant of handle_standalone_agent_request.
+
+    The agent runs via ainvoke_agent, while the blocking DynamoDB calls (config
+    lookup, agent build on a cache miss and execution history persistence)
+    are offloaded to worker threads. A single event loop can therefore keep
+    many verifications in flight, e.g. with asyncio.gather.
+
+    Args:
+        config_id: The agent configuration ID
+        user_input: The user's input/query for the agent
+
+    Returns:
+        Same dictionary as handle_standalone_agent_request
+    """
+    try:
+        # Generate unique execution ID
+        execution_id = str(uuid.uuid4())
+
+        # Step 1: Get the agent configuration by configId
+        agent_config = await asyncio.to_thread(get_agent_by_config_id, config_id)
+
+        if not agent_config:
+            return {
+                "success": False,
+                "error": f"Agent configuration not found for config_id: {config_id}",
+                "result": None,
+                "metadata": {},
+            }
+
+        # Step 2: Answer repeated claims from the verdict cache
+        execution_result = await asyncio.to_thread(
+            lookup_verdict, agent_config, user_input
+        )
+
+        if execution_result is None:
+            # Step 3: Gather tools and instantiate the agent (cached)
+            agent = await asyncio.to_thread(get_or_create_agent, agent_config)
+
+            # Step 4: Invoke the agent with user input
+            agent_input, seed = await asyncio.to_thread(
+                seed_agent_input, agent_config, user_input
+            )
+            execution_result = await ainvoke_agent(agent, agent_input)
+            execution_result["metadata"].update(cache_hit=False, seeded_from=seed)
+
+        # Step 5: Persist the execution history to DynamoDB (cache hits too)
+        saved_execution_id = await asyncio.to_thread(
+            _persist_execution_to_dynamodb,
+            config_id=config_id,
+            execution_id=execution_id,
+            user_input=user_input,
+            result=execution_result,
+        )
+
+        if not execution_result["metadata"]["cache_hit"]:
+            await asyncio.to_thread(
+                store_verdict,
+                agent_config,
+                user_input,
+                saved_execution_id,
+                execution_result,
+            )
+
+        return {
+            "success": True,
+            "execution_id": saved_execution_id,
+            "result": execution_result.get("result"),
+            "metadata": execution_result.get("metadata", {}),
+        }
+
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": f"Validation error: {str(e)}",
+            "result": None,
+            "metadata": {},
+        }
+    except RuntimeError as e:
+        return {
+            "success": False,
+            "error": f"Execution error: {str(e)}",
+            "result": None,
+            "metadata": {},
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}",
+            "result": None,
+            "metadata": {},
+        }
+
+
+def stream_standalone_agent_request(
+    config_id: str, user_input: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of handle_standalone_agent_request.
+
+    Yields events as dictionaries while the agent runs (see
+    app/entity/AgentEvent.py): "token", "tool_call_started",
+    "tool_call_finished" and "iteration". The last event is either
+    "final_verdict" (with success, execution_id, result and metadata, sent
+    after the execution history is saved) or "error" (with success=False and
+    error, formatted like handle_standalone_agent_request).
+
+    Args:
+        config_id: The agent configuration ID
+        user_input: The user's input/query for the agent
+
+    Yields:
+        Event dictionaries, each with a "type" key
+    """
+    try:
+        execution_id = str(uuid.uuid4())
+
+        agent_config = get_agent_by_config_id(config_id)
+        if not agent_config:
+            yield _error_event(
+                f"Agent configuration not found for config_id: {config_id}"
+            )
+            return
+
+        # A cached verdict is sent as the only (final) event
+        cached = lookup_verdict(agent_config, user_input)
+        if cached is not None:
+            events = iter([FinalVerdict(**cached)])
+        else:
+            agent_input, seed = seed_agent_input(agent_config, user_input)
+            events = stream_agent(get_or_create_agent(agent_config), agent_input)
+
+        for event in events:
+            if isinstance(event, FinalVerdict):
+                if cached is None:
+                    event.metadata.update(cache_hit=False, seeded_from=seed)
+                execution_result = {
+                    "result": event.result,
+                    "metadata": event.metadata,
+                    "full_state": event.full_state,
+                }
+                saved_execution_id = _persist_execution_to_dynamodb(
+                    config_id=config_id,
+                    execution_id=execution_id,
+                    user_input=user_input,
+                    result=execution_result,
+                )
+                if cached is None:
+                    store_verdict(
+                        agent_config, user_input, saved_execution_id, execution_result
+                    )
+                yield {
+                    **event.to_dict(),
+                    "success": True,
+                    "execution_id": saved_execution_id,
+                }
+            else:
+                yield event.to_dict()
+
+    except ValueError as e:
+        yield _error_event(f"Validation error: {str(e)}")
+    except RuntimeError as e:
+        yield _error_event(f"Execution error: {str(e)}")
+    except Exception as e:
+        yield _error_event(f"Unexpected error: {str(e)}")
+
+
+async def astream_standalone_agent_request(
+    config_id: str, user_input: str
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async variant of stream_standalone_agent_request (blocking DynamoDB calls
+    run in worker threads).
+
+    Args:
+        config_id: The agent configuration ID
+        user_input: The user's input/query for the agent
+
+    Yields:
+        Event dictionaries, each with a "type" key
+    """
+    try:
+        execution_id = str(uuid.uuid4())
+
+        agent_config = await asyncio.to_thread(get_agent_by_config_id, config_id)
+        if not agent_config:
+            yield _error_event(
+                f"Agent configuration not found for config_id: {config_id}"
+            )
+            return
+
+        cached = await asyncio.to_thread(lookup_verdict, agent_config, user_input)
+        if cached is not None:
+            events = _single_event(FinalVerdict(**cached))
+        else:
+            agent_input, seed = await asyncio.to_thread(
+                seed_agent_input, agent_config, user_input
+            )
+            agent = await asyncio.to_thread(get_or_create_agent, agent_config)
+            events = astream_agent(agent, agent_input)
+
+        async for event in events:
+            if isinstance(event, FinalVerdict):
+                if cached is None:
+                    event.metadata.update(cache_hit=False, seeded_from=seed)
+                execution_result = {
+                    "result": event.result,
+                    "metadata": event.metadata,
+                    "full_state": event.full_state,
+                }
+                saved_execution_id = await asyncio.to_thread(
+                    _persist_execution_to_dynamodb,
+                    config_id=config_id,
+                    execution_id=execution_id,
+                    user_input=user_input,
+                    result=execution_result,
+                )
+                if cached is None:
+                    await asyncio.to_thread(
+                        store_verdict,
+                        agent_config,
+                        user_input,
+                        saved_execution_id,
+                        execution_result,
+                    )
+                yield {
+                    **event.to_dict(),
+                    "success": True,
+                    "execution_id": saved_execution_id,
+                }
+            else:
+                yield event.to_dict()
+
+    except ValueError as e:
+        yield _error_event(f"Validation error: {str(e)}")
+    except RuntimeError as e:
+        yield _error_event(f"Execution error: {str(e)}")
+    except Exception as e:
+        yield _error_event(f"Unexpected error: {str(e)}")
+
+
+async def _single_event(event: AgentEvent) -> AsyncIterator[AgentEvent]:
+    """Async iterator over one event (a cached verdict)."""
+    yield event
+
+
+def _error_event(error: str) -> Dict[str, Any]:
+    """Terminal event of a failed streaming request."""
+    return {"type": "error", "success": False, "error": error}
+
+
 def _persist_execution_to_dynamodb(
     config_id: str, execution_id: str, user_input: str, result: Dict[str, Any]
 ) -> str:
     """
     Persist agent execution to DynamoDB using execution history commands.
 
+    With write-behind enabled (EXECUTION_HISTORY_WRITE_BEHIND=true), the
+    execution is queued and written by a background thread (see
+    db_commands/execution_history_writer.py), so the request doesn't wait
+    for DynamoDB.
+
     Args:
         config_id: Agent configuration ID
         execution_id: Unique execution ID
@@ -111,6 +386,16 @@ def _persist_execution_to_dynamodb(
         execution_id where the execution was stored
     """
     from ..db_commands.execution_history_commands import save_execution_history
+    from ..db_commands.execution_history_writer import (
+        get_execution_history_writer, is_write_behind_enabled)
+
+    if is_write_behind_enabled():
+        return get_execution_history_writer().submit(
+            config_id=config_id,
+            execution_id=execution_id,
+            user_input=user_input,
+            result=result,
+        )
 
     execution_id = save_execution_history(
         config_id=config_id,
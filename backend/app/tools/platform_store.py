@@ -0,0 +1,237 @@
+"""
+Memory-mapped on-disk store for the verification platform corpus.
+
+A store is a single file holding a VerificationIndex: the sorted vocabulary,
+the BM25 postings arrays and the JSON records of the fact-checks::
+
+    b"VPSTORE1" | header length (uint64) | JSON header | 64-byte aligned arrays
+
+The file is opened with one read-only mmap and the arrays are NumPy views
+into it. Nothing is read at open time beyond the header: a lookup
+page-faults in the vocabulary pages its binary search touches, the posting
+lists of the query terms and the records it returns. Worker processes
+mapping the same file share those pages through the OS page cache.
+
+Stores are replaced atomically (os.replace), so readers keep their mapping
+of the old file while get_store_index() picks up the new one.
+
+Build a store with write_verification_store() or
+scripts/build_platform_store.py and point VERIFICATION_PLATFORM_STORE at it.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .platform_verification_tool import VerificationIndex
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"VPSTORE1"
+FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+_store_index: Optional["MappedVerificationIndex"] = None
+_store_signature: Optional[Tuple[int, int, int]] = None
+_store_checked_at = 0.0
+_store_lock = threading.Lock()
+
+
+def get_verification_store_path() -> str:
+    """Store file from VERIFICATION_PLATFORM_STORE (empty = in-memory corpus)."""
+    return os.getenv("VERIFICATION_PLATFORM_STORE", "")
+
+
+def write_verification_store(
+    entries: Dict[str, Dict[str, Any]],
+    path: str,
+    k1: float = 1.2,
+    b: float = 0.75,
+) -> None:
+    """
+    Index fact-check entries and write them as a store file.
+
+    The file is written next to ``path`` and moved into place atomically.
+
+    Args:
+        entries: Mapping of claim key terms to verification results
+        path: Store file to (re)place
+        k1: BM25 term frequency saturation
+        b: BM25 length normalisation
+    """
+    index = VerificationIndex(entries, k1=k1, b=b)
+
+    records = [
+        json.dumps({"key": key, "entry": entry}, separators=(",", ":")).encode("utf-8")
+        for key, entry in zip(index.keys, index.values)
+    ]
+    record_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(record) for record in records], out=record_offsets[1:])
+
+    arrays = {
+        "terms": np.array([term.encode("utf-8") for term in index.terms], dtype=bytes),
+        "offsets": index.offsets,
+        "doc_ids": index.doc_ids,
+        "weights": index.weights,
+        "doc_norms": index.doc_norms,
+        "record_offsets": record_offsets,
+        "records": np.frombuffer(b"".join(records), dtype=np.uint8),
+    }
+
+    # Lay the arrays out after the header, each aligned for direct mapping
+    layout = {}
+    position = 0
+    for name, array in arrays.items():
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": position,
+        }
+        position += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+    header = json.dumps(
+        {"version": FORMAT_VERSION, "entries": len(index), "arrays": layout}
+    ).encode("utf-8")
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // _ALIGNMENT) * _ALIGNMENT
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(np.uint64(len(header)).tobytes())
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(data_start + position)
+        # mkstemp creates the file owner-only; workers may run as other users
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class MappedVerificationIndex(VerificationIndex):
+    """
+    VerificationIndex backed by a memory-mapped store file.
+
+    Scoring is inherited; term lookups binary-search the mapped vocabulary
+    and records are decoded only for returned matches.
+
+    Args:
+        path: Store file written by write_verification_store
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a verification store: {path}")
+            header_length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(header_length))
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported verification store version in {path}")
+
+        self.path = path
+        self.entry_count = header["entries"]
+        data_start = -(-(len(MAGIC) + 8 + header_length) // _ALIGNMENT) * _ALIGNMENT
+        self._mmap = np.memmap(path, dtype=np.uint8, mode="r")
+
+        views = {
+            name: np.ndarray(
+                shape=tuple(spec["shape"]),
+                dtype=np.dtype(spec["dtype"]),
+                buffer=self._mmap,
+                offset=data_start + spec["offset"],
+            )
+            for name, spec in header["arrays"].items()
+        }
+        self.terms = views["terms"]
+        self.offsets = views["offsets"]
+        self.doc_ids = views["doc_ids"]
+        self.weights = views["weights"]
+        self.doc_norms = views["doc_norms"]
+        self._record_offsets = views["record_offsets"]
+        self._records = views["records"]
+
+    def __len__(self) -> int:
+        return self.entry_count
+
+    def lookup_term(self, term: str) -> Optional[int]:
+        encoded = term.encode("utf-8")
+        if not len(self.terms) or len(encoded) > self.terms.dtype.itemsize:
+            return None
+        position = int(np.searchsorted(self.terms, encoded))
+        if position < len(self.terms) and self.terms[position] == encoded:
+            return position
+        return None
+
+    def record(self, doc_id: int) -> Tuple[str, Dict[str, Any]]:
+        start, end = self._record_offsets[doc_id], self._record_offsets[doc_id + 1]
+        record = json.loads(self._records[start:end].tobytes())
+        return record["key"], record["entry"]
+
+
+def _file_signature(path: str) -> Tuple[int, int, int]:
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def get_store_index(path: str) -> MappedVerificationIndex:
+    """
+    Get the mapped index of a store file, reopening it when the file changes.
+
+    The file is checked at most every VERIFICATION_STORE_RELOAD_SECONDS
+    (default 5). If a changed file can't be opened, the previous index keeps
+    serving and the error is logged.
+
+    Args:
+        path: Store file
+
+    Returns:
+        The current MappedVerificationIndex
+
+    Raises:
+        Exception: If the store can't be opened and no previous index exists
+    """
+    global _store_index, _store_signature, _store_checked_at
+
+    reload_seconds = float(os.getenv("VERIFICATION_STORE_RELOAD_SECONDS", "5"))
+    now = time.monotonic()
+    index = _store_index
+    if (
+        index is not None
+        and index.path == path
+        and now - _store_checked_at < reload_seconds
+    ):
+        return index
+
+    with _store_lock:
+        current = _store_index
+        if current is not None and current.path != path:
+            current = None
+
+        try:
+            signature = _file_signature(path)
+            if current is None or signature != _store_signature:
+                # Recorded first, so a bad file is retried only once it changes
+                _store_signature = signature
+                current = MappedVerificationIndex(path)
+                _store_index = current
+        except Exception as e:
+            if current is None:
+                raise Exception(
+                    f"Failed to open verification store {path}: {str(e)}"
+                ) from e
+            logger.warning(f"Failed to reload verification store {path}: {str(e)}")
+
+        _store_checked_at = now
+        return current
@@ -13,10 +13,17 @@ In a real implementation, this would connect to:
 For testing, we stub it with sample data.
 """
 
-from typing import Any, Dict, Optional
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from langchain_core.tools import tool
 
+from ..entity.ToolOutput import PlatformVerificationOutput
+
 # Mock verification database - simulates a "given platform"
 # In production, this would be replaced with actual API calls
 VERIFICATION_PLATFORM_DB = {
@@ -76,9 +83,328 @@ VERIFICATION_PLATFORM_DB = {
 }
 
 
-def normalize_search_query(query: str) -> str:
-    """Normalize query for matching against database."""
-    return query.lower().strip()
+# Words too common to identify a claim. Negations ("no", "not") are kept:
+# they distinguish a claim from its debunking.
+STOPWORDS = frozenset("""
+    a about after all also am an and any are as at be been before being but by
+    can could did do does doing during for from had has have having he her here
+    hers him his how i if in into is it its itself just me more most my of on
+    once only or other our out over own same she should so some such than that
+    the their them then there these they this those through to too under until
+    up very was we were what when where which while who whom why will with would
+    you your yours breaking news report reports say says said
+    """.split())
+
+# Minimum share of a fact-check's term weight the query must cover to count
+# as a match. Unlike the former rule (60% of the key's words, at least two),
+# terms count by their BM25 weight, so a query must contain a fact-check's
+# distinctive terms: "5g covid" covers only 57% of "5g causes covid" (it lacks
+# "causes", unique to that entry) and no longer matches, while "5G networks
+# cause coronavirus" covers 71% through "5g" and the stem "caus" and does.
+MIN_MATCH_CONFIDENCE = 0.6
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_VOWELS = set("aeiouy")
+
+
+@lru_cache(maxsize=65536)
+def stem_term(term: str) -> str:
+    """
+    Light suffix-stripping stemmer (plurals, -ing/-ed/-ly, final e).
+
+    Maps inflections such as "cures", "cured" and "curing" to one stem; it
+    is not a full Porter stemmer but needs no extra dependency.
+    """
+    if len(term) <= 3 or not term.isalpha():
+        return term
+
+    if term.endswith("sses"):
+        term = term[:-2]
+    elif term.endswith("ies") and len(term) > 4:
+        term = term[:-3] + "y"
+    elif term.endswith("s") and not term.endswith(("ss", "us", "is")):
+        term = term[:-1]
+
+    for suffix in ("ing", "edly", "ed", "ly"):
+        stem = term[: -len(suffix)]
+        if term.endswith(suffix) and len(stem) >= 3 and _VOWELS & set(stem):
+            term = stem
+            if term[-1] == term[-2] and term[-1] not in _VOWELS | {"s", "z"}:
+                term = term[:-1]  # controlling -> control
+            break
+
+    if term.endswith("e") and len(term) > 3:
+        term = term[:-1]
+    return term
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split into words, drop stopwords and stem."""
+    return [
+        stem_term(token)
+        for token in _TOKEN.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+
+@dataclass
+class VerificationMatch:
+    """A ranked verification platform entry."""
+
+    key: str
+    entry: Dict[str, Any]
+    score: float  # BM25 score of the entry for the query
+    confidence: float  # Share of the entry's term weight covered by the query
+
+
+class VerificationIndex:
+    """
+    BM25 ranking over verification platform entries.
+
+    Entry keys are tokenised (stopwords removed, terms stemmed) and their BM25
+    term weights are precomputed into a term-major sparse matrix: the postings
+    of term t are doc_ids[offsets[t]:offsets[t + 1]] with matching weights. A
+    query gathers the postings of its terms and sums them per entry with
+    NumPy, so its cost depends on the postings touched, not on the number of
+    entries.
+
+    Besides its score, each candidate gets a confidence: the share of the
+    entry's total term weight found in the query. Only entries whose whole
+    claim is (mostly) present match, whatever the query's length.
+
+    Term ids follow the sorted vocabulary, so the arrays can be written to and
+    memory-mapped from disk unchanged (see tools/platform_store.py).
+
+    Args:
+        entries: Mapping of claim key terms to verification results
+        k1: BM25 term frequency saturation
+        b: BM25 length normalisation
+    """
+
+    def __init__(
+        self, entries: Dict[str, Dict[str, Any]], k1: float = 1.2, b: float = 0.75
+    ):
+        self.keys: List[str] = list(entries)
+        self.values: List[Dict[str, Any]] = list(entries.values())
+
+        key_terms = [Counter(tokenize(key)) for key in self.keys]
+        self.terms: List[str] = sorted(set().union(*key_terms))
+        self.term_ids: Dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+
+        term_column: List[int] = []
+        doc_column: List[int] = []
+        tf_column: List[int] = []
+        doc_lengths = np.zeros(len(self.keys), dtype=np.float32)
+        for doc_id, term_counts in enumerate(key_terms):
+            doc_lengths[doc_id] = sum(term_counts.values())
+            for term, tf in term_counts.items():
+                term_column.append(self.term_ids[term])
+                doc_column.append(doc_id)
+                tf_column.append(tf)
+
+        term_ids = np.array(term_column, dtype=np.int32)
+        doc_ids = np.array(doc_column, dtype=np.int32)
+        tfs = np.array(tf_column, dtype=np.float32)
+
+        document_frequency = np.bincount(term_ids, minlength=len(self.term_ids))
+        idf = np.log1p(
+            (len(self.keys) - document_frequency + 0.5) / (document_frequency + 0.5)
+        ).astype(np.float32)
+        average_length = float(doc_lengths.mean()) if len(self.keys) else 1.0
+        length_norm = 1 - b + b * doc_lengths[doc_ids] / max(average_length, 1e-9)
+        weights = idf[term_ids] * tfs * (k1 + 1) / (tfs + k1 * length_norm)
+
+        # Sort by term (stable, so each posting list is in entry order)
+        order = np.argsort(term_ids, kind="stable")
+        self.doc_ids = doc_ids[order]
+        self.weights = weights[order].astype(np.float32)
+        self.offsets = np.zeros(len(self.term_ids) + 1, dtype=np.int64)
+        np.cumsum(document_frequency, out=self.offsets[1:])
+        self.doc_norms = np.bincount(
+            doc_ids, weights=weights, minlength=len(self.keys)
+        ).astype(np.float32)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def lookup_term(self, term: str) -> Optional[int]:
+        """Term id of a (stemmed) term, or None if no entry contains it."""
+        return self.term_ids.get(term)
+
+    def record(self, doc_id: int) -> Tuple[str, Dict[str, Any]]:
+        """Key and verification result of an entry."""
+        return self.keys[doc_id], self.values[doc_id]
+
+    def search(
+        self, query: str, top_k: int = 5, min_confidence: float = 0.0
+    ) -> List[VerificationMatch]:
+        """
+        Rank entries against a query.
+
+        Args:
+            query: Claim or news text (tokenised like the entry keys)
+            top_k: Maximum number of results
+            min_confidence: Drop entries whose confidence is below this
+
+        Returns:
+            Matches by descending score (ties in entry order)
+        """
+        query_terms = {self.lookup_term(term) for term in tokenize(query)}
+        query_terms.discard(None)
+        if not query_terms or top_k <= 0:
+            return []
+
+        ranges = [(self.offsets[t], self.offsets[t + 1]) for t in query_terms]
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            docs = self.doc_ids[start:end]
+            scores = self.weights[start:end].astype(np.float64)
+        else:
+            docs, inverse = np.unique(
+                np.concatenate([self.doc_ids[s:e] for s, e in ranges]),
+                return_inverse=True,
+            )
+            scores = np.bincount(
+                inverse,
+                weights=np.concatenate([self.weights[s:e] for s, e in ranges]),
+            )
+
+        confidence = scores / self.doc_norms[docs]
+        if min_confidence > 0:
+            keep = confidence >= min_confidence - 1e-6
+            docs, scores, confidence = docs[keep], scores[keep], confidence[keep]
+
+        if len(docs) > top_k:
+            # Keep every candidate tied with the k-th score, then sort those
+            kth_score = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            keep = scores >= kth_score
+            docs, scores, confidence = docs[keep], scores[keep], confidence[keep]
+        order = np.lexsort((docs, -scores))[:top_k]
+
+        matches = []
+        for i, doc_id in zip(order.tolist(), docs[order].tolist()):
+            key, entry = self.record(doc_id)
+            matches.append(
+                VerificationMatch(
+                    key=key,
+                    entry=entry,
+                    score=float(scores[i]),
+                    confidence=min(float(confidence[i]), 1.0),
+                )
+            )
+        return matches
+
+    def match(self, query: str) -> Optional[VerificationMatch]:
+        """
+        Return the best-scoring entry with at least MIN_MATCH_CONFIDENCE.
+
+        Args:
+            query: Claim or news text
+
+        Returns:
+            Best match or None if nothing matches
+        """
+        matches = self.search(query, top_k=1, min_confidence=MIN_MATCH_CONFIDENCE)
+        return matches[0] if matches else None
+
+    def match_many(self, queries: List[str]) -> List[Optional[VerificationMatch]]:
+        """
+        Match several queries in one vectorised pass.
+
+        The postings of every query are gathered together and scored per
+        (query, entry) pair, so N claims cost one NumPy pass instead of N.
+        Each result is the same as match() would return.
+
+        Args:
+            queries: Claim or news texts
+
+        Returns:
+            Best match (or None) per query, in input order
+        """
+        owners: List[int] = []
+        ranges: List[Tuple[int, int]] = []
+        for query_id, query in enumerate(queries):
+            term_ids = {self.lookup_term(term) for term in tokenize(query)}
+            term_ids.discard(None)
+            for term_id in term_ids:
+                owners.append(query_id)
+                ranges.append((self.offsets[term_id], self.offsets[term_id + 1]))
+
+        results: List[Optional[VerificationMatch]] = [None] * len(queries)
+        if not ranges:
+            return results
+
+        lengths = np.array([end - start for start, end in ranges], dtype=np.int64)
+        docs = np.concatenate([self.doc_ids[start:end] for start, end in ranges])
+        weights = np.concatenate([self.weights[start:end] for start, end in ranges])
+        query_ids = np.repeat(np.array(owners, dtype=np.int64), lengths)
+
+        # Score every (query, entry) pair at once
+        pairs, inverse = np.unique(query_ids * len(self) + docs, return_inverse=True)
+        scores = np.bincount(inverse, weights=weights)
+        pair_queries, pair_docs = np.divmod(pairs, len(self))
+        confidence = scores / self.doc_norms[pair_docs]
+
+        keep = confidence >= MIN_MATCH_CONFIDENCE - 1e-6
+        pair_queries, pair_docs = pair_queries[keep], pair_docs[keep]
+        scores, confidence = scores[keep], confidence[keep]
+
+        # Best pair per query: highest score, ties in entry order
+        order = np.lexsort((pair_docs, -scores, pair_queries))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = pair_queries[order][1:] != pair_queries[order][:-1]
+        for i in order[first].tolist():
+            key, entry = self.record(int(pair_docs[i]))
+            results[int(pair_queries[i])] = VerificationMatch(
+                key=key,
+                entry=entry,
+                score=float(scores[i]),
+                confidence=min(float(confidence[i]), 1.0),
+            )
+        return results
+
+
+_verification_index: Optional[VerificationIndex] = None
+
+
+def get_verification_index() -> VerificationIndex:
+    """
+    Get the verification platform index.
+
+    With VERIFICATION_PLATFORM_STORE set, this is the memory-mapped store file
+    (reloaded when the file changes, see tools/platform_store.py); otherwise
+    the index over VERIFICATION_PLATFORM_DB, built on first use.
+    """
+    from .platform_store import get_store_index, get_verification_store_path
+
+    store_path = get_verification_store_path()
+    if store_path:
+        return get_store_index(store_path)
+
+    global _verification_index
+    if _verification_index is None:
+        _verification_index = VerificationIndex(VERIFICATION_PLATFORM_DB)
+    return _verification_index
+
+
+def refresh_verification_index() -> None:
+    """Rebuild the index after VERIFICATION_PLATFORM_DB has been modified."""
+    global _verification_index
+    _verification_index = VerificationIndex(VERIFICATION_PLATFORM_DB)
+
+
+def load_verification_entries(entries: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Add fact-check entries to the in-memory verification platform and reindex.
+
+    Not used while VERIFICATION_PLATFORM_STORE is set: rebuild the store file
+    instead (scripts/build_platform_store.py).
+
+    Args:
+        entries: Mapping of claim key terms to verification results
+    """
+    VERIFICATION_PLATFORM_DB.update(entries)
+    refresh_verification_index()
 
 
 def search_in_verification_platform(query: str) -> Optional[Dict[str, Any]]:
@@ -96,20 +422,21 @@ def search_in_verification_platform(query: str) -> Optional[Dict[str, Any]]:
     Returns:
         Verification result or None if not found
     """
-    normalized_query = normalize_search_query(query)
+    match = match_in_verification_platform(query)
+    return match.entry if match else None
 
-    # Check for partial matches in our database
-    for key, value in VERIFICATION_PLATFORM_DB.items():
-        # Check if key terms match
-        key_terms = key.split()
-        query_terms = normalized_query.split()
 
-        # If most key terms are in the query, consider it a match
-        matches = sum(1 for term in key_terms if term in query_terms)
-        if matches >= max(2, len(key_terms) * 0.6):  # At least 60% match
-            return value
+def match_in_verification_platform(query: str) -> Optional[VerificationMatch]:
+    """
+    Find the best-ranked verification platform entry for a claim.
 
-    return None
+    Args:
+        query: The claim or news to verify
+
+    Returns:
+        Best match (entry, BM25 score and confidence) or None if not found
+    """
+    return get_verification_index().match(query)
 
 
 @tool
@@ -135,9 +462,9 @@ def verify_on_platform(claim: str) -> str:
         - Supporting evidence and URLs
         - Confidence level
     """
-    result = search_in_verification_platform(claim)
+    match = match_in_verification_platform(claim)
 
-    if result is None:
+    if match is None:
         return f"""PLATFORM VERIFICATION RESULT:
 Status: UNVERIFIED
 Message: This claim was not found in the verification platform database.
@@ -149,12 +476,14 @@ Recommendation: Cannot verify this claim on the dedicated platform. The claim ma
 Without verification from the platform, treat this claim with caution."""
 
     # Format the verification result
+    result = match.entry
     status_emoji = "✅" if result["status"] == "TRUE" else "❌"
 
     output = f"""PLATFORM VERIFICATION RESULT:
 {status_emoji} Status: {result['status']}
 Verified By: {result['verified_by']}
 Confidence: {result['confidence']}
+Match Confidence: {match.confidence:.0%} (matched fact-check: "{match.key}")
 
 Summary:
 {result['summary']}
@@ -168,6 +497,106 @@ Summary:
     return output
 
 
+# Claims accepted per verify_claims_on_platform call
+MAX_BULK_CLAIMS = 50
+
+
+@tool
+def verify_claims_on_platform(claims: List[str]) -> Any:
+    """
+    Verify several claims against the trusted verification platform at once.
+
+    Use this instead of calling verify_on_platform repeatedly when an article
+    contains multiple distinct claims: pass every claim in one call.
+
+    Args:
+        claims: The claims, headlines or statements to verify (at most 50)
+
+    Returns:
+        JSON list with one object per claim, in input order: claim, status
+        (TRUE/FALSE/UNVERIFIED) and, when found, match_confidence,
+        matched_fact_check, verified_by, source_confidence and summary
+    """
+    if len(claims) > MAX_BULK_CLAIMS:
+        return (
+            f"Error: at most {MAX_BULK_CLAIMS} claims per call "
+            f"(got {len(claims)}); split them into several calls."
+        )
+
+    matches = get_verification_index().match_many(claims)
+    return [
+        build_verification_output(match, claim).to_dict()
+        for claim, match in zip(claims, matches)
+    ]
+
+
+def build_verification_output(
+    match: Optional[VerificationMatch], claim: Optional[str] = None
+) -> PlatformVerificationOutput:
+    """
+    Build the structured result of a platform lookup.
+
+    Args:
+        match: Best match, or None if the claim was not found
+        claim: The verified claim (included for multi-claim results)
+
+    Returns:
+        PlatformVerificationOutput (status UNVERIFIED when not found)
+    """
+    if match is None:
+        return PlatformVerificationOutput(status="UNVERIFIED", claim=claim)
+
+    result = match.entry
+    return PlatformVerificationOutput(
+        status=result["status"],
+        claim=claim,
+        match_confidence=round(match.confidence, 2),
+        matched_fact_check=match.key,
+        verified_by=result["verified_by"],
+        source_confidence=result["confidence"],
+        summary=result["summary"],
+        sources=list(result.get("source_urls", [])),
+    )
+
+
+@lru_cache(maxsize=4)
+def create_platform_verification_tool(output_format: str = "text") -> Any:
+    """
+    Get the verify_on_platform tool for an output format.
+
+    Args:
+        output_format: "text" (formatted report) or "json" (a compact
+            PlatformVerificationOutput payload)
+
+    Returns:
+        LangChain tool named "verify_on_platform"
+    """
+    if output_format != "json":
+        return verify_on_platform
+
+    @tool
+    def verify_on_platform_json(claim: str) -> Dict[str, Any]:
+        """
+        Verify a claim or news article against the trusted verification platform.
+
+        This tool searches a dedicated fact-checking and verification database
+        to determine if the claim has been verified or debunked.
+
+        Args:
+            claim: The claim, news headline, or statement to verify
+
+        Returns:
+            JSON object: status (TRUE/FALSE/UNVERIFIED) and, when found,
+            match_confidence, matched_fact_check, verified_by,
+            source_confidence, summary and sources
+        """
+        match = match_in_verification_platform(claim)
+        return build_verification_output(match).to_dict()
+
+    verify_on_platform_json.name = "verify_on_platform"
+    return verify_on_platform_json
+
+
 # Export for tool registration
 def get_platform_verification_tool():
     """Get the platform verification tool for agent use."""
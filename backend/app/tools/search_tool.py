@@ -1,9 +1,68 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict
 
-import requests
 from bs4 import BeautifulSoup
 from langchain_core.tools import tool
 
+from ..entity.ToolOutput import WebSearchOutput
+from ..utils.http_cache import fetch_url
+
+
+def search_page(url: str, keyword: str) -> WebSearchOutput:
+    """
+    Fetch a page and find the context around a keyword.
+
+    Args:
+        url: The URL to fetch and search
+        keyword: The keyword or phrase to search for in the content
+
+    Returns:
+        WebSearchOutput with the keyword context (500 chars either side), or
+        the first 1000 chars of the page if the keyword is not found
+
+    Raises:
+        Exception: If the page cannot be fetched or parsed
+    """
+    # Fetch the URL (pooled connection, cached per URL honouring
+    # ETag/Last-Modified/Cache-Control, see utils/http_cache.py)
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    response = fetch_url(url, headers=headers, timeout=10)
+
+    # Parse HTML content
+    soup = BeautifulSoup(response.content, "html.parser")
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Get text
+    text = soup.get_text()
+
+    # Clean up whitespace
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = " ".join(chunk for chunk in chunks if chunk)
+
+    # Search for keyword
+    keyword_pos = text.lower().find(keyword.lower())
+    if keyword_pos >= 0:
+        # Find context around keyword (500 chars before and after)
+        start = max(0, keyword_pos - 500)
+        end = min(len(text), keyword_pos + len(keyword) + 500)
+    else:
+        start, end = 0, min(len(text), 1000)
+
+    return WebSearchOutput(
+        url=url,
+        keyword=keyword,
+        found=keyword_pos >= 0,
+        snippet=text[start:end],
+        snippet_offsets=[start, end],
+        text_length=len(text),
+    )
+
 
 @tool
 def search_internet(url: str, keyword: str) -> str:
@@ -18,38 +77,48 @@ def search_internet(url: str, keyword: str) -> str:
         Text result containing the keyword context or full content
     """
     try:
-        # Fetch the URL
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        # Parse HTML content
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Get text
-        text = soup.get_text()
-
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = " ".join(chunk for chunk in chunks if chunk)
-
-        # Search for keyword
-        if keyword.lower() in text.lower():
-            # Find context around keyword (500 chars before and after)
-            keyword_pos = text.lower().find(keyword.lower())
-            start = max(0, keyword_pos - 500)
-            end = min(len(text), keyword_pos + len(keyword) + 500)
-            context = text[start:end]
-            return f"Found '{keyword}' in URL {url}:\n\n{context}"
-        else:
-            return f"Keyword '{keyword}' not found in {url}. Returning first 1000 chars:\n\n{text[:1000]}"
-
+        result = search_page(url, keyword)
     except Exception as e:
         return f"Error searching {url}: {str(e)}"
+
+    if result.found:
+        return f"Found '{keyword}' in URL {url}:\n\n{result.snippet}"
+    return f"Keyword '{keyword}' not found in {url}. Returning first 1000 chars:\n\n{result.snippet}"
+
+
+@lru_cache(maxsize=4)
+def create_search_tool(output_format: str = "text") -> Any:
+    """
+    Get the search_internet tool for an output format.
+
+    Args:
+        output_format: "text" (formatted report) or "json" (a compact
+            WebSearchOutput payload)
+
+    Returns:
+        LangChain tool named "search_internet"
+    """
+    if output_format != "json":
+        return search_internet
+
+    @tool
+    def search_internet_json(url: str, keyword: str) -> Any:
+        """
+        Search the internet by fetching content from a URL and looking for a keyword.
+
+        Args:
+            url: The URL to fetch and search
+            keyword: The keyword or phrase to search for in the content
+
+        Returns:
+            JSON object: url, keyword, found, snippet (context around the
+            keyword, or the start of the page), snippet_offsets and
+            text_length
+        """
+        try:
+            return search_page(url, keyword).to_dict()
+        except Exception as e:
+            return f"Error searching {url}: {str(e)}"
+
+    search_internet_json.name = "search_internet"
+    return search_internet_json
@@ -1,35 +1,139 @@
+import hashlib
+import logging
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
 
+from ..utils.ttl_cache import TTLCache
 
-@tool
-def summary_long_text(text: str, max_length: int = 500) -> str:
+logger = logging.getLogger(__name__)
+
+# Summariser used when the agent config doesn't set one
+DEFAULT_SUMMARY_LLM_PROVIDER = "anthropic"
+DEFAULT_SUMMARY_MODEL_ID = "claude-3-haiku-20240307"
+
+_summary_cache: Optional[TTLCache] = None
+
+
+def get_summary_cache() -> TTLCache:
+    """
+    Get the in-memory LRU of summaries.
+
+    Configured by SUMMARY_CACHE_MAX_SIZE (default 1024) and
+    SUMMARY_CACHE_TTL_SECONDS (default 86400; 0 disables expiry). Set
+    SUMMARY_CACHE_TABLE to also persist summaries in DynamoDB.
+    """
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = TTLCache(
+            max_size=int(os.getenv("SUMMARY_CACHE_MAX_SIZE", "1024")),
+            ttl_seconds=float(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "86400")),
+        )
+    return _summary_cache
+
+
+def get_summary_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters for the in-memory summary cache."""
+    return get_summary_cache().stats()
+
+
+def compute_summary_cache_key(
+    text: str, max_length: int, llm_provider: str, model_id: str
+) -> str:
+    """Cache key: content hash plus the parameters that change the summary."""
+    content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{content_hash}:{max_length}:{llm_provider}:{model_id}"
+
+
+def resolve_summary_model(
+    llm_provider: Optional[str] = None, model_id: Optional[str] = None
+) -> tuple:
+    """
+    Resolve the summariser model, falling back to SUMMARY_LLM_PROVIDER /
+    SUMMARY_MODEL_ID and then to the built-in defaults.
+    """
+    return (
+        llm_provider
+        or os.getenv("SUMMARY_LLM_PROVIDER")
+        or DEFAULT_SUMMARY_LLM_PROVIDER,
+        model_id or os.getenv("SUMMARY_MODEL_ID") or DEFAULT_SUMMARY_MODEL_ID,
+    )
+
+
+def _load_persisted_summary(cache_key: str) -> Optional[str]:
+    from ..db_commands.summary_commands import (get_summaries_table_name,
+                                                load_summary)
+
+    if not get_summaries_table_name():
+        return None
+    try:
+        return load_summary(cache_key)
+    except Exception as e:
+        # The persistent tier is an optimisation; fall back to the LLM
+        logger.warning(str(e))
+        return None
+
+
+def _persist_summary(
+    cache_key: str, summary: str, model_id: str, max_length: int
+) -> None:
+    from ..db_commands.summary_commands import (get_summaries_table_name,
+                                                save_summary)
+
+    if not get_summaries_table_name():
+        return
+    try:
+        ttl_seconds = int(float(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "86400")))
+        save_summary(cache_key, summary, model_id, max_length, ttl_seconds or None)
+    except Exception as e:
+        logger.warning(str(e))
+
+
+def summarize_text(
+    text: str,
+    max_length: int = 500,
+    llm_provider: Optional[str] = None,
+    model_id: Optional[str] = None,
+) -> str:
     """
-    Summarize long text to manage context window.
-    Use this tool when you encounter articles or text longer than 1000 characters.
+    Summarize text with the given model, memoising the result.
+
+    Summaries are cached by content hash, max_length and model in an
+    in-memory LRU, and optionally in DynamoDB (SUMMARY_CACHE_TABLE), so an
+    article seen again (e.g. a viral post) is summarised only once.
 
     Args:
         text: The long text to summarize
-        max_length: Maximum length of summary in words (default: 500)
+        max_length: Maximum length of summary in words
+        llm_provider: Summariser provider (see resolve_summary_model)
+        model_id: Summariser model (see resolve_summary_model)
 
     Returns:
-        A concise summary of the text
+        A concise summary of the text (or a truncated fallback if the LLM fails)
     """
     if not text or len(text) < 1000:
         return text
 
+    llm_provider, model_id = resolve_summary_model(llm_provider, model_id)
+    cache_key = compute_summary_cache_key(text, max_length, llm_provider, model_id)
+
+    cache = get_summary_cache()
+    summary = cache.get(cache_key)
+    if summary is not None:
+        return summary
+
+    summary = _load_persisted_summary(cache_key)
+    if summary is not None:
+        cache.set(cache_key, summary)
+        return summary
+
     try:
-        # Initialize LLM for summarization (using faster/cheaper model)
-        # TODO: Configure model from environment
-        llm = ChatAnthropic(
-            model="claude-3-haiku-20240307",
-            temperature=0,
-            api_key=os.getenv("ANTHROPIC_API_KEY"),
-        )
+        from ..agents.llm_factory import get_shared_llm
+
+        # Client is created once per model and reused across calls
+        llm = get_shared_llm(llm_provider, model_id, 0.0, 4096)
 
         prompt = f"""Summarize the following text in {max_length} words or less. 
 Focus on key facts, claims, and important details.
@@ -42,9 +146,50 @@ Summary:"""
         response = llm.invoke(prompt)
         summary = response.content
 
-        return summary
-
     except Exception as e:
-        # Fallback: return first N characters if LLM fails
+        # Fallback: return first N characters if LLM fails (not cached)
         fallback_length = max_length * 5  # Roughly 5 chars per word
         return f"[Summary unavailable: {str(e)}]\n\nFirst {fallback_length} chars:\n{text[:fallback_length]}..."
+
+    cache.set(cache_key, summary)
+    _persist_summary(cache_key, summary, model_id, max_length)
+    return summary
+
+
+@lru_cache(maxsize=16)
+def create_summary_tool(
+    llm_provider: Optional[str] = None, model_id: Optional[str] = None
+) -> Any:
+    """
+    Create the summary_long_text tool bound to a summariser model.
+
+    Tools are cached per model, so agents sharing a summariser share one tool.
+
+    Args:
+        llm_provider: Summariser provider (defaults via resolve_summary_model)
+        model_id: Summariser model (defaults via resolve_summary_model)
+
+    Returns:
+        LangChain tool named "summary_long_text"
+    """
+
+    @tool
+    def summary_long_text(text: str, max_length: int = 500) -> str:
+        """
+        Summarize long text to manage context window.
+        Use this tool when you encounter articles or text longer than 1000 characters.
+
+        Args:
+            text: The long text to summarize
+            max_length: Maximum length of summary in words (default: 500)
+
+        Returns:
+            A concise summary of the text
+        """
+        return summarize_text(text, max_length, llm_provider, model_id)
+
+    return summary_long_text
+
+
+# Default tool (summariser from SUMMARY_LLM_PROVIDER / SUMMARY_MODEL_ID)
+summary_long_text = create_summary_tool()
@@ -1,6 +1,13 @@
-from typing import Any, Dict, List
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.utils.function_calling import convert_to_openai_tool
 
 from ..entity.AgentConfig import AgentConfig
+from ..utils.ttl_cache import TTLCache
+
+# Converted tool schemas per tool set, shared by every agent using that set
+_tool_schema_cache = TTLCache(max_size=64, ttl_seconds=None)
 
 
 def load_mcp_tools(tool_names: List[str]) -> Dict[str, Any]:
@@ -20,25 +27,64 @@ def load_mcp_tools(tool_names: List[str]) -> Dict[str, Any]:
     return {}
 
 
-def load_custom_tools(tool_names: List[str]) -> Dict[str, Any]:
+def resolve_tool_output_format(output_format: Optional[str] = None) -> str:
+    """
+    Resolve the output format of search_internet and verify_on_platform.
+
+    Args:
+        output_format: "text" or "json" (falls back to TOOL_OUTPUT_FORMAT,
+            then "text")
+
+    Returns:
+        "text" or "json"
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    output_format = (output_format or os.getenv("TOOL_OUTPUT_FORMAT") or "text").lower()
+    if output_format not in ("text", "json"):
+        raise ValueError(f"Unsupported tool output format: {output_format}")
+    return output_format
+
+
+def load_custom_tools(
+    tool_names: List[str], agent_config: Optional[AgentConfig] = None
+) -> Dict[str, Any]:
     """
     Load custom/internal tools.
 
     Args:
         tool_names: List of custom tool names to load
+        agent_config: Agent configuration; selects the summariser model used
+            by summary_long_text and the tool output format (environment
+            defaults if None)
 
     Returns:
         Dictionary of loaded custom tools
     """
-    from .platform_verification_tool import verify_on_platform
-    from .search_tool import search_internet
-    from .summary_tool import summary_long_text
+    from .platform_verification_tool import (create_platform_verification_tool,
+                                             verify_claims_on_platform)
+    from .search_tool import create_search_tool
+    from .summary_tool import create_summary_tool, summary_long_text
+
+    if agent_config is not None:
+        summary_long_text = create_summary_tool(
+            agent_config.summary_llm_provider or None,
+            agent_config.summary_model_id or None,
+        )
+
+    output_format = resolve_tool_output_format(
+        agent_config.tool_output_format if agent_config is not None else None
+    )
+    search_internet = create_search_tool(output_format)
+    verify_on_platform = create_platform_verification_tool(output_format)
 
     # Available custom tools
     available_tools = {
         "search_internet": search_internet,
         "summary_long_text": summary_long_text,
         "verify_on_platform": verify_on_platform,
+        "verify_claims_on_platform": verify_claims_on_platform,
     }
 
     # Filter by requested tool names, or return all if empty
@@ -71,7 +117,42 @@ def gather_agent_tools(agent_config: AgentConfig) -> Dict[str, Any]:
     all_tools.update(mcp_tools)
 
     # Load custom tools
-    custom_tools = load_custom_tools(agent_config.tools)
+    custom_tools = load_custom_tools(agent_config.tools, agent_config)
     all_tools.update(custom_tools)
 
     return all_tools
+
+
+def get_tool_set_signature(tools: Dict[str, Any]) -> Tuple[Tuple[str, int], ...]:
+    """
+    Identify a tool set by tool name and tool object identity.
+
+    Tool objects are module-level singletons (or cached per configuration),
+    so agents built from the same tools share a signature.
+    """
+    return tuple((name, id(tool)) for name, tool in tools.items())
+
+
+def get_tool_schemas(tools: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Get the tool definitions to bind to an LLM, converting each tool set once.
+
+    The returned OpenAI-format function schemas are accepted by bind_tools of
+    every supported provider, so the (pydantic) schema generation runs once
+    per tool set instead of on every agent construction.
+
+    Args:
+        tools: Dictionary of tools (as returned by gather_agent_tools)
+
+    Returns:
+        List of tool schemas, in the order of ``tools``
+    """
+    signature = get_tool_set_signature(tools)
+
+    def convert() -> Tuple[List[Any], List[Dict[str, Any]]]:
+        # Keep the tool objects alive so their ids are not reused while cached
+        tool_list = list(tools.values())
+        return tool_list, [convert_to_openai_tool(tool) for tool in tool_list]
+
+    _, schemas = _tool_schema_cache.get_or_set(signature, convert)
+    return schemas
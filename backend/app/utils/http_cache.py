@@ -0,0 +1,545 @@
+"""
+Pooled HTTP session and response cache for tools that fetch web pages.
+
+Agents often fetch the same news URLs for many claims within a few minutes.
+All fetches go through one ``requests.Session``, so keep-alive connections are
+reused. Responses are cached per URL following the server's caching headers:
+
+- ``Cache-Control: no-store`` responses are never cached
+- Fresh entries (``s-maxage`` / ``max-age`` / ``Expires``, or a heuristic based
+  on ``Last-Modified``) are served without a request
+- Stale entries with an ``ETag`` or ``Last-Modified`` are revalidated with a
+  conditional GET; a ``304 Not Modified`` reuses the cached body
+
+The memory tier is an LRU bounded by entry count and total bytes. An optional
+disk tier (``HTTP_CACHE_DIR``) keeps entries across cold starts and processes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Response headers kept with a cached entry
+_STORED_HEADERS = (
+    "Cache-Control",
+    "Content-Type",
+    "Date",
+    "ETag",
+    "Expires",
+    "Last-Modified",
+)
+
+# Disk tier writes between directory rescans, which pick up the files written
+# by other processes sharing the directory
+DISK_RESCAN_EVERY = 100
+
+_session: Optional[requests.Session] = None
+_http_cache: Optional["HTTPResponseCache"] = None
+_lock = threading.Lock()
+
+
+@dataclass
+class CachedResponse:
+    """A fetched (or cached) HTTP response body with its caching metadata."""
+
+    url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = 0.0
+    expires_at: float = 0.0
+    from_cache: bool = False
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def has_validators(self) -> bool:
+        return "ETag" in self.headers or "Last-Modified" in self.headers
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into {directive: argument}."""
+    directives = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, argument = part.partition("=")
+        directives[name.strip().lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    """Parse an HTTP date header into a POSIX timestamp (None if invalid)."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def freshness_lifetime(
+    headers: Dict[str, str], now: float, heuristic_max_seconds: float = 300
+) -> Optional[float]:
+    """
+    Seconds a response may be served without revalidation.
+
+    Args:
+        headers: Response headers
+        now: Current time (POSIX timestamp)
+        heuristic_max_seconds: Cap for the Last-Modified heuristic
+
+    Returns:
+        Lifetime in seconds (0 = must revalidate), or None if the response
+        must not be stored
+    """
+    cache_control = _parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+
+    age = 0.0
+    try:
+        age = max(0.0, float(headers.get("Age", 0)))
+    except ValueError:
+        pass
+
+    for directive in ("s-maxage", "max-age"):
+        if cache_control.get(directive):
+            try:
+                return max(0.0, float(cache_control[directive]) - age)
+            except ValueError:
+                return 0.0
+
+    date = _parse_http_date(headers.get("Date")) or now
+    expires = headers.get("Expires")
+    if expires is not None:
+        expires_at = _parse_http_date(expires)
+        # Invalid Expires values (e.g. "0") mean "already expired"
+        return max(0.0, expires_at - date) if expires_at else 0.0
+
+    # Heuristic freshness (RFC 9111 4.2.2): 10% of the time since modification
+    last_modified = _parse_http_date(headers.get("Last-Modified"))
+    if last_modified and "must-revalidate" not in cache_control:
+        return min(max(0.0, (date - last_modified) * 0.1), heuristic_max_seconds)
+
+    return 0.0
+
+
+class _DiskTier:
+    """
+    On-disk cache entries: ``<sha256(url)>.json`` metadata plus a ``.body`` file.
+
+    Writes are atomic (temp file + rename), so several worker processes can
+    share one directory. The oldest files are pruned above ``max_bytes``. The
+    directory size is tracked in memory: set() only lists the directory when
+    the tracked size goes over ``max_bytes``, or every DISK_RESCAN_EVERY
+    writes to account for other processes' files.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes_since_scan = 0
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    def _paths(self, url: str):
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, digest)
+        return base + ".json", base + ".body"
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != url or meta.get("size") != len(content):
+            return None
+
+        return CachedResponse(
+            url=url,
+            status_code=meta["status_code"],
+            content=content,
+            headers=meta.get("headers", {}),
+            stored_at=meta.get("stored_at", 0.0),
+            expires_at=meta.get("expires_at", 0.0),
+        )
+
+    def set(self, entry: CachedResponse) -> None:
+        meta_path, body_path = self._paths(entry.url)
+        meta = asdict(entry)
+        meta.pop("content")
+        meta.pop("from_cache")
+        meta["size"] = entry.size
+
+        # Body first: a reader never sees metadata without its body
+        meta_data = json.dumps(meta).encode("utf-8")
+        self._write_atomic(body_path, entry.content)
+        self._write_atomic(meta_path, meta_data)
+
+        with self._lock:
+            # Overwrites are counted twice until the next scan; that only
+            # makes the next prune come early
+            self._total_bytes += len(entry.content) + len(meta_data)
+            self._writes_since_scan += 1
+            due = (
+                self._total_bytes > self.max_bytes
+                or self._writes_since_scan >= DISK_RESCAN_EVERY
+            )
+        if due:
+            self._prune()
+
+    def _scan(self):
+        """(mtime, size, path) of every file in the directory."""
+        files = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _prune(self) -> None:
+        """Remove the oldest files above max_bytes and resync the tracked size."""
+        files = self._scan()
+        total = sum(size for _, size, _ in files)
+
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+        with self._lock:
+            self._total_bytes = total
+            self._writes_since_scan = 0
+
+
+class HTTPResponseCache:
+    """
+    Two-tier HTTP response cache keyed on URL.
+
+    Args:
+        max_entries: Maximum number of responses kept in memory
+        max_bytes: Maximum total body size kept in memory
+        disk_dir: Directory for the on-disk tier (disabled if None)
+        disk_max_bytes: Maximum total size of the on-disk tier
+        heuristic_max_seconds: Cap for Last-Modified heuristic freshness
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+        heuristic_max_seconds: float = 300,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.heuristic_max_seconds = heuristic_max_seconds
+        self._disk = _DiskTier(disk_dir, disk_max_bytes) if disk_dir else None
+        self._memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+
+        self.requests = 0
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.bytes_saved = 0
+        self.bytes_downloaded = 0
+
+    def _lookup(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+                return entry
+
+        if self._disk is None:
+            return None
+
+        entry = self._disk.get(url)
+        if entry is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._store_in_memory(entry)
+        return entry
+
+    def _store_in_memory(self, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._memory.pop(entry.url, None)
+            if previous is not None:
+                self._memory_bytes -= previous.size
+
+            self._memory[entry.url] = entry
+            self._memory_bytes += entry.size
+
+            while self._memory and (
+                len(self._memory) > self.max_entries
+                or self._memory_bytes > self.max_bytes
+            ):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted.size
+
+    def _store(self, entry: CachedResponse) -> None:
+        self._store_in_memory(entry)
+        if self._disk is not None:
+            try:
+                self._disk.set(entry)
+            except OSError:
+                # The disk tier is best effort; the memory tier still works
+                pass
+
+    def fetch(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+    ) -> CachedResponse:
+        """
+        GET a URL through the cache.
+
+        Args:
+            url: The URL to fetch
+            session: Session to use (the shared pooled session if None)
+            headers: Extra request headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            CachedResponse (``from_cache`` is True for fresh hits and 304s)
+
+        Raises:
+            requests.RequestException: If the request fails or returns an
+                error status
+        """
+        session = session or get_http_session()
+        now = time.time()
+
+        with self._lock:
+            self.requests += 1
+
+        entry = self._lookup(url)
+        if entry is not None and entry.is_fresh(now):
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += entry.size
+            return CachedResponse(**{**asdict(entry), "from_cache": True})
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if "ETag" in entry.headers:
+                request_headers["If-None-Match"] = entry.headers["ETag"]
+            if "Last-Modified" in entry.headers:
+                request_headers["If-Modified-Since"] = entry.headers["Last-Modified"]
+
+        response = session.get(url, headers=request_headers, timeout=timeout)
+
+        if entry is not None and response.status_code == 304:
+            # Not modified: refresh the stored headers and reuse the body
+            merged_headers = {**entry.headers, **_stored_headers(response.headers)}
+            lifetime = freshness_lifetime(
+                {**merged_headers, "Age": response.headers.get("Age", "0")},
+                now,
+                self.heuristic_max_seconds,
+            )
+            refreshed = CachedResponse(
+                url=url,
+                status_code=entry.status_code,
+                content=entry.content,
+                headers=merged_headers,
+                stored_at=now,
+                expires_at=now + (lifetime or 0.0),
+            )
+            self._store(refreshed)
+            with self._lock:
+                self.revalidations += 1
+                self.bytes_saved += entry.size
+            return CachedResponse(**{**asdict(refreshed), "from_cache": True})
+
+        response.raise_for_status()
+
+        fetched = CachedResponse(
+            url=url,
+            status_code=response.status_code,
+            content=response.content,
+            headers=_stored_headers(response.headers),
+            stored_at=now,
+        )
+        with self._lock:
+            self.misses += 1
+            self.bytes_downloaded += fetched.size
+
+        lifetime = freshness_lifetime(response.headers, now, self.heuristic_max_seconds)
+        if response.status_code == 200 and lifetime is not None:
+            fetched.expires_at = now + lifetime
+            # Entries that are neither fresh nor revalidatable are useless
+            if lifetime > 0 or fetched.has_validators():
+                self._store(fetched)
+
+        return fetched
+
+    def clear(self) -> None:
+        """Drop the memory tier (the disk tier is left in place)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache statistics.
+
+        ``hit_rate`` counts fresh hits and successful revalidations (304);
+        ``bytes_saved`` is the body size not downloaded thanks to the cache.
+        """
+        with self._lock:
+            served = self.hits + self.revalidations
+            return {
+                "requests": self.requests,
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": served / self.requests if self.requests else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "bytes_downloaded": self.bytes_downloaded,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+def _stored_headers(headers: Any) -> Dict[str, str]:
+    """Keep the caching-relevant subset of the response headers."""
+    stored = {name: headers[name] for name in _STORED_HEADERS if name in headers}
+    stored.setdefault("Date", formatdate(usegmt=True))
+    return stored
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the shared pooled HTTP session.
+
+    Configured by HTTP_POOL_MAXSIZE (connections kept per host, default 32)
+    and HTTP_MAX_RETRIES (retries on connection errors and 502/503/504,
+    default 2).
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                retry = Retry(
+                    total=int(os.getenv("HTTP_MAX_RETRIES", "2")),
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=("GET", "HEAD"),
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "32")),
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def get_http_cache() -> HTTPResponseCache:
+    """
+    Get the process-wide HTTP response cache.
+
+    Configured by HTTP_CACHE_MAX_ENTRIES (default 512), HTTP_CACHE_MAX_BYTES
+    (default 32 MiB), HTTP_CACHE_DIR (enables the disk tier),
+    HTTP_CACHE_DISK_MAX_BYTES (default 256 MiB) and
+    HTTP_CACHE_HEURISTIC_MAX_SECONDS (default 300).
+    """
+    global _http_cache
+    if _http_cache is None:
+        with _lock:
+            if _http_cache is None:
+                _http_cache = HTTPResponseCache(
+                    max_entries=int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "512")),
+                    max_bytes=int(
+                        os.getenv("HTTP_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+                    ),
+                    disk_dir=os.getenv("HTTP_CACHE_DIR") or None,
+                    disk_max_bytes=int(
+                        os.getenv("HTTP_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024))
+                    ),
+                    heuristic_max_seconds=float(
+                        os.getenv("HTTP_CACHE_HEURISTIC_MAX_SECONDS", "300")
+                    ),
+                )
+    return _http_cache
+
+
+def fetch_url(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10
+) -> CachedResponse:
+    """
+    GET a URL with the shared pooled session and response cache.
+
+    Args:
+        url: The URL to fetch
+        headers: Extra request headers
+        timeout: Request timeout in seconds
+
+    Returns:
+        CachedResponse with the body in ``content``
+
+    Raises:
+        requests.RequestException: If the request fails
+    """
+    return get_http_cache().fetch(url, headers=headers, timeout=timeout)
+
+
+def get_http_cache_stats() -> Dict[str, Any]:
+    """Return hit rate and bytes saved by the HTTP response cache."""
+    return get_http_cache().stats()
@@ -0,0 +1,276 @@
+"""
+MinHash + LSH index for near-duplicate text detection.
+
+Texts are shingled into overlapping character k-grams, summarised by a MinHash
+signature (the fraction of equal signature slots estimates the Jaccard
+similarity of two shingle sets) and bucketed by LSH banding: the signature is
+cut into ``bands`` bands of ``rows`` slots and two texts become candidates if
+any band is identical. Candidates are then ranked by their estimated
+similarity, so a query touches a handful of entries instead of the whole
+index.
+
+Shingling, MinHashing, band hashing and candidate scoring are NumPy-vectorised.
+Entries can be added and removed incrementally, and the index can be
+snapshotted to / restored from a ``.npz`` file.
+"""
+
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Universal hashing (a * x + b) mod p with a Mersenne prime; x, a and b are
+# 32-bit so a * x + b fits in uint64 without overflow.
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+# Odd multiplier (from splitmix64) folding a 64-bit shingle into 32 bits
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+_SNAPSHOT_VERSION = 1
+
+
+class MinHashLSHIndex:
+    """
+    Incrementally updatable near-duplicate index over short texts.
+
+    With ``bands`` bands of ``rows`` rows, pairs with Jaccard similarity s
+    become candidates with probability 1 - (1 - s^rows)^bands; the default
+    32 x 4 finds pairs above ~0.5 almost surely and rarely pairs below ~0.2.
+
+    Args:
+        num_perm: MinHash signature length (must equal bands * rows)
+        bands: Number of LSH bands
+        shingle_size: Characters per shingle (at most 8)
+        seed: Seed of the hash permutations (snapshots keep it)
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        if not 1 <= shingle_size <= 8:
+            raise ValueError("shingle_size must be between 1 and 8")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._band_coefficients = rng.integers(
+            1, 1 << 63, size=self.rows, dtype=np.uint64
+        ) | np.uint64(1)
+        self._byte_weights = np.array(
+            [256**i for i in range(shingle_size - 1, -1, -1)], dtype=np.uint64
+        )
+
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._keys: List[str] = []
+        self._rows_by_key: Dict[str, int] = {}
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows_by_key
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Unique character k-grams of ``text`` as 64-bit integers."""
+        data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+        if data.size == 0:
+            return np.empty(0, dtype=np.uint64)
+        if data.size < self.shingle_size:
+            # Short texts are a single (zero-padded) shingle
+            data = np.pad(data, (0, self.shingle_size - data.size))
+
+        windows = np.lib.stride_tricks.sliding_window_view(data, self.shingle_size)
+        return np.unique(windows.astype(np.uint64) @ self._byte_weights)
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature (``num_perm`` uint32 values) of ``text``."""
+        shingles = self.shingles(text)
+        if shingles.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+
+        with np.errstate(over="ignore"):
+            hashed = (shingles * _MIX) >> np.uint64(32)
+        permuted = (np.outer(hashed, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0).astype(np.uint32)
+
+    def _band_hashes(self, signatures: np.ndarray) -> np.ndarray:
+        """One 64-bit hash per band for each signature row, shape (n, bands)."""
+        banded = signatures.reshape(-1, self.bands, self.rows).astype(np.uint64)
+        with np.errstate(over="ignore"):
+            return banded @ self._band_coefficients
+
+    def add(self, key: str, text: str) -> bool:
+        """
+        Index ``text`` under ``key``.
+
+        Returns:
+            False if ``key`` was already indexed (the entry is kept as is)
+        """
+        signature = self.signature(text)
+        with self._lock:
+            if key in self._rows_by_key:
+                return False
+            self._append(np.array([signature]), [key])
+            return True
+
+    def remove(self, key: str) -> bool:
+        """
+        Drop ``key`` from the index.
+
+        The last row moves into the freed slot, so removal only touches the
+        buckets of those two rows.
+
+        Returns:
+            False if ``key`` was not indexed
+        """
+        with self._lock:
+            row = self._rows_by_key.pop(key, None)
+            if row is None:
+                return False
+
+            last_row = len(self._keys) - 1
+            removed_hashes, moved_hashes = self._band_hashes(
+                self._signatures[[row, last_row]]
+            ).tolist()
+            for buckets, band_hash in zip(self._buckets, removed_hashes):
+                bucket = buckets[band_hash]
+                bucket.remove(row)
+                if not bucket:
+                    del buckets[band_hash]
+
+            if row != last_row:
+                for buckets, band_hash in zip(self._buckets, moved_hashes):
+                    bucket = buckets[band_hash]
+                    bucket[bucket.index(last_row)] = row
+                moved_key = self._keys[last_row]
+                self._signatures[row] = self._signatures[last_row]
+                self._keys[row] = moved_key
+                self._rows_by_key[moved_key] = row  # Keeps its insertion order
+            self._keys.pop()
+            return True
+
+    def oldest_key(self) -> Optional[str]:
+        """Key indexed longest ago, or None if the index is empty."""
+        with self._lock:
+            return next(iter(self._rows_by_key), None)
+
+    def _append(self, signatures: np.ndarray, keys: List[str]) -> None:
+        first_row = len(self._keys)
+        needed = first_row + len(keys)
+        if needed > self._signatures.shape[0]:
+            # Grow geometrically so incremental adds are amortised O(1)
+            capacity = max(needed, 2 * self._signatures.shape[0], 64)
+            grown = np.empty((capacity, self.num_perm), dtype=np.uint32)
+            grown[:first_row] = self._signatures[:first_row]
+            self._signatures = grown
+        self._signatures[first_row:needed] = signatures
+
+        for offset, band_hashes in enumerate(self._band_hashes(signatures).tolist()):
+            row = first_row + offset
+            for buckets, band_hash in zip(self._buckets, band_hashes):
+                buckets.setdefault(band_hash, []).append(row)
+
+        for offset, key in enumerate(keys):
+            self._rows_by_key[key] = first_row + offset
+        self._keys.extend(keys)
+
+    def query(
+        self, text: str, threshold: float = 0.5, limit: int = 5
+    ) -> List[Tuple[str, float]]:
+        """
+        Find indexed texts similar to ``text``.
+
+        Args:
+            text: Query text
+            threshold: Minimum estimated Jaccard similarity
+            limit: Maximum number of matches
+
+        Returns:
+            (key, similarity) pairs, most similar first
+        """
+        signature = self.signature(text)
+        band_hashes = self._band_hashes(np.array([signature]))[0].tolist()
+
+        with self._lock:
+            candidates = set()
+            for buckets, band_hash in zip(self._buckets, band_hashes):
+                candidates.update(buckets.get(band_hash, ()))
+            if not candidates:
+                return []
+
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            similarities = (self._signatures[rows] == signature).mean(axis=1)
+            keys = [self._keys[row] for row in rows.tolist()]
+
+        order = np.argsort(-similarities, kind="stable")[:limit]
+        return [
+            (keys[i], float(similarities[i]))
+            for i in order.tolist()
+            if similarities[i] >= threshold
+        ]
+
+    def save(self, path: str) -> None:
+        """Write the index to ``path`` (.npz, replaced atomically)."""
+        with self._lock:
+            # In insertion order, so oldest_key() survives a reload
+            rows = np.fromiter(
+                self._rows_by_key.values(), dtype=np.int64, count=len(self._keys)
+            )
+            signatures = self._signatures[rows]
+            keys = np.array(list(self._rows_by_key), dtype=str)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    version=_SNAPSHOT_VERSION,
+                    params=np.array(
+                        [self.num_perm, self.bands, self.shingle_size, self.seed]
+                    ),
+                    signatures=signatures,
+                    keys=keys,
+                )
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "MinHashLSHIndex":
+        """Restore an index written by :meth:`save`."""
+        with np.load(path, allow_pickle=False) as snapshot:
+            if int(snapshot["version"]) != _SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version in {path}")
+            num_perm, bands, shingle_size, seed = snapshot["params"].tolist()
+            index = cls(num_perm, bands, shingle_size, seed)
+            keys = snapshot["keys"].tolist()
+            if keys:
+                index._append(snapshot["signatures"], keys)
+        return index
+
+    @classmethod
+    def load_or_create(cls, path: Optional[str], **kwargs) -> "MinHashLSHIndex":
+        """Load the snapshot at ``path`` if it exists, else create an empty index."""
+        if path and os.path.exists(path):
+            return cls.load(path)
+        return cls(**kwargs)
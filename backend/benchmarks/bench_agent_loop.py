@@ -0,0 +1,255 @@
+"""
+Benchmark suite: agent loop overhead with a scripted LLM, stub tools and an
+in-memory DynamoDB.
+
+For every (tool rounds, tool fan-out) scenario, measures latency percentiles,
+throughput and memory of:
+- instantiate_agent
+- invoke_agent
+- handle_standalone_agent_request (config + prompt lookup, cached agent,
+  execution history persisted to the in-memory table), with the verdict
+  cache disabled so every request runs the agent
+- cached_verdict_request: the same request answered from the verdict cache
+
+Nothing leaves the process: the chat model, stub tools and in-memory DynamoDB
+tables come from tests/fakes.py. Results are written as JSON; pass --baseline
+to fail when p50 latency regresses.
+
+Usage:
+    python benchmarks/bench_agent_loop.py
+    python benchmarks/bench_agent_loop.py --iterations 1 4 16 --fanout 1 4 --runs 100
+    python benchmarks/bench_agent_loop.py --output new.json --baseline old.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.agents.agent_cache import invalidate_agent
+from app.agents.agent_factory import instantiate_agent, invoke_agent
+from app.agents.verdict_cache import invalidate_verdicts
+from app.db_commands.agent_config_commands import create_agent_config
+from app.db_commands.execution_history_writer import flush_execution_history
+from app.db_commands.prompt_commands import save_prompt
+from app.handlers.standalone_agent_handler import \
+    handle_standalone_agent_request
+from app.tools.tool_loader import gather_agent_tools
+from app.utils.stats_utils import summarize_latencies
+from tests.fakes import (FINAL_VERDICT, PROMPT_ID, USER_INPUT,
+                         ScriptedChatModel, install_backend_tables,
+                         scenario_config, stub_custom_tools,
+                         uninstall_fake_dynamodb)
+
+TARGETS = (
+    "instantiate_agent",
+    "invoke_agent",
+    "handle_standalone_agent_request",
+    "cached_verdict_request",
+)
+
+
+def measure(fn: Callable[[], Any], runs: int) -> Dict[str, Any]:
+    """Latency percentiles, throughput and memory of ``fn``."""
+    fn()  # Warm-up (imports, caches, pydantic schemas)
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(runs):
+        call_start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    # Memory in a separate pass so tracing doesn't distort the timings
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    del result
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "runs": runs,
+        "latency_ms": {
+            key: round(value, 4)
+            for key, value in summarize_latencies(latencies).items()
+        },
+        "throughput_per_second": round(runs / elapsed, 2) if elapsed else 0.0,
+        "peak_memory_kib": round((peak - baseline) / 1024, 1),
+        "retained_memory_kib": round((retained - baseline) / 1024, 1),
+    }
+
+
+def run_scenario(
+    tool_turns: int, fanout: int, runs: int, llm_latency: float
+) -> Dict[str, Any]:
+    agent_config = scenario_config(tool_turns, fanout)
+    create_agent_config(agent_config)
+
+    def make_llm(**kwargs: Any) -> ScriptedChatModel:
+        return ScriptedChatModel(
+            tool_turns=tool_turns, tool_fanout=fanout, latency_seconds=llm_latency
+        )
+
+    with mock.patch("app.agents.agent_factory.create_llm", make_llm), mock.patch(
+        "app.tools.tool_loader.load_custom_tools", stub_custom_tools
+    ):
+        tools = gather_agent_tools(agent_config)
+        agent = instantiate_agent(agent_config, tools)
+
+        # Sanity check: the scripted conversation runs to completion
+        check = invoke_agent(agent, USER_INPUT)
+        assert check["result"] == FINAL_VERDICT
+        assert check["metadata"]["iterations"] == tool_turns + 1
+        assert check["metadata"]["total_messages"] == 2 + tool_turns * (1 + fanout)
+
+        def handle() -> Dict[str, Any]:
+            response = handle_standalone_agent_request(
+                agent_config.config_id, USER_INPUT
+            )
+            assert response["success"], response.get("error")
+            return response
+
+        invalidate_agent(agent_config.config_id)
+        invalidate_verdicts(agent_config.config_id)
+        entry = {
+            "scenario": {"tool_rounds": tool_turns, "tool_fanout": fanout},
+            "instantiate_agent": measure(
+                lambda: instantiate_agent(agent_config, tools), runs
+            ),
+            "invoke_agent": measure(lambda: invoke_agent(agent, USER_INPUT), runs),
+        }
+        with mock.patch.dict(os.environ, {"VERDICT_CACHE_ENABLED": "false"}):
+            entry["handle_standalone_agent_request"] = measure(handle, runs)
+        # The warm-up request caches the verdict; timed runs are all hits
+        with mock.patch.dict(os.environ, {"VERDICT_CACHE_ENABLED": "true"}):
+            entry["cached_verdict_request"] = measure(handle, runs)
+        return entry
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]], baseline_path: str, tolerance: float
+) -> List[str]:
+    """Return a message for every p50 latency worse than baseline * (1 + tolerance)."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    baseline_by_scenario = {
+        json.dumps(entry["scenario"], sort_keys=True): entry
+        for entry in baseline.get("results", [])
+    }
+
+    regressions = []
+    for entry in results:
+        previous = baseline_by_scenario.get(
+            json.dumps(entry["scenario"], sort_keys=True)
+        )
+        if not previous:
+            continue
+        for target in TARGETS:
+            if target not in previous:
+                continue
+            old = previous[target]["latency_ms"]["p50"]
+            new = entry[target]["latency_ms"]["p50"]
+            if old and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{target} {entry['scenario']}: p50 {old:.3f} -> {new:.3f} ms "
+                    f"(+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--fanout", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--runs", type=int, default=50, help="timed runs per target")
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.0, help="simulated seconds per LLM call"
+    )
+    parser.add_argument("--output", default="bench_agent_loop.json")
+    parser.add_argument("--baseline", help="previous results JSON to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed p50 slowdown (0.25 = 25%%)",
+    )
+    args = parser.parse_args()
+
+    install_backend_tables()
+    try:
+        save_prompt(PROMPT_ID, "You are a fact-checking agent.")
+
+        print("=" * 70)
+        print("AGENT LOOP BENCHMARK")
+        print("=" * 70)
+        print(
+            f"{'rounds':>6} {'fanout':>6} {'target':<34} {'p50 ms':>9} "
+            f"{'p99 ms':>9} {'req/s':>9} {'peak KiB':>9}"
+        )
+        print("-" * 70)
+
+        results = []
+        for tool_turns in args.iterations:
+            for fanout in args.fanout:
+                entry = run_scenario(tool_turns, fanout, args.runs, args.llm_latency)
+                results.append(entry)
+                for target in TARGETS:
+                    stats = entry[target]
+                    print(
+                        f"{tool_turns:>6} {fanout:>6} {target:<34} "
+                        f"{stats['latency_ms']['p50']:>9.3f} "
+                        f"{stats['latency_ms']['p99']:>9.3f} "
+                        f"{stats['throughput_per_second']:>9.1f} "
+                        f"{stats['peak_memory_kib']:>9.1f}"
+                    )
+    finally:
+        # Write the queued execution history before the fake tables go away
+        flush_execution_history()
+        uninstall_fake_dynamodb()
+
+    report = {
+        "benchmark": "agent_loop",
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "iterations": args.iterations,
+            "fanout": args.fanout,
+            "runs": args.runs,
+            "llm_latency_seconds": args.llm_latency,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print("=" * 70)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, args.baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} p50 regression(s) vs {args.baseline}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"✅ No p50 regression beyond {args.tolerance:.0%} vs {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
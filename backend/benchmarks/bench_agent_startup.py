@@ -0,0 +1,149 @@
+"""
+Benchmark: agent construction cost with and without cached tool schemas.
+
+"Before" reproduces the previous construction path: instantiate_agent bound
+the tool objects to the LLM and create_agent_workflow bound them again, so
+every construction converted each tool's schema twice. "After" is the current
+path: tools are bound once, from schemas converted once per tool set
+(tool_loader.get_tool_schemas).
+
+Real provider chat model classes are used (no network calls are made while
+constructing an agent); providers whose client can't be created offline are
+skipped.
+
+Usage:
+    python benchmarks/bench_agent_startup.py
+    python benchmarks/bench_agent_startup.py --agents 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.agents import agent_workflow
+from app.agents.agent_workflow import create_agent_workflow
+from app.tools import tool_loader
+from app.tools.tool_loader import load_custom_tools
+
+SYSTEM_PROMPT = "You are a fact-checking agent."
+
+
+def make_llms() -> Dict[str, Any]:
+    """Chat models of each provider, built without credentials or network."""
+    factories: Dict[str, Callable[[], Any]] = {}
+
+    def anthropic():
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(model="claude-3-5-sonnet-20241022", api_key="bench")
+
+    def openai():
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(model="gpt-4o-mini", api_key="bench")
+
+    def bedrock():
+        from langchain_aws import ChatBedrock
+
+        return ChatBedrock(model_id="amazon.nova-micro-v1:0", region_name="us-east-1")
+
+    factories.update(anthropic=anthropic, openai=openai, bedrock=bedrock)
+
+    llms = {}
+    for name, factory in factories.items():
+        try:
+            llms[name] = factory()
+        except Exception as e:
+            print(f"   (skipping {name}: {e})")
+    return llms
+
+
+def build_before(llm: Any, tools: Dict[str, Any]) -> Any:
+    """Previous path: bind in instantiate_agent, bind again in the workflow."""
+    llm_with_tools = llm.bind_tools(list(tools.values()))
+    with mock.patch.object(
+        agent_workflow, "get_tool_schemas", lambda tools: list(tools.values())
+    ):
+        return create_agent_workflow(llm_with_tools, tools, SYSTEM_PROMPT)
+
+
+def build_after(llm: Any, tools: Dict[str, Any]) -> Any:
+    """Current path: single bind with cached schemas."""
+    return create_agent_workflow(llm, tools, SYSTEM_PROMPT)
+
+
+def time_builds(
+    builder: Callable, llm: Any, tools: Dict[str, Any], count: int
+) -> List[float]:
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        builder(llm, tools)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--agents", type=int, default=100, help="constructions per mode"
+    )
+    args = parser.parse_args()
+
+    tools = load_custom_tools([])
+
+    print("=" * 70)
+    print("AGENT STARTUP BENCHMARK")
+    print("=" * 70)
+    print(f"{len(tools)} tools, {args.agents} agent constructions per mode")
+    llms = make_llms()
+    print("-" * 70)
+    print(
+        f"{'provider':<10} {'before p50':>12} {'after cold':>12} "
+        f"{'after p50':>12} {'speedup':>9}"
+    )
+
+    for name, llm in llms.items():
+        tool_loader._tool_schema_cache.clear()
+        # Warm up imports and pydantic model caches shared by both paths
+        build_before(llm, tools)
+
+        before = time_builds(build_before, llm, tools, args.agents)
+
+        tool_loader._tool_schema_cache.clear()
+        cold = time_builds(build_after, llm, tools, 1)[0]
+        warm = time_builds(build_after, llm, tools, args.agents)
+
+        before_ms = statistics.median(before)
+        warm_ms = statistics.median(warm)
+        print(
+            f"{name:<10} {before_ms:>12.3f} {cold:>12.3f} {warm_ms:>12.3f} "
+            f"{before_ms / warm_ms:>8.2f}x"
+        )
+
+        # Both paths must send the same tool definitions
+        bound_before = build_before(llm, tools)
+        bound_after = build_after(llm, tools)
+        assert _bound_tools(bound_before) == _bound_tools(bound_after)
+
+    print("=" * 70)
+    print("Times (ms) include compiling the LangGraph graph (identical in both modes).")
+
+
+def _bound_tools(agent: Any) -> Any:
+    """Tool definitions bound to the model inside a compiled agent workflow."""
+    node = agent.builder.nodes["agent"].runnable
+    llm_with_tools = node.func.__closure__[
+        node.func.__code__.co_freevars.index("llm_with_tools")
+    ].cell_contents
+    return llm_with_tools.kwargs["tools"]
+
+
+if __name__ == "__main__":
+    main()
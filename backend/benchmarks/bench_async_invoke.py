@@ -0,0 +1,141 @@
+"""
+Benchmark: thread-per-request invoke_agent vs async ainvoke_agent.
+
+Simulates a slow LLM endpoint with ScriptedChatModel(latency_seconds=...) and
+runs N concurrent verifications through the real agent workflow, once with a
+thread pool calling invoke_agent and once on a single event loop with
+ainvoke_agent. Reports wall time, throughput and peak OS threads.
+
+Usage:
+    python benchmarks/bench_async_invoke.py
+    python benchmarks/bench_async_invoke.py --requests 500 --latency 0.5 --threads 32
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from langchain_core.tools import tool
+
+from app.agents.agent_factory import ainvoke_agent, invoke_agent
+from app.agents.agent_workflow import create_agent_workflow
+from tests.fakes import FINAL_VERDICT, ScriptedChatModel
+
+USER_INPUT = "Drinking bleach cures COVID-19"
+
+
+@tool
+async def verify_on_platform(claim: str) -> str:
+    """Stub verification tool (native coroutine, no blocking I/O)."""
+    return "PLATFORM VERIFICATION RESULT:\nStatus: FALSE"
+
+
+def build_agent(latency: float, tool_turns: int, fanout: int) -> Any:
+    llm = ScriptedChatModel(
+        tool_turns=tool_turns, tool_fanout=fanout, latency_seconds=latency
+    )
+    return create_agent_workflow(
+        llm=llm,
+        tools={"verify_on_platform": verify_on_platform},
+        system_prompt="You are a fact-checking agent.",
+        max_iterations=tool_turns + 1,
+        max_tool_concurrency=fanout,
+    )
+
+
+class PeakThreads:
+    """Samples threading.active_count() in the background."""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self) -> "PeakThreads":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def run_sync(agent: Any, requests: int, threads: int) -> Dict[str, Any]:
+    with PeakThreads() as sampler:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(
+                executor.map(lambda _: invoke_agent(agent, USER_INPUT), range(requests))
+            )
+        elapsed = time.perf_counter() - start
+
+    assert all(result["result"] == FINAL_VERDICT for result in results)
+    return {"elapsed": elapsed, "peak_threads": sampler.peak}
+
+
+def run_async(agent: Any, requests: int) -> Dict[str, Any]:
+    async def run_all():
+        return await asyncio.gather(
+            *(ainvoke_agent(agent, USER_INPUT) for _ in range(requests))
+        )
+
+    with PeakThreads() as sampler:
+        start = time.perf_counter()
+        results = asyncio.run(run_all())
+        elapsed = time.perf_counter() - start
+
+    assert all(result["result"] == FINAL_VERDICT for result in results)
+    return {"elapsed": elapsed, "peak_threads": sampler.peak}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2, help="LLM seconds/call")
+    parser.add_argument("--threads", type=int, default=16, help="sync worker threads")
+    parser.add_argument("--tool-turns", type=int, default=2)
+    parser.add_argument("--fanout", type=int, default=2)
+    args = parser.parse_args()
+
+    agent = build_agent(args.latency, args.tool_turns, args.fanout)
+    llm_calls = args.tool_turns + 1
+
+    print("=" * 70)
+    print("ASYNC INVOCATION BENCHMARK")
+    print("=" * 70)
+    print(
+        f"{args.requests} requests, {llm_calls} LLM calls each at "
+        f"{args.latency * 1000:.0f} ms, fan-out {args.fanout}"
+    )
+    print("-" * 70)
+    print(f"{'mode':<28} {'wall (s)':>10} {'req/s':>10} {'peak threads':>14}")
+
+    rows = [
+        (
+            f"invoke_agent x{args.threads} threads",
+            run_sync(agent, args.requests, args.threads),
+        ),
+        ("ainvoke_agent (1 loop)", run_async(agent, args.requests)),
+    ]
+    for label, row in rows:
+        print(
+            f"{label:<28} {row['elapsed']:>10.2f} "
+            f"{args.requests / row['elapsed']:>10.1f} {row['peak_threads']:>14}"
+        )
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
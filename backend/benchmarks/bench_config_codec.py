@@ -0,0 +1,293 @@
+"""
+Benchmark: AgentConfig and execution history (de)serialisation.
+
+"Before" reproduces the previous conversions: the inline AgentConfig <-> item
+code of agent_config_commands.py (which left ints as Decimal), and the
+convert_decimals_to_float that rebuilt every nested dict and list. "After" is
+the current path: agent_config_to_item / agent_config_from_item (shared by
+every caller, numbers coerced to their declared types), and the
+convert_decimals_to_float that only rebuilds containers holding a Decimal.
+
+item -> AgentConfig is expected to be slower "after" (~8 -> ~10 us): the
+legacy decoder left ints as Decimal, and coercing them is what keeps the
+config hash stable across a round trip.
+
+Items are round-tripped through boto3's type serializer first, so numbers are
+Decimal as they would be coming back from DynamoDB. Also checks that a config
+read back from an item hashes like the original (compute_config_hash).
+
+Usage:
+    python benchmarks/bench_config_codec.py
+    python benchmarks/bench_config_codec.py --items 20000 --repeat 7
+"""
+
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.agents.agent_cache import compute_config_hash
+from app.db_commands.agent_config_commands import (agent_config_from_item,
+                                                   agent_config_to_item)
+from app.db_commands.execution_history_commands import (
+    _build_execution_item, convert_decimals_to_float)
+from app.entity.AgentConfig import (AgentConfig, KnowledgeBaseConfig,
+                                    SubAgentConfig)
+from tests.fakes import _roundtrip
+
+
+def make_config(i: int) -> AgentConfig:
+    return AgentConfig(
+        name=f"agent-{i}",
+        description="Fact-checking agent",
+        config_id=f"config-{i}",
+        tools=["search_internet", "verify_claims_on_platform"],
+        prompt_id=f"prompt-{i}",
+        knowledge_base=KnowledgeBaseConfig(enabled=True, index_name="claims"),
+        sub_agents=[
+            SubAgentConfig(
+                name=f"researcher-{j}",
+                description="Searches for sources",
+                config_id=f"config-{i}-sub-{j}",
+                agent_config_id=f"config-{i}",
+                tools=["search_internet"],
+                knowledge_base=KnowledgeBaseConfig(),
+                temperature=0.2,
+            )
+            for j in range(2)
+        ],
+        temperature=0.5,
+        max_tool_concurrency=4,
+        context_token_budget=12000,
+    )
+
+
+def make_execution(i: int) -> Dict[str, Any]:
+    result = {
+        "result": "Credibility Score: 5/100",
+        "metadata": {
+            "iterations": 3,
+            "tool_calls": 4,
+            "input_tokens": 5120,
+            "output_tokens": 410,
+            "tool_results": [
+                {"tool_name": "search_internet", "output": f"page {i}-{j}"}
+                for j in range(4)
+            ],
+            "token_usage": [
+                {"iteration": j, "input_tokens": 1280, "output_tokens": 102.5}
+                for j in range(3)
+            ],
+            "cache_hit": False,
+            "near_duplicate_similarity": 0.42,
+        },
+    }
+    return _build_execution_item("config", f"execution-{i}", "claim", result)
+
+
+# Before: agent_config_commands.py's hand-written conversions
+
+
+def legacy_kb_to_item(kb: KnowledgeBaseConfig) -> Dict[str, Any]:
+    return {
+        "enabled": kb.enabled,
+        "vector_store": kb.vector_store,
+        "index_name": kb.index_name,
+        "embedding_model": kb.embedding_model,
+        "top_k": kb.top_k,
+    }
+
+
+def legacy_to_item(config: AgentConfig) -> Dict[str, Any]:
+    return {
+        "config_id": config.config_id,
+        "name": config.name,
+        "description": config.description,
+        "tools": config.tools,
+        "prompt_id": config.prompt_id,
+        "knowledge_base": (
+            legacy_kb_to_item(config.knowledge_base) if config.knowledge_base else None
+        ),
+        "llm_provider": config.llm_provider,
+        "model_id": config.model_id,
+        "temperature": Decimal(str(config.temperature)),
+        "max_tokens": config.max_tokens,
+        "max_iterations": config.max_iterations,
+        "max_tool_concurrency": config.max_tool_concurrency,
+        "summary_llm_provider": config.summary_llm_provider,
+        "summary_model_id": config.summary_model_id,
+        "tool_output_format": config.tool_output_format,
+        "context_token_budget": config.context_token_budget,
+        "sub_agents": [
+            {
+                "name": sa.name,
+                "description": sa.description,
+                "config_id": sa.config_id,
+                "agent_config_id": sa.agent_config_id,
+                "tools": sa.tools,
+                "prompt_id": sa.prompt_id,
+                "knowledge_base": (
+                    legacy_kb_to_item(sa.knowledge_base) if sa.knowledge_base else None
+                ),
+                "llm_provider": sa.llm_provider,
+                "model_id": sa.model_id,
+                "temperature": Decimal(str(sa.temperature)),
+                "max_tokens": sa.max_tokens,
+                "max_iterations": sa.max_iterations,
+            }
+            for sa in config.sub_agents
+        ],
+    }
+
+
+def legacy_kb_from_item(kb: Dict[str, Any]) -> KnowledgeBaseConfig:
+    return KnowledgeBaseConfig(
+        enabled=kb.get("enabled", False),
+        vector_store=kb.get("vector_store", "chroma"),
+        index_name=kb.get("index_name", ""),
+        embedding_model=kb.get("embedding_model", "text-embedding-3-small"),
+        top_k=kb.get("top_k", 5),
+    )
+
+
+def legacy_from_item(item: Dict[str, Any]) -> AgentConfig:
+    kb = item.get("knowledge_base")
+    return AgentConfig(
+        name=item["name"],
+        description=item["description"],
+        config_id=item["config_id"],
+        tools=item.get("tools", []),
+        prompt_id=item.get("prompt_id", ""),
+        sub_agents=[
+            SubAgentConfig(
+                name=sa["name"],
+                description=sa["description"],
+                config_id=sa["config_id"],
+                agent_config_id=sa["agent_config_id"],
+                tools=sa.get("tools", []),
+                prompt_id=sa.get("prompt_id", ""),
+                knowledge_base=(
+                    legacy_kb_from_item(sa["knowledge_base"])
+                    if sa.get("knowledge_base")
+                    else None
+                ),
+                llm_provider=sa.get("llm_provider", "anthropic"),
+                model_id=sa.get("model_id", "claude-3-5-sonnet-20241022"),
+                temperature=float(sa.get("temperature", 0.7)),
+                max_tokens=sa.get("max_tokens", 4096),
+                max_iterations=sa.get("max_iterations", 10),
+            )
+            for sa in item.get("sub_agents", [])
+        ],
+        knowledge_base=legacy_kb_from_item(kb) if kb else None,
+        llm_provider=item.get("llm_provider", "anthropic"),
+        model_id=item.get("model_id", "claude-3-5-sonnet-20241022"),
+        temperature=float(item.get("temperature", 0.7)),
+        max_tokens=item.get("max_tokens", 4096),
+        max_iterations=item.get("max_iterations", 10),
+        max_tool_concurrency=item.get("max_tool_concurrency", 1),
+        summary_llm_provider=item.get("summary_llm_provider", ""),
+        summary_model_id=item.get("summary_model_id", ""),
+        tool_output_format=item.get("tool_output_format", ""),
+        context_token_budget=item.get("context_token_budget", 0),
+    )
+
+
+def legacy_convert_decimals_to_float(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    elif isinstance(obj, dict):
+        return {
+            key: legacy_convert_decimals_to_float(value) for key, value in obj.items()
+        }
+    elif isinstance(obj, list):
+        return [legacy_convert_decimals_to_float(item) for item in obj]
+    else:
+        return obj
+
+
+def best_of(repeat: int, run: Callable[[], Any]) -> float:
+    """Fastest of ``repeat`` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def compare(label: str, items: int, repeat: int, before: Callable, after: Callable):
+    before_s, after_s = best_of(repeat, before), best_of(repeat, after)
+    print(
+        f"  {label:<26} before {before_s / items * 1e6:>6.2f} us, "
+        f"after {after_s / items * 1e6:>6.2f} us ({before_s / after_s:.1f}x)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    configs = [make_config(i) for i in range(args.items)]
+    config_items = [_roundtrip(agent_config_to_item(config)) for config in configs]
+    executions = [_roundtrip(make_execution(i)) for i in range(args.items)]
+
+    # Same items, same configs
+    assert [legacy_to_item(c) for c in configs[:10]] == [
+        agent_config_to_item(c) for c in configs[:10]
+    ]
+    assert [agent_config_from_item(item) for item in config_items] == configs
+    assert [convert_decimals_to_float(e) for e in executions] == [
+        legacy_convert_decimals_to_float(e) for e in executions
+    ]
+
+    print("=" * 70)
+    print("CONFIG CODEC BENCHMARK")
+    print("=" * 70)
+    print(f"{args.items} items, best of {args.repeat} runs, per item:\n")
+    compare(
+        "AgentConfig -> item",
+        args.items,
+        args.repeat,
+        lambda: [legacy_to_item(c) for c in configs],
+        lambda: [agent_config_to_item(c) for c in configs],
+    )
+    compare(
+        "item -> AgentConfig",
+        args.items,
+        args.repeat,
+        lambda: [legacy_from_item(item) for item in config_items],
+        lambda: [agent_config_from_item(item) for item in config_items],
+    )
+    compare(
+        "convert_decimals_to_float",
+        args.items,
+        args.repeat,
+        lambda: [legacy_convert_decimals_to_float(e) for e in executions],
+        lambda: [convert_decimals_to_float(e) for e in executions],
+    )
+
+    config, item = configs[0], config_items[0]
+    legacy_stable = compute_config_hash(legacy_from_item(item)) == (
+        compute_config_hash(config)
+    )
+    stable = compute_config_hash(agent_config_from_item(item)) == (
+        compute_config_hash(config)
+    )
+    print(
+        f"\n  config hash after a DynamoDB round trip: "
+        f"before {'stable' if legacy_stable else 'changed'}, "
+        f"after {'stable' if stable else 'changed'}"
+    )
+    assert stable, "decoded config hashes differently from the original"
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark: listing agent configs with paginated, segmented and projected scans.
+
+Fills a fake agent config table with thousands of configs, then lists them
+over a simulated network (fixed latency per Scan call plus transfer time for
+the returned bytes):
+
+- single scan: the previous list_agent_configs, one Scan call (truncated at
+  the first 1MB page)
+- paginated: iter_agent_configs, following LastEvaluatedKey
+- segmented: iter_agent_configs with parallel scan segments
+- summaries: iter_agent_config_summaries, projecting summary attributes
+
+Reports items returned, Scan calls, wall time and peak memory (tracemalloc)
+for each.
+
+Usage:
+    python benchmarks/bench_config_scan.py
+    python benchmarks/bench_config_scan.py --configs 10000 --segments 4 8 16
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.db_commands.agent_config_commands import (create_agent_config,
+                                                   get_table_name,
+                                                   iter_agent_config_summaries,
+                                                   iter_agent_configs)
+from app.entity.AgentConfig import AgentConfig, SubAgentConfig
+from tests.fakes import FakeTable, install_fake_dynamodb
+
+
+class NetworkTable(FakeTable):
+    """Agent config table with per-call latency and limited bandwidth."""
+
+    latency = 0.0
+    bytes_per_second = float("inf")
+
+    def scan(self, **kwargs: Any) -> Dict[str, Any]:
+        response = super().scan(**kwargs)
+        size = sum(len(str(item)) for item in response["Items"])
+        time.sleep(self.latency + size / self.bytes_per_second)
+        return response
+
+
+def make_config(i: int) -> AgentConfig:
+    return AgentConfig(
+        name=f"agent-{i}",
+        description=f"Fact-checking agent {i}. " * 20,
+        config_id=f"config-{i:06d}",
+        tools=["search_internet", "verify_claims_on_platform"],
+        prompt_id=f"prompt-{i}",
+        sub_agents=[
+            SubAgentConfig(
+                name=f"researcher-{j}",
+                description="Searches for sources supporting or refuting a claim. "
+                * 10,
+                config_id=f"config-{i:06d}-sub-{j}",
+                agent_config_id=f"config-{i:06d}",
+                tools=["search_internet"],
+            )
+            for j in range(3)
+        ],
+    )
+
+
+def single_scan(table: FakeTable) -> Iterable[Any]:
+    """The previous list_agent_configs: one Scan call, no pagination."""
+    return table.scan()["Items"]
+
+
+def measure(table: NetworkTable, run: Callable[[], Iterable[Any]]) -> Dict:
+    """Time one listing, then repeat it without the network to trace memory."""
+    latency, bytes_per_second = table.latency, table.bytes_per_second
+    table.calls.clear()
+    start = time.perf_counter()
+    items = sum(1 for _ in run())
+    elapsed = time.perf_counter() - start
+    calls = table.calls.get("scan", 0)
+
+    table.latency, table.bytes_per_second = 0.0, float("inf")
+    tracemalloc.start()
+    for _ in run():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    table.latency, table.bytes_per_second = latency, bytes_per_second
+
+    return {
+        "items": items,
+        "calls": calls,
+        "seconds": elapsed,
+        "peak_mib": peak / 1024 / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--configs", type=int, default=5000)
+    parser.add_argument("--segments", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--mib-per-second", type=float, default=25.0)
+    args = parser.parse_args()
+
+    table = install_fake_dynamodb(
+        [(get_table_name(), "config_id")], table_class=NetworkTable
+    )[get_table_name()]
+    for i in range(args.configs):
+        create_agent_config(make_config(i))
+    table.latency = args.latency
+    table.bytes_per_second = args.mib_per_second * 1024 * 1024
+
+    print("=" * 70)
+    print("AGENT CONFIG SCAN BENCHMARK")
+    print("=" * 70)
+    print(
+        f"{args.configs} configs, {args.latency * 1000:.0f} ms per Scan call, "
+        f"{args.mib_per_second:.0f} MiB/s\n"
+    )
+
+    runs = [
+        ("single scan", lambda: single_scan(table)),
+        ("paginated", lambda: iter_agent_configs()),
+    ]
+    for segments in args.segments:
+        runs.append(
+            (
+                f"{segments} segments",
+                lambda segments=segments: iter_agent_configs(segments=segments),
+            )
+        )
+    runs.append(
+        (
+            f"summaries ({max(args.segments)} seg)",
+            lambda: iter_agent_config_summaries(segments=max(args.segments)),
+        )
+    )
+
+    for label, run in runs:
+        stats = measure(table, run)
+        complete = "" if stats["items"] == args.configs else "  (truncated)"
+        print(
+            f"  {label:<20} {stats['items']:>6} items, {stats['calls']:>3} calls, "
+            f"{stats['seconds'] * 1000:>7.0f} ms, peak {stats['peak_mib']:>6.1f} MiB"
+            f"{complete}"
+        )
+        if label != "single scan":
+            assert stats["items"] == args.configs, f"{label} missed configs"
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
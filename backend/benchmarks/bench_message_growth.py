@@ -0,0 +1,155 @@
+"""
+Regression benchmark: agent state growth per tool iteration.
+
+Runs the real agent workflow against ScriptedChatModel with an increasing
+number of tool rounds and asserts that the message count and the serialized
+size of the message history grow linearly with the iteration count (each
+round must add one AI message plus one ToolMessage per tool call, nothing
+more).
+
+Then runs the longest investigation with a context token budget and asserts
+that the input tokens of every model call stay within it, while the
+investigation still reaches its final verdict.
+
+Usage:
+    python benchmarks/bench_message_growth.py
+    python benchmarks/bench_message_growth.py --iterations 1 2 4 8 16 32 --fanout 3
+    python benchmarks/bench_message_growth.py --budget 1500
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from langchain_core.messages import HumanMessage, messages_to_dict
+from langchain_core.tools import tool
+
+from app.agents.agent_workflow import create_agent_workflow
+from tests.fakes import FINAL_VERDICT, ScriptedChatModel
+
+
+@tool
+def verify_on_platform(claim: str) -> str:
+    """Stub verification tool returning a fixed-size result."""
+    return "PLATFORM VERIFICATION RESULT:\nStatus: FALSE\n" + "x" * 200
+
+
+def run_workflow(tool_turns: int, fanout: int, budget: int = 0) -> Dict[str, Any]:
+    llm = ScriptedChatModel(tool_turns=tool_turns, tool_fanout=fanout)
+    agent = create_agent_workflow(
+        llm=llm,
+        tools={"verify_on_platform": verify_on_platform},
+        system_prompt="You are a fact-checking agent.",
+        max_iterations=tool_turns + 1,
+        context_token_budget=budget,
+    )
+    user_input = "Drinking bleach cures COVID-19"
+    final_state = agent.invoke(
+        {
+            "messages": [HumanMessage(content=user_input)],
+            "user_input": user_input,
+            "tool_results": [],
+            "final_output": "",
+            "iteration_count": 0,
+        }
+    )
+
+    messages = final_state["messages"]
+    return {
+        "iterations": final_state["iteration_count"],
+        "messages": len(messages),
+        "state_bytes": len(json.dumps(messages_to_dict(messages))),
+        "final_output": messages[-1].content,
+        "token_usage": final_state["token_usage"],
+    }
+
+
+def run(iteration_counts: List[int], fanout: int) -> None:
+    print("=" * 70)
+    print("AGENT STATE GROWTH BENCHMARK")
+    print("=" * 70)
+    print(f"{'tool rounds':>12} {'messages':>10} {'expected':>10} {'state bytes':>14}")
+    print("-" * 70)
+
+    rows = []
+    for tool_turns in iteration_counts:
+        row = run_workflow(tool_turns, fanout)
+        # Human message + per round (AI + fanout tool messages) + final AI
+        expected = 2 + tool_turns * (1 + fanout)
+        print(
+            f"{tool_turns:>12} {row['messages']:>10} {expected:>10} "
+            f"{row['state_bytes']:>14}"
+        )
+        assert row["messages"] == expected, (
+            f"{tool_turns} rounds produced {row['messages']} messages, "
+            f"expected {expected}"
+        )
+        rows.append((tool_turns, row["state_bytes"]))
+
+    # Every extra round must add roughly the same number of bytes
+    (first_turns, first_bytes), (last_turns, last_bytes) = rows[0], rows[-1]
+    if last_turns > first_turns:
+        per_round = [
+            (later_bytes - earlier_bytes) / (later_turns - earlier_turns)
+            for (earlier_turns, earlier_bytes), (later_turns, later_bytes) in zip(
+                rows, rows[1:]
+            )
+        ]
+        assert max(per_round) <= 1.1 * min(
+            per_round
+        ), f"state size grows superlinearly: bytes per round {per_round}"
+        print("-" * 70)
+        print(f"bytes per tool round: {min(per_round):.0f} - {max(per_round):.0f}")
+
+    print("=" * 70)
+    print("✅ Message history grows linearly with iteration count")
+
+
+def run_budget(tool_turns: int, fanout: int, budget: int) -> None:
+    print("=" * 70)
+    print(f"CONTEXT BUDGET ({tool_turns} tool rounds, budget {budget} tokens)")
+    print("=" * 70)
+    unlimited = run_workflow(tool_turns, fanout)
+    budgeted = run_workflow(tool_turns, fanout, budget)
+
+    print(
+        f"{'iteration':>10} {'tokens in':>12} {'budgeted':>10} {'summarised':>11} {'dropped':>8}"
+    )
+    print("-" * 70)
+    for full, trimmed in zip(unlimited["token_usage"], budgeted["token_usage"]):
+        print(
+            f"{full['iteration']:>10} {full['input_tokens']:>12} "
+            f"{trimmed['input_tokens']:>10} {trimmed['summarised_messages']:>11} "
+            f"{trimmed['dropped_messages']:>8}"
+        )
+        assert trimmed["input_tokens"] <= budget, (
+            f"iteration {trimmed['iteration']} sent {trimmed['input_tokens']} "
+            f"tokens, budget {budget}"
+        )
+
+    assert budgeted["final_output"] == FINAL_VERDICT, "budgeted run lost its verdict"
+    total_in = sum(usage["input_tokens"] for usage in unlimited["token_usage"])
+    budgeted_in = sum(usage["input_tokens"] for usage in budgeted["token_usage"])
+    print("-" * 70)
+    print(f"total tokens in: {total_in} -> {budgeted_in}")
+    print("=" * 70)
+    print("✅ Every model call stays within the context budget")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--fanout", type=int, default=2)
+    parser.add_argument("--budget", type=int, default=1000)
+    args = parser.parse_args()
+
+    run(args.iterations, args.fanout)
+    run_budget(max(args.iterations), args.fanout, args.budget)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark: near-duplicate claim detection with MinHashLSHIndex.
+
+Indexes synthetic claims, then queries reworded copies (dropped words,
+punctuation, casing, typos) and unrelated claims. Reports insert throughput,
+query latency, recall of the rewordings and false matches at the seed
+threshold, and snapshot save/load time.
+
+Usage:
+    python benchmarks/bench_near_duplicate.py
+    python benchmarks/bench_near_duplicate.py --sizes 1000 100000 --queries 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.agents.verdict_cache import _near_duplicate_text
+from app.utils.minhash_index import MinHashLSHIndex
+from app.utils.stats_utils import summarize_latencies
+
+VOCABULARY = [
+    "".join(random.Random(i).choices("abcdefghijklmnopqrstuvwxyz", k=3 + i % 7))
+    for i in range(20_000)
+]
+
+
+def make_claim(rng: random.Random) -> str:
+    return " ".join(rng.choices(VOCABULARY, k=rng.randint(10, 25)))
+
+
+def reword(claim: str, rng: random.Random) -> str:
+    """A light rewording: drop a word, add punctuation/casing and one typo."""
+    words = claim.split()
+    del words[rng.randrange(len(words))]
+    position = rng.randrange(len(words))
+    word = words[position]
+    if len(word) > 3:
+        i = rng.randrange(1, len(word) - 1)
+        words[position] = word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+    return "BREAKING: " + " ".join(words).upper() + "!!"
+
+
+def run(size: int, queries: int, threshold: float, rng: random.Random) -> None:
+    claims = [make_claim(rng) for _ in range(size)]
+    index = MinHashLSHIndex()
+
+    start = time.perf_counter()
+    for i, claim in enumerate(claims):
+        index.add(str(i), _near_duplicate_text(claim))
+    insert_seconds = time.perf_counter() - start
+
+    latencies: List[float] = []
+    found = 0
+    false_matches = 0
+    for i in range(queries):
+        target = rng.randrange(size)
+        for query, expected in (
+            (reword(claims[target], rng), str(target)),
+            (make_claim(rng), None),
+        ):
+            query_start = time.perf_counter()
+            matches = index.query(_near_duplicate_text(query), threshold, limit=1)
+            latencies.append((time.perf_counter() - query_start) * 1000)
+            if expected is None:
+                false_matches += bool(matches)
+            elif matches and matches[0][0] == expected:
+                found += 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.npz")
+        start = time.perf_counter()
+        index.save(path)
+        save_seconds = time.perf_counter() - start
+        snapshot_kib = os.path.getsize(path) / 1024
+        start = time.perf_counter()
+        restored = MinHashLSHIndex.load(path)
+        load_seconds = time.perf_counter() - start
+        assert len(restored) == size
+
+    stats = summarize_latencies(latencies)
+    print(f"\n{size:,} indexed claims")
+    print(f"  insert:      {size / insert_seconds:,.0f} claims/s")
+    print(f"  query:       p50 {stats['p50']:.3f} ms, p99 {stats['p99']:.3f} ms")
+    print(f"  rewordings:  {found}/{queries} found at >= {threshold}")
+    print(f"  unrelated:   {false_matches}/{queries} false matches")
+    print(
+        f"  snapshot:    {snapshot_kib:,.0f} KiB, save {save_seconds * 1000:.1f} ms, "
+        f"load {load_seconds * 1000:.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("NEAR-DUPLICATE INDEX BENCHMARK")
+    print("=" * 70)
+    rng = random.Random(args.seed)
+    for size in args.sizes:
+        run(size, args.queries, args.threshold, rng)
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
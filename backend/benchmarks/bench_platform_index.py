@@ -0,0 +1,202 @@
+"""
+Benchmark: verification platform lookup, linear scan vs BM25 index.
+
+Builds synthetic fact-check databases of increasing size and reports index
+build time, the average latency of the original linear scan, and p50/p99
+latency of the BM25 VerificationIndex together with how often it ranks the
+paraphrased claim first. Exits non-zero if the index's p50 exceeds
+--max-p50-ms (sub-millisecond by default).
+
+With --store, each database is also written as a memory-mapped store file and
+the same queries are run against it.
+
+Usage:
+    python benchmarks/bench_platform_index.py
+    python benchmarks/bench_platform_index.py --store
+    python benchmarks/bench_platform_index.py --sizes 10000 100000 1000000 --queries 500
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.tools.platform_store import (MappedVerificationIndex,
+                                      write_verification_store)
+from app.tools.platform_verification_tool import VerificationIndex
+from app.utils.stats_utils import summarize_latencies
+
+VOCABULARY_SIZE = 50_000
+
+
+def linear_scan(db: Dict[str, Dict[str, Any]], query: str) -> Optional[Dict[str, Any]]:
+    """The original search_in_verification_platform matching loop."""
+    normalized_query = query.lower().strip()
+
+    for key, value in db.items():
+        key_terms = key.split()
+        query_terms = normalized_query.split()
+
+        matches = sum(1 for term in key_terms if term in query_terms)
+        if matches >= max(2, len(key_terms) * 0.6):
+            return value
+
+    return None
+
+
+def build_database(size: int, rng: random.Random) -> Dict[str, Dict[str, Any]]:
+    """Create ``size`` synthetic claims with Zipf-distributed key terms."""
+    vocabulary = [f"term{i}" for i in range(VOCABULARY_SIZE)]
+    cum_weights = list(
+        itertools.accumulate(1.0 / (rank + 1) ** 0.8 for rank in range(VOCABULARY_SIZE))
+    )
+
+    db: Dict[str, Dict[str, Any]] = {}
+    while len(db) < size:
+        terms = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(3, 6))
+        db[" ".join(terms)] = {"status": "FALSE", "claim_id": len(db)}
+    return db
+
+
+def build_queries(
+    db: Dict[str, Dict[str, Any]], count: int, rng: random.Random
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Half the queries paraphrase a stored claim (its terms shuffled among
+    noise words), half are random terms. Returns (query, paraphrased key).
+    """
+    keys = list(db.keys())
+    queries = []
+    for i in range(count):
+        if i % 2 == 0:
+            key = rng.choice(keys)
+            terms = key.split() + [f"noise{rng.randint(0, 10_000)}" for _ in range(5)]
+            rng.shuffle(terms)
+        else:
+            key = None
+            terms = [f"term{rng.randint(0, VOCABULARY_SIZE - 1)}" for _ in range(8)]
+        queries.append(("BREAKING: " + " ".join(terms), key))
+    return queries
+
+
+def time_per_query(fn, queries: List[str]) -> float:
+    """Average seconds per query."""
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def measure_index(
+    index: VerificationIndex, queries: List[Tuple[str, Optional[str]]]
+) -> Tuple[Dict[str, float], float]:
+    """Match latency percentiles and top-1 accuracy on paraphrased claims."""
+    latencies = []
+    paraphrases = ranked_first = 0
+    for query, key in queries:
+        query_start = time.perf_counter()
+        match = index.match(query)
+        latencies.append((time.perf_counter() - query_start) * 1000)
+        if key is not None:
+            paraphrases += 1
+            ranked_first += match is not None and match.key == key
+    return summarize_latencies(latencies), ranked_first / max(paraphrases, 1)
+
+
+def run(
+    sizes: List[int],
+    num_queries: int,
+    scan_queries: int,
+    seed: int,
+    max_p50_ms: float,
+    store: bool = False,
+) -> bool:
+    print("=" * 70)
+    print("VERIFICATION PLATFORM LOOKUP BENCHMARK")
+    print("=" * 70)
+    print(
+        f"{'entries':>9} {'build s':>8} {'scan ms':>9} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'speedup':>8} {'top-1':>7}"
+    )
+    print("-" * 70)
+
+    within_budget = True
+    for size in sizes:
+        rng = random.Random(seed)
+        db = build_database(size, rng)
+        queries = build_queries(db, num_queries, rng)
+
+        start = time.perf_counter()
+        index = VerificationIndex(db)
+        build_seconds = time.perf_counter() - start
+
+        stats, top1 = measure_index(index, queries)
+
+        # The scan is slow at large sizes, so it runs on a prefix of the queries
+        scan_sample = [query for query, _ in queries[:scan_queries]]
+        scan_seconds = time_per_query(lambda q: linear_scan(db, q), scan_sample)
+
+        within_budget &= stats["p50"] <= max_p50_ms
+        print(
+            f"{size:>9} {build_seconds:>8.2f} {scan_seconds * 1000:>9.3f} "
+            f"{stats['p50']:>8.3f} {stats['p99']:>8.3f} "
+            f"{scan_seconds * 1000 / stats['p50']:>7.0f}x {top1:>7.1%}"
+        )
+
+        if store:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "platform.vpstore")
+                start = time.perf_counter()
+                write_verification_store(db, path)
+                write_seconds = time.perf_counter() - start
+                start = time.perf_counter()
+                mapped = MappedVerificationIndex(path)
+                open_ms = f"open {(time.perf_counter() - start) * 1000:.1f}"
+                mapped_stats, mapped_top1 = measure_index(mapped, queries)
+                within_budget &= mapped_stats["p50"] <= max_p50_ms
+                print(
+                    f"{'(store)':>9} {write_seconds:>8.2f} {open_ms:>9} "
+                    f"{mapped_stats['p50']:>8.3f} {mapped_stats['p99']:>8.3f} "
+                    f"{os.path.getsize(path) / 2**20:>6.1f}MB {mapped_top1:>7.1%}"
+                )
+                del mapped
+
+    print("=" * 70)
+    status = "✅" if within_budget else "❌"
+    print(f"{status} BM25 p50 latency budget: {max_p50_ms} ms")
+    return within_budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--max-p50-ms", type=float, default=1.0)
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help="also measure the memory-mapped store (app/tools/platform_store.py)",
+    )
+    args = parser.parse_args()
+
+    if not run(
+        args.sizes,
+        args.queries,
+        args.scan_queries,
+        args.seed,
+        args.max_p50_ms,
+        args.store,
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
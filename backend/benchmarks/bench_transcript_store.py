@@ -0,0 +1,133 @@
+"""
+Benchmark: execution history items with and without the transcript store.
+
+Builds execution results with growing tool transcripts (scraped page
+excerpts), then compares the DynamoDB item saved inline with the item saved
+as a pointer to a compressed transcript (LocalTranscriptStore), for gzip and
+zstd: item size against the 400KB limit, compressed size and ratio, and the
+latency of saving and of lazily loading the transcript back.
+
+Usage:
+    python benchmarks/bench_transcript_store.py
+    python benchmarks/bench_transcript_store.py --tool-calls 4 32 128 --page-kib 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from boto3.dynamodb.types import TypeSerializer
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.db_commands.execution_history_commands import (
+    _build_execution_item, load_execution_transcript)
+from infra.transcript_store import zstandard
+
+DYNAMODB_ITEM_LIMIT = 400 * 1024
+WORDS = [
+    "vaccine", "study", "health", "officials", "report", "claim", "evidence",
+    "according", "published", "data", "researchers", "government", "social",
+    "media", "viral", "post", "shared", "million", "times", "fact", "check",
+]  # fmt: skip
+
+_serializer = TypeSerializer()
+
+
+def item_bytes(item: Dict[str, Any]) -> int:
+    """Approximate DynamoDB item size (attribute names + serialized values)."""
+    return sum(
+        len(key) + len(str(_serializer.serialize(value))) for key, value in item.items()
+    )
+
+
+def make_result(tool_calls: int, page_kib: int, rng: random.Random) -> Dict[str, Any]:
+    messages = [HumanMessage(content="Drinking bleach cures COVID-19")]
+    tool_results = []
+    for i in range(tool_calls):
+        page = " ".join(rng.choices(WORDS, k=page_kib * 1024 // 7))
+        output = f"Found 'bleach' in URL https://example.com/{i}:\n\n{page}"
+        call = {"name": "search_internet", "args": {"url": f"https://example.com/{i}"}}
+        messages.append(AIMessage(content="", tool_calls=[{**call, "id": f"c{i}"}]))
+        messages.append(ToolMessage(content=output, tool_call_id=f"c{i}"))
+        tool_results.append({"tool_name": "search_internet", "output": output})
+    messages.append(AIMessage(content="Credibility Score: 5/100"))
+
+    return {
+        "result": "Credibility Score: 5/100",
+        "metadata": {
+            "iterations": tool_calls + 1,
+            "tool_calls": tool_calls,
+            "tool_results": tool_results,
+            "total_messages": len(messages),
+        },
+        "full_state": {"messages": messages},
+    }
+
+
+def run(tool_calls: int, page_kib: int, runs: int, rng: random.Random) -> None:
+    result = make_result(tool_calls, page_kib, rng)
+
+    with mock.patch.dict(os.environ, {"TRANSCRIPT_STORE": ""}):
+        inline = item_bytes(_build_execution_item("c", "e", "claim", result))
+    status = "over limit" if inline > DYNAMODB_ITEM_LIMIT else "ok"
+    print(f"\n{tool_calls} tool calls x {page_kib} KiB pages")
+    print(f"  inline item:   {inline / 1024:>9,.1f} KiB ({status})")
+
+    for codec in ("gzip", "zstd"):
+        if codec == "zstd" and zstandard is None:
+            print("  zstd:          skipped (zstandard not installed)")
+            continue
+        with tempfile.TemporaryDirectory() as directory, mock.patch.dict(
+            os.environ,
+            {
+                "TRANSCRIPT_STORE": "local",
+                "TRANSCRIPT_DIR": directory,
+                "TRANSCRIPT_COMPRESSION": codec,
+            },
+        ):
+            start = time.perf_counter()
+            for i in range(runs):
+                item = _build_execution_item("c", f"e{i}", "claim", result)
+            save_ms = (time.perf_counter() - start) * 1000 / runs
+
+            start = time.perf_counter()
+            for _ in range(runs):
+                transcript = load_execution_transcript(item)
+            load_ms = (time.perf_counter() - start) * 1000 / runs
+            assert len(transcript["metadata"]["tool_results"]) == tool_calls
+
+        pointer = item["transcript"]
+        print(
+            f"  {codec + ':':<14} item {item_bytes(item) / 1024:,.1f} KiB, "
+            f"transcript {pointer['size_bytes'] / 1024:,.1f} KiB "
+            f"({pointer['raw_bytes'] / pointer['size_bytes']:.1f}x), "
+            f"save {save_ms:.2f} ms, load {load_ms:.2f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tool-calls", type=int, nargs="+", default=[4, 32, 128])
+    parser.add_argument("--page-kib", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("TRANSCRIPT STORE BENCHMARK")
+    print("=" * 70)
+    rng = random.Random(args.seed)
+    for tool_calls in args.tool_calls:
+        run(tool_calls, args.page_kib, args.runs, rng)
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark: write-behind execution history vs synchronous put_item.
+
+Runs handle_standalone_agent_request against an execution history table with
+simulated DynamoDB latency, first writing synchronously, then through the
+ExecutionHistoryWriter, and reports the request latency of both. Then checks
+the writer's failure handling:
+
+- coalescing: concurrent requests share batch_writer batches of up to 25
+- throttling: throttled batches are retried with backoff and written
+- outage: batches that can't be written are spooled to a local file and
+  replayed once DynamoDB is back
+
+Usage:
+    python benchmarks/bench_write_behind.py
+    python benchmarks/bench_write_behind.py --write-latency 0.02 --requests 200
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from botocore.exceptions import EndpointConnectionError
+
+from app.db_commands.agent_config_commands import create_agent_config
+from app.db_commands.execution_history_commands import get_execution_table_name
+from app.db_commands.execution_history_writer import (ExecutionHistoryWriter,
+                                                      flush_execution_history)
+from app.db_commands.prompt_commands import save_prompt
+from app.handlers.standalone_agent_handler import \
+    handle_standalone_agent_request
+from app.utils.stats_utils import summarize_latencies
+from tests.fakes import (PROMPT_ID, USER_INPUT, ScriptedChatModel, SlowTable,
+                         install_backend_tables, install_fake_dynamodb,
+                         scenario_config, stub_custom_tools, throttling_error)
+
+
+def measure_requests(config_id: str, requests: int, write_behind: bool) -> Dict:
+    environment = {
+        "VERDICT_CACHE_ENABLED": "false",
+        "EXECUTION_HISTORY_WRITE_BEHIND": "true" if write_behind else "false",
+    }
+    latencies = []
+    with mock.patch.dict(os.environ, environment):
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = handle_standalone_agent_request(config_id, USER_INPUT)
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response["success"], response.get("error")
+    assert flush_execution_history(timeout=30), "writer did not drain"
+    return summarize_latencies(latencies)
+
+
+def check_failure_handling(table: SlowTable, requests: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        spool_path = os.path.join(directory, "execution-history.spool")
+        writer = ExecutionHistoryWriter(backoff_seconds=0.001, spool_path=spool_path)
+        result = {"result": "verdict", "metadata": {"tool_calls": 0}}
+
+        def submit_all(prefix: str) -> None:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for i in range(requests):
+                    executor.submit(
+                        writer.submit, "bench", f"{prefix}-{i}", USER_INPUT, result
+                    )
+            assert writer.flush(timeout=30), "writer did not drain"
+
+        # Coalescing
+        table.items.clear()
+        table.calls.clear()
+        submit_all("coalesce")
+        batches = table.calls.get("batch_write_item", 0)
+        assert len(table.items) == requests
+        print(f"  coalescing:  {requests} requests -> {batches} batch writes")
+
+        # Throttling
+        table.items.clear()
+        table.fail_next, table.failure = 2, throttling_error()
+        submit_all("throttled")
+        assert len(table.items) == requests
+        print(
+            f"  throttling:  {writer.stats['retries']} retries, "
+            f"{len(table.items)}/{requests} written"
+        )
+
+        # Outage, then recovery
+        table.items.clear()
+        table.fail_next = 10**9
+        table.failure = EndpointConnectionError(endpoint_url="https://dynamodb")
+        # The writer logs each failed batch; expected here
+        logging.getLogger("app.db_commands.execution_history_writer").disabled = True
+        submit_all("outage")
+        spooled = writer.stats["spooled"]
+        assert not table.items and os.path.exists(spool_path)
+        table.fail_next = 0
+        submit_all("recovered")
+        assert len(table.items) == 2 * requests, "spooled items were not replayed"
+        print(
+            f"  outage:      {spooled} items spooled, "
+            f"{writer.stats['replayed']} replayed after recovery"
+        )
+        writer.close(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--write-latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    install_backend_tables()
+    table = install_fake_dynamodb(
+        [(get_execution_table_name(), "execution_id")], table_class=SlowTable
+    )[get_execution_table_name()]
+    save_prompt(PROMPT_ID, "You are a fact-checking agent.")
+    agent_config = scenario_config(tool_turns=1, fanout=1)
+    create_agent_config(agent_config)
+
+    print("=" * 70)
+    print("WRITE-BEHIND EXECUTION HISTORY BENCHMARK")
+    print("=" * 70)
+    print(f"Simulated DynamoDB latency: {args.write_latency * 1000:.0f} ms\n")
+
+    with mock.patch(
+        "app.agents.agent_factory.create_llm", lambda **kwargs: ScriptedChatModel()
+    ), mock.patch("app.tools.tool_loader.load_custom_tools", stub_custom_tools):
+        handle_standalone_agent_request(agent_config.config_id, USER_INPUT)  # Warm-up
+        table.latency = args.write_latency
+        for label, write_behind in (("synchronous", False), ("write-behind", True)):
+            stats = measure_requests(
+                agent_config.config_id, args.requests, write_behind
+            )
+            print(f"  {label:<13} p50 {stats['p50']:.2f} ms, p99 {stats['p99']:.2f} ms")
+
+    print()
+    check_failure_handling(table, args.requests)
+    print("=" * 70)
+    print("✅ Requests no longer wait for DynamoDB; no execution history was lost")
+
+
+if __name__ == "__main__":
+    main()
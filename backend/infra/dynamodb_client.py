@@ -1,30 +1,149 @@
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Registry of connections per (region, endpoint), so DynamoDB calls reuse warm
+# TCP/TLS connections. The low-level client is thread-safe, so one client (and
+# its connection pool) is shared by the process. boto3 resources and their
+# Table objects are not thread-safe, so every thread gets its own, created on
+# first use and bound to the shared client.
+_registry_lock = threading.Lock()
+_sessions: Dict[Tuple[str, Optional[str]], boto3.session.Session] = {}
+_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+_local = threading.local()
+_generation = 0  # Bumped by reset_dynamodb_clients to drop per-thread handles
+
+
+def _registry_key() -> Tuple[str, Optional[str]]:
+    """Region and optional endpoint override (e.g. DynamoDB Local)."""
+    region = os.getenv("AWS_REGION", "us-east-1")
+    endpoint_url = os.getenv("DYNAMODB_ENDPOINT_URL") or None
+    return region, endpoint_url
+
+
+def get_dynamodb_config() -> Config:
+    """
+    Build the botocore Config used for DynamoDB connections.
+
+    Tunable via environment variables:
+    - DYNAMODB_MAX_POOL_CONNECTIONS: HTTP connection pool size (default 50)
+    - DYNAMODB_MAX_ATTEMPTS: Total attempts including retries (default 5)
+    - DYNAMODB_RETRY_MODE: "standard" or "adaptive" (default "standard")
+    - DYNAMODB_CONNECT_TIMEOUT: Seconds to establish a connection (default 3)
+    - DYNAMODB_READ_TIMEOUT: Seconds to wait for a response (default 10)
+
+    Returns:
+        botocore Config
+    """
+    return Config(
+        max_pool_connections=int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "50")),
+        retries={
+            "max_attempts": int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "5")),
+            "mode": os.getenv("DYNAMODB_RETRY_MODE", "standard"),
+        },
+        connect_timeout=float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "3")),
+        read_timeout=float(os.getenv("DYNAMODB_READ_TIMEOUT", "10")),
+        tcp_keepalive=True,
+    )
+
+
+def _get_session(key: Tuple[str, Optional[str]]) -> boto3.session.Session:
+    """Get the shared boto3 session for a registry key (caller holds the lock)."""
+    if key not in _sessions:
+        _sessions[key] = boto3.session.Session(region_name=key[0])
+    return _sessions[key]
+
+
+def _thread_registry() -> Dict[str, Dict]:
+    """This thread's resources and Table handles."""
+    registry = getattr(_local, "registry", None)
+    if registry is None or registry["generation"] != _generation:
+        registry = {"generation": _generation, "resources": {}, "tables": {}}
+        _local.registry = registry
+    return registry
+
 
 def get_dynamodb_client():
     """
-    Get DynamoDB client.
+    Get the shared DynamoDB client.
 
     Returns:
         boto3 DynamoDB client
     """
-    region = os.getenv("AWS_REGION", "us-east-1")
-    return boto3.client("dynamodb", region_name=region)
+    key = _registry_key()
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _registry_lock:
+        if key not in _clients:
+            _clients[key] = _get_session(key).client(
+                "dynamodb", endpoint_url=key[1], config=get_dynamodb_config()
+            )
+        return _clients[key]
 
 
 def get_dynamodb_resource():
     """
-    Get DynamoDB resource (higher-level interface).
+    Get this thread's DynamoDB resource (higher-level interface).
+
+    boto3 resources are not thread-safe, so each thread gets its own; the
+    resource is reused by later calls on that thread. Its requests go through
+    the shared client, so all threads draw from one connection pool.
 
     Returns:
         boto3 DynamoDB resource
     """
-    region = os.getenv("AWS_REGION", "us-east-1")
-    return boto3.resource("dynamodb", region_name=region)
+    key = _registry_key()
+    registry = _thread_registry()
+    resource = registry["resources"].get(key)
+    if resource is None:
+        client = get_dynamodb_client()
+        with _registry_lock:
+            # Sessions aren't thread-safe either; build resources one at a time
+            resource = _get_session(key).resource(
+                "dynamodb", endpoint_url=key[1], config=get_dynamodb_config()
+            )
+        resource.meta.client = client
+        registry["resources"][key] = resource
+    return resource
+
+
+def get_dynamodb_table(table_name: str):
+    """
+    Get a cached DynamoDB Table handle for the calling thread.
+
+    Args:
+        table_name: DynamoDB table name
+
+    Returns:
+        boto3 DynamoDB Table resource
+    """
+    key = (*_registry_key(), table_name)
+    tables = _thread_registry()["tables"]
+    table = tables.get(key)
+    if table is None:
+        table = tables[key] = get_dynamodb_resource().Table(table_name)
+    return table
+
+
+def reset_dynamodb_clients() -> None:
+    """
+    Drop all cached sessions, clients, resources and table handles.
+
+    Call after forking a worker process or when credentials/configuration
+    change at runtime. Other threads drop their handles on their next call.
+    """
+    global _generation
+    with _registry_lock:
+        _generation += 1
+        _local.__dict__.clear()
+        _clients.clear()
+        _sessions.clear()
@@ -0,0 +1,65 @@
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# One S3 client per (region, endpoint), shared by every caller so uploads reuse
+# the same connection pool
+_registry_lock = threading.Lock()
+_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
+def _registry_key() -> Tuple[str, Optional[str]]:
+    """Region and optional endpoint override (e.g. MinIO or LocalStack)."""
+    region = os.getenv("AWS_REGION", "us-east-1")
+    endpoint_url = os.getenv("S3_ENDPOINT_URL") or None
+    return region, endpoint_url
+
+
+def get_s3_config() -> Config:
+    """
+    Build the botocore Config used for S3 connections.
+
+    Tunable via environment variables:
+    - S3_MAX_POOL_CONNECTIONS: HTTP connection pool size (default 50)
+    - S3_MAX_ATTEMPTS: Total attempts including retries (default 5)
+
+    Returns:
+        botocore Config
+    """
+    return Config(
+        max_pool_connections=int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50")),
+        retries={
+            "max_attempts": int(os.getenv("S3_MAX_ATTEMPTS", "5")),
+            "mode": "standard",
+        },
+        tcp_keepalive=True,
+    )
+
+
+def get_s3_client():
+    """
+    Get the shared S3 client.
+
+    Returns:
+        boto3 S3 client
+    """
+    key = _registry_key()
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _registry_lock:
+        if key not in _clients:
+            _clients[key] = boto3.session.Session(region_name=key[0]).client(
+                "s3", endpoint_url=key[1], config=get_s3_config()
+            )
+        return _clients[key]
+
+
+def reset_s3_clients() -> None:
+    """Drop the cached S3 clients (e.g. after forking a worker process)."""
+    with _registry_lock:
+        _clients.clear()
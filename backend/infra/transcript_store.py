@@ -0,0 +1,229 @@
+"""
+Blob storage for execution transcripts.
+
+A transcript is the complete record of one agent execution (messages, tool
+results, token usage), serialised once and compressed. DynamoDB keeps only a
+pointer to it plus summary fields (see
+app/db_commands/execution_history_commands.py), so large scraped pages no
+longer count against the 400KB item limit or the table's write capacity.
+
+Backends (TRANSCRIPT_STORE):
+- "s3": objects in TRANSCRIPT_BUCKET under TRANSCRIPT_PREFIX
+- "local": files under TRANSCRIPT_DIR (development and tests)
+- unset: transcripts stay inline in DynamoDB (previous behaviour)
+
+Transcripts are compressed with zstd (TRANSCRIPT_COMPRESSION, default) when
+the zstandard package is installed, otherwise with gzip. The codec is
+recorded with each pointer, so either can be read back.
+"""
+
+import gzip
+import logging
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Optional: gzip is used instead
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+_store: Optional["TranscriptStore"] = None
+_store_settings: Optional[Tuple[str, ...]] = None
+_store_lock = threading.Lock()
+
+
+class TranscriptStore(ABC):
+    """
+    Key/value blob store for compressed transcripts.
+
+    Subclasses implement put, get and delete for one storage backend.
+    """
+
+    backend = ""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``, replacing any existing blob."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """Read the blob stored under ``key``."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the blob stored under ``key`` (no error if it is missing)."""
+
+
+class S3TranscriptStore(TranscriptStore):
+    """
+    Transcripts stored as S3 objects.
+
+    Args:
+        bucket: S3 bucket name
+        prefix: Key prefix for every transcript (e.g. "transcripts/")
+    """
+
+    backend = "s3"
+
+    def __init__(self, bucket: str, prefix: str = ""):
+        from .s3_client import get_s3_client
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = get_s3_client()
+
+    def put(self, key: str, data: bytes) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self.prefix + key,
+            Body=data,
+            ContentType="application/octet-stream",
+        )
+
+    def get(self, key: str) -> bytes:
+        response = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        return response["Body"].read()
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+
+class LocalTranscriptStore(TranscriptStore):
+    """
+    Transcripts stored as files, a stand-in for S3 outside AWS.
+
+    Args:
+        directory: Root directory of the transcript files
+    """
+
+    backend = "local"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.directory, key))
+        if not path.startswith(os.path.abspath(self.directory) + os.sep):
+            raise ValueError(f"Invalid transcript key: {key}")
+        return path
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key: str) -> bytes:
+        with open(self._path(key), "rb") as f:
+            return f.read()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+def get_transcript_compression() -> str:
+    """
+    Codec for new transcripts: TRANSCRIPT_COMPRESSION ("zstd" or "gzip",
+    default "zstd"), falling back to gzip if zstandard is not installed.
+    """
+    codec = os.getenv("TRANSCRIPT_COMPRESSION", "zstd").lower()
+    if codec == "zstd" and zstandard is None:
+        return "gzip"
+    if codec not in ("zstd", "gzip"):
+        raise ValueError(f"Unsupported transcript compression: {codec}")
+    return codec
+
+
+def compress_transcript(data: bytes, codec: str) -> bytes:
+    """
+    Compress a serialised transcript.
+
+    Args:
+        data: Serialised transcript
+        codec: "zstd" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    if codec == "zstd":
+        level = int(os.getenv("TRANSCRIPT_ZSTD_LEVEL", "3"))
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def decompress_transcript(data: bytes, codec: str) -> bytes:
+    """
+    Decompress a stored transcript.
+
+    Args:
+        data: Compressed bytes
+        codec: Codec recorded in the transcript pointer
+
+    Returns:
+        Serialised transcript
+
+    Raises:
+        ValueError: If the codec is unknown or zstandard is not installed
+    """
+    if codec == "gzip":
+        return gzip.decompress(data)
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstandard is required to read zstd transcripts")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unsupported transcript compression: {codec}")
+
+
+def get_transcript_store() -> Optional[TranscriptStore]:
+    """
+    Get the transcript store configured by TRANSCRIPT_STORE.
+
+    The store is rebuilt when its settings change. A misconfigured store
+    logs a warning and returns None, so transcripts stay inline.
+
+    Returns:
+        The TranscriptStore, or None if transcripts are not offloaded
+    """
+    global _store, _store_settings
+
+    settings = (
+        os.getenv("TRANSCRIPT_STORE", "").lower(),
+        os.getenv("TRANSCRIPT_BUCKET", ""),
+        os.getenv("TRANSCRIPT_PREFIX", "transcripts/"),
+        os.getenv("TRANSCRIPT_DIR", ""),
+    )
+    if settings == _store_settings:
+        return _store
+
+    with _store_lock:
+        if settings != _store_settings:
+            backend, bucket, prefix, directory = settings
+            store = None
+            if backend == "s3" and bucket:
+                store = S3TranscriptStore(bucket, prefix)
+            elif backend == "local" and directory:
+                store = LocalTranscriptStore(directory)
+            elif backend:
+                logger.warning(
+                    f"Transcript store '{backend}' is not configured "
+                    "(set TRANSCRIPT_BUCKET or TRANSCRIPT_DIR); "
+                    "keeping transcripts in DynamoDB"
+                )
+            _store, _store_settings = store, settings
+        return _store
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Build a verification platform store file (see app/tools/platform_store.py).
+
+The corpus is a JSON object mapping claim key terms to verification results
+(the format of VERIFICATION_PLATFORM_DB), or JSON Lines with one
+{"key": ..., "entry": {...}} object per line. Without --input, the built-in
+sample corpus is exported.
+
+The store is replaced atomically, so running workers pick it up on their
+next reload check (VERIFICATION_STORE_RELOAD_SECONDS).
+
+Usage:
+    python scripts/build_platform_store.py --output /var/data/platform.vpstore
+    python scripts/build_platform_store.py --input fact_checks.jsonl --output platform.vpstore
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.tools.platform_store import (MappedVerificationIndex,
+                                      write_verification_store)
+from app.tools.platform_verification_tool import VERIFICATION_PLATFORM_DB
+
+
+def read_corpus(path: str) -> Dict[str, Dict[str, Any]]:
+    """Read a JSON object or JSON Lines corpus."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            corpus = {}
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    corpus[record["key"]] = record["entry"]
+            return corpus
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", help="corpus (.json or .jsonl)")
+    parser.add_argument("--output", required=True, help="store file to write")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("BUILD VERIFICATION PLATFORM STORE")
+    print("=" * 70)
+
+    corpus = read_corpus(args.input) if args.input else VERIFICATION_PLATFORM_DB
+    print(f"Entries: {len(corpus):,} ({args.input or 'built-in sample corpus'})")
+
+    start = time.perf_counter()
+    write_verification_store(corpus, args.output)
+    elapsed = time.perf_counter() - start
+
+    index = MappedVerificationIndex(args.output)
+    size_mib = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"Terms:   {len(index.terms):,}")
+    print(f"Written: {args.output} ({size_mib:.1f} MiB) in {elapsed:.2f}s")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
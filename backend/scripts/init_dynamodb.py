@@ -5,7 +5,10 @@ Initialize DynamoDB tables for the fake news detection system.
 Creates the required DynamoDB tables:
 - agent-configs: Agent configuration storage
 - ai-prompts: System prompt storage
-- execution-history: Agent execution logs
+- execution-history: Agent execution logs, with the config_id-index GSI
+  (config_id + timestamp) used to page through a config's executions
+- summary cache (optional): Memoised summaries, when SUMMARY_CACHE_TABLE is set
+- verdict cache (optional): Cached verdicts, when VERDICT_CACHE_TABLE is set
 
 Usage:
     python scripts/init_dynamodb.py
@@ -22,22 +25,32 @@ load_dotenv()
 
 
 def create_table_if_not_exists(
-    dynamodb_resource, table_name, key_schema, attribute_definitions
+    dynamodb_resource,
+    table_name,
+    key_schema,
+    attribute_definitions,
+    global_secondary_indexes=None,
 ):
     """Helper to create table if it doesn't exist"""
     try:
         table = dynamodb_resource.Table(table_name)
         table.load()
         print(f"   ✓ Table '{table_name}' already exists")
+        for index in global_secondary_indexes or []:
+            add_index_if_not_exists(table, index, attribute_definitions)
         return table
     except ClientError as e:
         if e.response["Error"]["Code"] == "ResourceNotFoundException":
             print(f"   Creating table '{table_name}'...")
+            create_kwargs = {}
+            if global_secondary_indexes:
+                create_kwargs["GlobalSecondaryIndexes"] = global_secondary_indexes
             table = dynamodb_resource.create_table(
                 TableName=table_name,
                 KeySchema=key_schema,
                 AttributeDefinitions=attribute_definitions,
                 BillingMode="PAY_PER_REQUEST",
+                **create_kwargs,
             )
             table.wait_until_exists()
             print(f"   ✓ Table '{table_name}' created successfully")
@@ -46,6 +59,22 @@ def create_table_if_not_exists(
             raise
 
 
+def add_index_if_not_exists(table, index, attribute_definitions):
+    """Helper to add a global secondary index to an existing table"""
+    existing = [i["IndexName"] for i in table.global_secondary_indexes or []]
+    if index["IndexName"] in existing:
+        print(f"   ✓ Index '{index['IndexName']}' already exists")
+        return
+
+    print(f"   Adding index '{index['IndexName']}' (backfills in the background)...")
+    table.meta.client.update_table(
+        TableName=table.name,
+        AttributeDefinitions=attribute_definitions,
+        GlobalSecondaryIndexUpdates=[{"Create": index}],
+    )
+    print(f"   ✓ Index '{index['IndexName']}' is being created")
+
+
 def test_dynamodb():
     """Test DynamoDB access and create tables"""
     print("=" * 60)
@@ -115,13 +144,58 @@ def test_dynamodb():
             execution_table,
             key_schema=[{"AttributeName": "execution_id", "KeyType": "HASH"}],
             attribute_definitions=[
-                {"AttributeName": "execution_id", "AttributeType": "S"}
+                {"AttributeName": "execution_id", "AttributeType": "S"},
+                {"AttributeName": "config_id", "AttributeType": "S"},
+                {"AttributeName": "timestamp", "AttributeType": "S"},
+            ],
+            # Used by query_execution_history (see execution_history_commands.py)
+            global_secondary_indexes=[
+                {
+                    "IndexName": "config_id-index",
+                    "KeySchema": [
+                        {"AttributeName": "config_id", "KeyType": "HASH"},
+                        {"AttributeName": "timestamp", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
             ],
         )
     except Exception as e:
         print(f"   ❌ Failed: {e}")
         return False
 
+    # Optional: cache tables (items expire via DynamoDB TTL)
+    optional_cache_tables = [
+        ("4b", "summary cache", os.getenv("SUMMARY_CACHE_TABLE")),
+        ("4c", "verdict cache", os.getenv("VERDICT_CACHE_TABLE")),
+    ]
+    for step, label, cache_table in optional_cache_tables:
+        if not cache_table:
+            continue
+        print(f"\n{step}. Creating/Checking {label} table...")
+        try:
+            create_table_if_not_exists(
+                dynamodb_resource,
+                cache_table,
+                key_schema=[{"AttributeName": "cache_key", "KeyType": "HASH"}],
+                attribute_definitions=[
+                    {"AttributeName": "cache_key", "AttributeType": "S"}
+                ],
+            )
+            ttl = dynamodb.describe_time_to_live(TableName=cache_table)
+            if ttl["TimeToLiveDescription"]["TimeToLiveStatus"] == "DISABLED":
+                dynamodb.update_time_to_live(
+                    TableName=cache_table,
+                    TimeToLiveSpecification={
+                        "Enabled": True,
+                        "AttributeName": "expires_at",
+                    },
+                )
+                print(f"   ✓ TTL enabled on 'expires_at'")
+        except Exception as e:
+            print(f"   ❌ Failed: {e}")
+            return False
+
     # Test 5: Test read/write operations
     print(f"\n5. Testing read/write operations...")
     try:
@@ -20,9 +20,9 @@ from dotenv import load_dotenv
 load_dotenv()
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.db_commands.agent_config_commands import create_agent_config
+from app.db_commands.agent_config_commands import (agent_config_from_item,
+                                                   create_agent_config)
 from app.db_commands.prompt_commands import save_prompt
-from app.entity.AgentConfig import AgentConfig, KnowledgeBaseConfig
 
 CONFIGS_DIR = Path(__file__).parent.parent / "configs"
 PROMPTS_DIR = CONFIGS_DIR / "prompts"
@@ -131,36 +131,8 @@ def deploy_agent(name: str):
     print(f"   Tools: {config_data.get('tools', [])}")
 
     try:
-        # Convert to AgentConfig object
-        kb_data = config_data.get("knowledge_base", {})
-        knowledge_base = (
-            KnowledgeBaseConfig(
-                enabled=kb_data.get("enabled", False),
-                vector_store=kb_data.get("vector_store", "chroma"),
-                index_name=kb_data.get("index_name", ""),
-                embedding_model=kb_data.get(
-                    "embedding_model", "text-embedding-3-small"
-                ),
-                top_k=kb_data.get("top_k", 5),
-            )
-            if kb_data
-            else None
-        )
-
-        agent_config = AgentConfig(
-            name=config_data["name"],
-            description=config_data["description"],
-            config_id=config_data["config_id"],
-            tools=config_data.get("tools", []),
-            prompt_id=config_data["prompt_id"],
-            sub_agents=[],  # TODO: Handle sub-agents if needed
-            knowledge_base=knowledge_base,
-            llm_provider=config_data.get("llm_provider", "anthropic"),
-            model_id=config_data.get("model_id", "claude-3-5-sonnet-20241022"),
-            temperature=config_data.get("temperature", 0.7),
-            max_tokens=config_data.get("max_tokens", 4096),
-            max_iterations=config_data.get("max_iterations", 10),
-        )
+        # Missing fields take the AgentConfig defaults
+        agent_config = agent_config_from_item(config_data)
 
         create_agent_config(agent_config)
         print(f"✅ Agent config updated successfully!")
@@ -0,0 +1,65 @@
+"""
+Shared pytest setup for the offline unit tests.
+
+The integration scripts in this directory (quick_test.py,
+test_platform_verification.py, ...) call Bedrock and DynamoDB and are run
+directly with python (see README.md); pytest skips them.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+collect_ignore = [
+    "quick_test.py",
+    "quick_test_verbose.py",
+    "test_fake_news_agent_local.py",
+    "test_platform_verification.py",
+]
+
+
+@pytest.fixture
+def fake_tables():
+    """
+    In-memory agent-config, prompt and execution-history tables, served by
+    patching infra.dynamodb_client for the duration of the test.
+    """
+    from tests.fakes import install_backend_tables, uninstall_fake_dynamodb
+
+    tables = install_backend_tables()
+    yield tables
+    uninstall_fake_dynamodb()  # Including tables the test installed itself
+
+
+@pytest.fixture
+def scripted_agent(fake_tables, monkeypatch):
+    """
+    Agent config backed by the scripted LLM and stub tools of tests/fakes.py.
+
+    One tool round, synchronous history writes and an empty verdict cache.
+    """
+    from app.agents.agent_cache import invalidate_agent
+    from app.agents.verdict_cache import invalidate_verdicts
+    from app.db_commands.agent_config_commands import create_agent_config
+    from app.db_commands.prompt_commands import save_prompt
+    from tests.fakes import (PROMPT_ID, ScriptedChatModel, scenario_config,
+                             stub_custom_tools)
+
+    monkeypatch.setenv("EXECUTION_HISTORY_WRITE_BEHIND", "false")
+    monkeypatch.setenv("VERDICT_CACHE_ENABLED", "true")
+    monkeypatch.setattr(
+        "app.agents.agent_factory.create_llm", lambda **kwargs: ScriptedChatModel()
+    )
+    monkeypatch.setattr("app.tools.tool_loader.load_custom_tools", stub_custom_tools)
+
+    save_prompt(PROMPT_ID, "You verify claims.")
+    agent_config = scenario_config(1, 1)
+    create_agent_config(agent_config)
+    invalidate_agent(agent_config.config_id)
+    invalidate_verdicts()
+    yield agent_config
+    invalidate_agent(agent_config.config_id)
+    invalidate_verdicts()
@@ -0,0 +1,535 @@
+"""
+In-memory fakes shared by the unit tests and the benchmarks.
+
+FakeTable implements the subset of the boto3 Table API that db_commands uses
+(get_item, put_item, delete_item, scan, query, batch_writer). Items go through
+boto3's TypeSerializer/TypeDeserializer, so type errors a real table would
+raise (e.g. Python floats) still surface, and numbers come back as Decimal.
+Scans and queries are paginated like DynamoDB's (Limit, 1MB pages,
+LastEvaluatedKey) and support projections; scans also support parallel
+segments, and queries global secondary indexes with a sort key.
+
+install_fake_dynamodb() patches infra.dynamodb_client to serve fake tables,
+so get_dynamodb_table() returns them on every thread without any AWS calls or
+patching of individual db_commands modules.
+
+ScriptedChatModel replays a fixed investigation: for the first ``tool_turns``
+model calls it requests ``tool_fanout`` tool calls, then it returns a final
+verdict. The turn is derived from the id of the latest tool result in the
+conversation ("call_<turn>_<i>"), so one model instance can serve many
+concurrent requests and histories trimmed to a token budget keep the script.
+``latency_seconds`` simulates a slow endpoint (blocking sleep for invoke,
+asyncio.sleep for ainvoke). scenario_config() and stub_custom_tools() wire it
+into an agent config with a stub verification tool.
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+import zlib
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple)
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+from langchain_core.callbacks import (AsyncCallbackManagerForLLMRun,
+                                      CallbackManagerForLLMRun)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (AIMessage, AIMessageChunk, BaseMessage,
+                                     ToolMessage)
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import (ChatGeneration, ChatGenerationChunk,
+                                    ChatResult)
+from langchain_core.tools import tool
+
+from app.entity.AgentConfig import AgentConfig
+from infra import dynamodb_client
+
+# DynamoDB
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+# DynamoDB returns at most 1MB of items per Scan/Query page
+PAGE_BYTES = 1024 * 1024
+
+# One KeyConditionExpression clause: "name BETWEEN :a AND :b" or "name <op> :v"
+_KEY_CONDITION = re.compile(
+    r"([#\w]+)\s+BETWEEN\s+(:\w+)\s+AND\s+(:\w+)|([#\w]+)\s*(=|<=|>=|<|>)\s*(:\w+)",
+    re.IGNORECASE,
+)
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": lambda a, b: a == b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def _roundtrip(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize and deserialize an item like a DynamoDB round trip would."""
+    return {
+        key: _deserializer.deserialize(_serializer.serialize(value))
+        for key, value in item.items()
+    }
+
+
+def _key_conditions(kwargs: Dict[str, Any]) -> List[Callable[[Dict], bool]]:
+    """Parse a KeyConditionExpression into per-item predicates."""
+    names = kwargs.get("ExpressionAttributeNames", {})
+    values = kwargs.get("ExpressionAttributeValues", {})
+    conditions = []
+    for match in _KEY_CONDITION.finditer(kwargs["KeyConditionExpression"]):
+        if match.group(1):
+            name = names.get(match.group(1), match.group(1))
+            low, high = values[match.group(2)], values[match.group(3)]
+            conditions.append(
+                lambda item, n=name, lo=low, hi=high: n in item and lo <= item[n] <= hi
+            )
+        else:
+            name = names.get(match.group(4), match.group(4))
+            compare, value = _OPERATORS[match.group(5)], values[match.group(6)]
+            conditions.append(
+                lambda item, n=name, c=compare, v=value: n in item and c(item[n], v)
+            )
+    return conditions
+
+
+def _project(page: List[Dict[str, Any]], kwargs: Dict[str, Any]) -> List[Dict]:
+    """Apply a ProjectionExpression (if any) to a page of items."""
+    if "ProjectionExpression" not in kwargs:
+        return page
+    names = kwargs.get("ExpressionAttributeNames", {})
+    attributes = [
+        names.get(name.strip(), name.strip())
+        for name in kwargs["ProjectionExpression"].split(",")
+    ]
+    return [{name: item[name] for name in attributes if name in item} for item in page]
+
+
+def _take_page(items: List[Dict[str, Any]], limit: Optional[int]) -> List[Dict]:
+    """Take items up to Limit and PAGE_BYTES (at least one item)."""
+    page, page_bytes = [], 0
+    for item in items[:limit]:
+        page_bytes += len(str(item))  # Close enough to the wire size
+        if page and page_bytes > PAGE_BYTES:
+            break
+        page.append(item)
+    return page
+
+
+class FakeTable:
+    """
+    Thread-safe in-memory DynamoDB table with a single hash key.
+
+    Args:
+        name: Table name
+        hash_key: Partition key attribute
+        indexes: Global secondary indexes, index name -> (hash key, sort key)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        hash_key: str,
+        indexes: Optional[Dict[str, Tuple[str, str]]] = None,
+    ):
+        self.name = name
+        self.table_name = name
+        self.hash_key = hash_key
+        self.indexes = indexes or {}
+        self.items: Dict[Any, Dict[str, Any]] = {}
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    def get_item(self, Key: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._count("get_item")
+            item = self.items.get(Key[self.hash_key])
+            return {"Item": _roundtrip(item)} if item is not None else {}
+
+    def put_item(self, Item: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        stored = _roundtrip(Item)
+        with self._lock:
+            self._count("put_item")
+            self.items[stored[self.hash_key]] = stored
+        return {}
+
+    def delete_item(self, Key: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._count("delete_item")
+            item = self.items.pop(Key[self.hash_key], None)
+        if item is not None and kwargs.get("ReturnValues") == "ALL_OLD":
+            return {"Attributes": _roundtrip(item)}
+        return {}
+
+    def scan(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Return one page of items (filter expressions are not evaluated).
+
+        Supports Limit, ExclusiveStartKey, Segment/TotalSegments and
+        ProjectionExpression (attribute names or ExpressionAttributeNames
+        placeholders); pages stop at ``PAGE_BYTES`` of items.
+        """
+        with self._lock:
+            self._count("scan")
+            keys = sorted(self.items, key=str)
+            if "TotalSegments" in kwargs:
+                keys = [
+                    key
+                    for key in keys
+                    if zlib.crc32(str(key).encode()) % kwargs["TotalSegments"]
+                    == kwargs["Segment"]
+                ]
+            if "ExclusiveStartKey" in kwargs:
+                start = str(kwargs["ExclusiveStartKey"][self.hash_key])
+                keys = [key for key in keys if str(key) > start]
+
+            page = _take_page([self.items[key] for key in keys], kwargs.get("Limit"))
+
+        response = {"Items": _project([_roundtrip(i) for i in page], kwargs)}
+        response["Count"] = len(page)
+        if len(page) < len(keys):
+            response["LastEvaluatedKey"] = {self.hash_key: keys[len(page) - 1]}
+        return response
+
+    def query(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Return one page of the items matching KeyConditionExpression.
+
+        Supports "=", comparison and BETWEEN clauses joined by AND,
+        IndexName, ScanIndexForward, Limit, ExclusiveStartKey and
+        ProjectionExpression. Items are ordered by the index's sort key.
+        """
+        if "IndexName" in kwargs:
+            index_hash, index_range = self.indexes[kwargs["IndexName"]]
+        else:
+            index_hash, index_range = self.hash_key, None
+        key_attributes = [self.hash_key, index_hash, index_range]
+        key_attributes = [name for name in dict.fromkeys(key_attributes) if name]
+
+        def sort_key(item: Dict[str, Any]) -> Tuple[str, str]:
+            return str(item.get(index_range, "")), str(item[self.hash_key])
+
+        conditions = _key_conditions(kwargs)
+        with self._lock:
+            self._count("query")
+            matches = [
+                item
+                for item in self.items.values()
+                if all(name in item for name in key_attributes)
+                and all(condition(item) for condition in conditions)
+            ]
+
+        forward = kwargs.get("ScanIndexForward", True)
+        matches.sort(key=sort_key, reverse=not forward)
+        if "ExclusiveStartKey" in kwargs:
+            start = sort_key(kwargs["ExclusiveStartKey"])
+            matches = [
+                item
+                for item in matches
+                if (sort_key(item) > start if forward else sort_key(item) < start)
+            ]
+
+        page = _take_page(matches, kwargs.get("Limit"))
+        response = {"Items": _project([_roundtrip(i) for i in page], kwargs)}
+        response["Count"] = len(page)
+        if len(page) < len(matches):
+            last = page[-1]
+            response["LastEvaluatedKey"] = {name: last[name] for name in key_attributes}
+        return response
+
+    def batch_writer(self, **kwargs: Any) -> "_FakeBatchWriter":
+        return _FakeBatchWriter(self)
+
+
+class _FakeBatchWriter:
+    """Buffers puts and writes them in groups of 25, like boto3's batch_writer."""
+
+    def __init__(self, table: FakeTable):
+        self.table = table
+        self._buffer: List[Dict[str, Any]] = []
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self._buffer.append(_roundtrip(Item))
+        if len(self._buffer) >= 25:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self.table._lock:
+            self.table._count("batch_write_item")
+            for item in self._buffer:
+                self.table.items[item[self.table.hash_key]] = item
+        self._buffer = []
+
+    def __enter__(self) -> "_FakeBatchWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._buffer:
+            self._flush()
+
+
+class FakeDynamoDBResource:
+    """Stand-in for the boto3 DynamoDB resource serving the installed fakes."""
+
+    def __init__(self):
+        self.tables: Dict[str, FakeTable] = {}
+
+    def Table(self, name: str) -> FakeTable:
+        return self.tables[name]
+
+
+_fake_resource = FakeDynamoDBResource()
+_real_get_dynamodb_resource = dynamodb_client.get_dynamodb_resource
+
+
+def install_fake_dynamodb(
+    tables: Iterable[tuple], table_class: type = FakeTable
+) -> Dict[str, FakeTable]:
+    """
+    Serve in-memory tables from infra.dynamodb_client.
+
+    Patches dynamodb_client.get_dynamodb_resource (which get_dynamodb_table
+    calls) to return a FakeDynamoDBResource, so every thread gets the same
+    thread-safe fakes.
+
+    Args:
+        tables: (table_name, hash_key) pairs, or (table_name, hash_key,
+            indexes) to define global secondary indexes
+        table_class: FakeTable or a subclass (e.g. one injecting latency or
+            errors)
+
+    Returns:
+        Dictionary of table name -> FakeTable
+    """
+    fakes = {}
+    for table_name, hash_key, *indexes in tables:
+        fakes[table_name] = table_class(table_name, hash_key, *indexes)
+    _fake_resource.tables.update(fakes)
+    dynamodb_client.get_dynamodb_resource = lambda: _fake_resource
+    dynamodb_client.reset_dynamodb_clients()  # Drop cached Table handles
+    return fakes
+
+
+def install_backend_tables() -> Dict[str, FakeTable]:
+    """Install fake agent-config, prompt and execution-history tables."""
+    from app.db_commands.agent_config_commands import get_table_name
+    from app.db_commands.execution_history_commands import (
+        EXECUTION_CONFIG_INDEX, get_execution_table_name)
+    from app.db_commands.prompt_commands import get_prompts_table_name
+
+    return install_fake_dynamodb(
+        [
+            (get_table_name(), "config_id"),
+            (get_prompts_table_name(), "prompt_id"),
+            (
+                get_execution_table_name(),
+                "execution_id",
+                {EXECUTION_CONFIG_INDEX: ("config_id", "timestamp")},
+            ),
+        ]
+    )
+
+
+def uninstall_fake_dynamodb(tables: Optional[Iterable[str]] = None) -> None:
+    """
+    Drop the fake tables (all of them if tables is None), and restore the
+    real DynamoDB resource once none are left.
+    """
+    for table_name in list(_fake_resource.tables if tables is None else tables):
+        _fake_resource.tables.pop(table_name, None)
+    if not _fake_resource.tables:
+        dynamodb_client.get_dynamodb_resource = _real_get_dynamodb_resource
+    dynamodb_client.reset_dynamodb_clients()
+
+
+class SlowTable(FakeTable):
+    """
+    Execution history table with a fixed latency per request, and injectable
+    failures for the next ``fail_next`` batch writes.
+    """
+
+    latency = 0.0
+    fail_next = 0
+    failure: Exception = None
+
+    def put_item(self, Item: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        time.sleep(self.latency)
+        return super().put_item(Item, **kwargs)
+
+    def batch_writer(self, **kwargs: Any) -> Any:
+        time.sleep(self.latency)
+        if self.fail_next:
+            self.fail_next -= 1
+            raise self.failure
+        return super().batch_writer(**kwargs)
+
+
+def throttling_error() -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+        "BatchWriteItem",
+    )
+
+
+# Chat model and agent
+
+FINAL_VERDICT = (
+    "Platform Verification: FOUND - Status FALSE\n"
+    "Credibility Score: 5/100\n"
+    "Recommendation: likely false"
+)
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model that emits canned tool calls followed by a final verdict."""
+
+    tool_turns: int = 1
+    tool_fanout: int = 1
+    tool_name: str = "verify_on_platform"
+    tool_args: Dict[str, Any] = {"claim": "bleach cures covid"}
+    final_text: str = FINAL_VERDICT
+    latency_seconds: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ScriptedChatModel":
+        return self
+
+    def _next_message(self, messages: List[BaseMessage]) -> AIMessage:
+        turn = next(
+            (
+                int(message.tool_call_id.split("_")[1]) + 1
+                for message in reversed(messages)
+                if isinstance(message, ToolMessage)
+            ),
+            0,
+        )
+        input_chars = sum(len(str(message.content)) for message in messages)
+        usage = {
+            "input_tokens": input_chars // 4,
+            "output_tokens": 20,
+            "total_tokens": input_chars // 4 + 20,
+        }
+
+        if turn < self.tool_turns:
+            tool_calls = [
+                {
+                    "name": self.tool_name,
+                    "args": dict(self.tool_args),
+                    "id": f"call_{turn}_{i}",
+                }
+                for i in range(self.tool_fanout)
+            ]
+            return AIMessage(content="", tool_calls=tool_calls, usage_metadata=usage)
+
+        return AIMessage(content=self.final_text, usage_metadata=usage)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._next_message(messages))]
+        )
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._next_message(messages))]
+        )
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        message = self._next_message(messages)
+
+        if message.tool_calls:
+            tool_call_chunks = [
+                tool_call_chunk(
+                    name=tool_call["name"],
+                    args=json.dumps(tool_call["args"]),
+                    id=tool_call["id"],
+                    index=i,
+                )
+                for i, tool_call in enumerate(message.tool_calls)
+            ]
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=tool_call_chunks,
+                    usage_metadata=message.usage_metadata,
+                )
+            )
+            if run_manager:
+                run_manager.on_llm_new_token("", chunk=chunk)
+            yield chunk
+            return
+
+        words = message.content.split(" ")
+        for i, word in enumerate(words):
+            token = word if i == len(words) - 1 else word + " "
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(content="", usage_metadata=message.usage_metadata)
+        )
+
+
+PROMPT_ID = "bench-prompt"
+USER_INPUT = "Drinking bleach cures COVID-19"
+TOOL_OUTPUT = "PLATFORM VERIFICATION RESULT:\nStatus: FALSE\n" + "x" * 200
+
+
+@tool
+def verify_on_platform(claim: str) -> str:
+    """Stub verification tool returning a fixed-size result."""
+    return TOOL_OUTPUT
+
+
+def stub_custom_tools(
+    tool_names: List[str], agent_config: Any = None
+) -> Dict[str, Any]:
+    return {"verify_on_platform": verify_on_platform}
+
+
+def scenario_config(tool_turns: int, fanout: int) -> AgentConfig:
+    return AgentConfig(
+        name=f"Benchmark agent ({tool_turns} rounds x {fanout} tools)",
+        description="Scripted agent for bench_agent_loop.py",
+        config_id=f"bench-t{tool_turns}-f{fanout}",
+        tools=["verify_on_platform"],
+        prompt_id=PROMPT_ID,
+        llm_provider="bedrock",
+        model_id="scripted",
+        max_iterations=tool_turns + 1,
+        max_tool_concurrency=fanout,
+    )
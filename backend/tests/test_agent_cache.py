@@ -0,0 +1,41 @@
+"""Offline tests for the compiled agent cache in app/agents/agent_cache.py."""
+
+import dataclasses
+
+from app.agents.agent_cache import get_or_create_agent, invalidate_agent
+from app.db_commands.agent_config_commands import (get_agent_config,
+                                                   update_agent_config)
+from app.db_commands.prompt_commands import save_prompt
+from tests.fakes import PROMPT_ID
+
+
+def test_unchanged_config_reuses_the_agent(scripted_agent):
+    agent = get_or_create_agent(scripted_agent)
+
+    assert get_or_create_agent(get_agent_config(scripted_agent.config_id)) is agent
+
+
+def test_prompt_change_builds_a_new_agent(scripted_agent):
+    agent = get_or_create_agent(scripted_agent)
+
+    save_prompt(PROMPT_ID, "You verify claims against primary sources.")
+
+    assert get_or_create_agent(scripted_agent) is not agent
+
+
+def test_config_update_builds_a_new_agent(scripted_agent):
+    agent = get_or_create_agent(scripted_agent)
+
+    update_agent_config(dataclasses.replace(scripted_agent, temperature=0.9))
+    updated = get_agent_config(scripted_agent.config_id)
+
+    assert updated.temperature == 0.9
+    assert get_or_create_agent(updated) is not agent
+
+
+def test_invalidate_agent_evicts_the_cached_agent(scripted_agent):
+    agent = get_or_create_agent(scripted_agent)
+
+    assert invalidate_agent("another-config") == 0
+    assert invalidate_agent(scripted_agent.config_id) == 1
+    assert get_or_create_agent(scripted_agent) is not agent
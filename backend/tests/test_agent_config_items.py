@@ -0,0 +1,90 @@
+"""Offline tests for the AgentConfig <-> DynamoDB item conversion."""
+
+import json
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from app.agents.agent_cache import compute_config_hash
+from app.db_commands.agent_config_commands import (
+    agent_config_from_item, agent_config_to_item, create_agent_config,
+    get_agent_config, invalidate_agent_config_cache, iter_agent_configs)
+from app.entity.AgentConfig import (AgentConfig, KnowledgeBaseConfig,
+                                    SubAgentConfig)
+
+AGENTS_DIR = Path(__file__).parent.parent / "configs" / "agents"
+
+
+def make_config() -> AgentConfig:
+    return AgentConfig(
+        name="Fact checker",
+        description="Verifies claims",
+        config_id="config-1",
+        tools=["search_internet", "verify_on_platform"],
+        prompt_id="prompt-1",
+        sub_agents=[
+            SubAgentConfig(
+                name="researcher",
+                description="Searches for sources",
+                config_id="config-1-sub",
+                agent_config_id="config-1",
+                knowledge_base=KnowledgeBaseConfig(enabled=True, top_k=3),
+                temperature=0.2,
+                max_tokens=2048,
+            )
+        ],
+        knowledge_base=KnowledgeBaseConfig(enabled=True, index_name="claims"),
+        temperature=0.5,
+        max_tool_concurrency=4,
+        context_token_budget=12000,
+    )
+
+
+def test_item_stores_floats_as_decimal():
+    item = agent_config_to_item(make_config())
+
+    assert item["temperature"] == Decimal("0.5")
+    assert item["sub_agents"][0]["temperature"] == Decimal("0.2")
+    assert item["knowledge_base"]["index_name"] == "claims"
+
+
+def test_round_trip_through_dynamodb_keeps_types_and_hash(fake_tables):
+    config = make_config()
+    create_agent_config(config)
+    invalidate_agent_config_cache()
+
+    stored = fake_tables["agent-configs"].items[config.config_id]
+    assert isinstance(stored["max_tokens"], Decimal)
+
+    loaded = get_agent_config(config.config_id)
+    assert loaded == config
+    assert type(loaded.max_tokens) is int
+    assert type(loaded.temperature) is float
+    assert type(loaded.sub_agents[0].knowledge_base.top_k) is int
+    assert compute_config_hash(loaded) == compute_config_hash(config)
+    assert list(iter_agent_configs()) == [config]
+
+
+def test_missing_keys_take_defaults():
+    config = agent_config_from_item(
+        {"name": "n", "description": "d", "config_id": "c", "knowledge_base": {}}
+    )
+
+    assert config == AgentConfig(name="n", description="d", config_id="c")
+
+
+def test_required_keys_are_required():
+    with pytest.raises(KeyError):
+        agent_config_from_item({"name": "n", "description": "d"})
+
+
+@pytest.mark.parametrize("path", sorted(AGENTS_DIR.glob("*.json")), ids=str)
+def test_agent_templates_load(path):
+    data = json.loads(path.read_text())
+
+    config = agent_config_from_item(data)
+
+    assert config.config_id == data["config_id"]
+    assert type(config.temperature) is float
+    assert agent_config_from_item(agent_config_to_item(config)) == config
@@ -0,0 +1,82 @@
+"""Offline tests for paged and parallel scans of the agent config table."""
+
+from typing import Any, Dict
+
+import pytest
+
+from app.db_commands.agent_config_commands import (create_agent_config,
+                                                   get_table_name,
+                                                   iter_agent_config_summaries,
+                                                   iter_agent_configs,
+                                                   list_agent_configs,
+                                                   scan_agent_config_pages)
+from app.entity.AgentConfig import AgentConfig
+from tests.fakes import FakeTable, install_fake_dynamodb
+
+CONFIG_COUNT = 23
+
+
+class FailingSegmentTable(FakeTable):
+    """Agent config table whose scans of segment 1 fail."""
+
+    def scan(self, **kwargs: Any) -> Dict[str, Any]:
+        if kwargs.get("Segment") == 1:
+            raise RuntimeError("segment 1 is unreachable")
+        return super().scan(**kwargs)
+
+
+def make_config(i: int) -> AgentConfig:
+    return AgentConfig(
+        name=f"agent-{i}",
+        description="Scan test agent",
+        config_id=f"config-{i:03d}",
+        tools=["search_internet"],
+        prompt_id="prompt",
+    )
+
+
+@pytest.fixture
+def config_ids(fake_tables):
+    for i in range(CONFIG_COUNT):
+        create_agent_config(make_config(i))
+    fake_tables[get_table_name()].calls.clear()
+    return sorted(f"config-{i:03d}" for i in range(CONFIG_COUNT))
+
+
+def test_scan_follows_every_page(config_ids, fake_tables):
+    pages = list(scan_agent_config_pages(page_size=5))
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert sorted(item["config_id"] for page in pages for item in page) == config_ids
+    assert fake_tables[get_table_name()].calls["scan"] == 5
+
+
+@pytest.mark.parametrize("segments", [2, 4, 7])
+def test_segments_return_every_item_once(config_ids, segments):
+    scanned = [
+        agent_config.config_id
+        for agent_config in iter_agent_configs(page_size=2, segments=segments)
+    ]
+
+    assert sorted(scanned) == config_ids
+    assert sorted(c.config_id for c in list_agent_configs(segments=segments)) == (
+        config_ids
+    )
+
+
+def test_summaries_are_projected(config_ids):
+    summaries = list(iter_agent_config_summaries(page_size=4, segments=3))
+
+    assert sorted(summary["config_id"] for summary in summaries) == config_ids
+    assert all("tools" not in summary for summary in summaries)
+
+
+def test_failing_segment_reaches_the_caller(fake_tables):
+    install_fake_dynamodb(
+        [(get_table_name(), "config_id")], table_class=FailingSegmentTable
+    )
+    for i in range(CONFIG_COUNT):
+        create_agent_config(make_config(i))
+
+    with pytest.raises(Exception, match="segment 1 is unreachable"):
+        list_agent_configs(segments=4)
@@ -0,0 +1,57 @@
+"""Offline tests for the batch handler's persistence and verdict caching."""
+
+from unittest import mock
+
+from app.agents.verdict_cache import lookup_verdict
+from app.handlers.batch_agent_handler import handle_batch_agent_request
+from tests.fakes import FINAL_VERDICT
+
+CLAIMS = ["Drinking bleach cures COVID-19", "The moon landing was staged"]
+
+
+def test_batch_runs_every_claim(scripted_agent):
+    response = handle_batch_agent_request(scripted_agent.config_id, CLAIMS)
+
+    assert response["success"]
+    assert [item["index"] for item in response["items"]] == [0, 1]
+    assert all(item["result"] == FINAL_VERDICT for item in response["items"])
+    assert response["summary"]["succeeded"] == 2
+
+
+def test_verdicts_point_at_persisted_history(scripted_agent, fake_tables):
+    response = handle_batch_agent_request(scripted_agent.config_id, CLAIMS)
+
+    history = fake_tables["execution-history"].items
+    for claim, item in zip(CLAIMS, response["items"]):
+        cached = lookup_verdict(scripted_agent, claim)
+        assert cached["metadata"]["cached_execution_id"] == item["execution_id"]
+        assert item["execution_id"] in history
+
+
+def test_no_verdict_cached_without_persistence(scripted_agent, fake_tables):
+    response = handle_batch_agent_request(
+        scripted_agent.config_id, CLAIMS, persist=False
+    )
+
+    assert response["summary"]["succeeded"] == 2
+    assert fake_tables["execution-history"].items == {}
+    assert all(lookup_verdict(scripted_agent, claim) is None for claim in CLAIMS)
+
+
+def test_no_verdict_cached_when_persistence_fails(scripted_agent):
+    with mock.patch(
+        "app.db_commands.execution_history_commands.save_execution_histories",
+        side_effect=Exception("Failed to save execution histories: throttled"),
+    ):
+        response = handle_batch_agent_request(scripted_agent.config_id, CLAIMS)
+
+    assert response["summary"]["failed"] == 2
+    assert response["items"][0]["error"].startswith("Persistence error:")
+    assert all(lookup_verdict(scripted_agent, claim) is None for claim in CLAIMS)
+
+
+def test_cached_claims_skip_the_agent(scripted_agent):
+    handle_batch_agent_request(scripted_agent.config_id, CLAIMS)
+    response = handle_batch_agent_request(scripted_agent.config_id, CLAIMS)
+
+    assert all(item["metadata"]["cache_hit"] for item in response["items"])
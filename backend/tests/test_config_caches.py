@@ -0,0 +1,100 @@
+"""Offline tests for the agent config and prompt read-through caches."""
+
+import pytest
+
+from app.db_commands.agent_config_commands import (
+    create_agent_config, delete_agent_config, get_agent_config, get_table_name,
+    invalidate_agent_config_cache, update_agent_config)
+from app.db_commands.prompt_commands import (get_prompts_table_name,
+                                             invalidate_prompt_cache,
+                                             load_prompt, save_prompt)
+from app.entity.AgentConfig import AgentConfig
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(fake_tables):
+    invalidate_agent_config_cache()
+    invalidate_prompt_cache()
+    yield
+    invalidate_agent_config_cache()
+    invalidate_prompt_cache()
+
+
+def make_config(description: str = "First version") -> AgentConfig:
+    return AgentConfig(
+        name="Cached agent",
+        description=description,
+        config_id="cached-config",
+        tools=["search_internet"],
+        prompt_id="cached-prompt",
+    )
+
+
+def test_config_reads_are_cached(fake_tables):
+    create_agent_config(make_config())
+
+    get_agent_config("cached-config")
+    get_agent_config("cached-config")
+
+    assert fake_tables[get_table_name()].calls["get_item"] == 1
+
+
+def test_cached_miss_is_invalidated_by_create():
+    assert get_agent_config("cached-config") is None
+
+    create_agent_config(make_config())
+
+    assert get_agent_config("cached-config").description == "First version"
+
+
+def test_update_is_visible_immediately():
+    create_agent_config(make_config())
+    assert get_agent_config("cached-config").description == "First version"
+
+    update_agent_config(make_config("Second version"))
+
+    assert get_agent_config("cached-config").description == "Second version"
+
+
+def test_delete_is_visible_immediately():
+    create_agent_config(make_config())
+    get_agent_config("cached-config")
+
+    delete_agent_config("cached-config")
+
+    assert get_agent_config("cached-config") is None
+
+
+def test_callers_cannot_modify_the_cached_config():
+    create_agent_config(make_config())
+
+    get_agent_config("cached-config").tools.append("verify_on_platform")
+
+    assert get_agent_config("cached-config").tools == ["search_internet"]
+
+
+def test_prompt_reads_are_cached(fake_tables):
+    save_prompt("cached-prompt", "You verify claims.")
+
+    load_prompt("cached-prompt")
+    load_prompt("cached-prompt")
+
+    assert fake_tables[get_prompts_table_name()].calls["get_item"] == 1
+
+
+def test_cached_missing_prompt_is_invalidated_by_save():
+    with pytest.raises(Exception, match="not found"):
+        load_prompt("cached-prompt")
+
+    save_prompt("cached-prompt", "You verify claims.")
+
+    assert load_prompt("cached-prompt") == "You verify claims."
+
+
+def test_saved_prompt_is_visible_immediately():
+    save_prompt("cached-prompt", "You verify claims.")
+    assert load_prompt("cached-prompt") == "You verify claims."
+
+    save_prompt("cached-prompt", "You verify claims carefully.")
+
+    assert load_prompt("cached-prompt") == "You verify claims carefully."
@@ -0,0 +1,115 @@
+"""Offline tests for trimming the agent's messages to a token budget."""
+
+import json
+
+import pytest
+from langchain_core.messages import (AIMessage, HumanMessage, SystemMessage,
+                                     ToolMessage)
+
+from app.agents.context_budget import (TRIMMED_MARKER, _split_turns,
+                                       count_message_tokens,
+                                       fit_messages_to_budget,
+                                       summarise_tool_output)
+
+
+def conversation(turns, fanout=2, output_chars=2000):
+    """System prompt, the claim and ``turns`` tool rounds of ``fanout`` calls."""
+    messages = [SystemMessage(content="You verify claims."), HumanMessage("claim")]
+    for turn in range(turns):
+        tool_calls = [
+            {
+                "name": "search_internet",
+                "args": {"q": "claim"},
+                "id": f"call_{turn}_{i}",
+            }
+            for i in range(fanout)
+        ]
+        messages.append(AIMessage(content="", tool_calls=tool_calls))
+        messages.extend(
+            ToolMessage(
+                content=f"{turn}-{i} " + "x" * output_chars, tool_call_id=call["id"]
+            )
+            for i, call in enumerate(tool_calls)
+        )
+    messages.append(AIMessage(content="Credibility Score: 5/100"))
+    return messages
+
+
+def total_tokens(messages):
+    return sum(count_message_tokens(message) for message in messages)
+
+
+def assert_no_orphans(messages):
+    """Every tool call has its ToolMessage and every ToolMessage its call."""
+    calls = {
+        call["id"]
+        for message in messages
+        if isinstance(message, AIMessage)
+        for call in message.tool_calls
+    }
+    results = {m.tool_call_id for m in messages if isinstance(m, ToolMessage)}
+    assert calls == results
+
+
+def test_split_turns_groups_tool_messages_with_their_call():
+    messages = conversation(2)
+
+    head, turns = _split_turns(messages)
+
+    assert head == 2
+    assert turns == [(2, 5), (5, 8), (8, 9)]
+
+
+@pytest.mark.parametrize("budget", [0, None])
+def test_no_budget_sends_everything(budget):
+    messages = conversation(3)
+
+    trimmed, stats = fit_messages_to_budget(messages, budget)
+
+    assert trimmed is messages
+    assert stats["dropped"] == stats["summarised"] == 0
+
+
+def test_head_and_latest_turns_are_always_kept():
+    messages = conversation(6)
+
+    trimmed, stats = fit_messages_to_budget(messages, budget=50, keep_turns=2)
+
+    assert trimmed[:2] == messages[:2]
+    assert trimmed[2:] == messages[-4:]  # Last tool round and the final answer
+    assert stats["dropped"] == len(messages) - 6
+    assert_no_orphans(trimmed)
+
+
+@pytest.mark.parametrize("budget", [400, 1500, 3000])
+def test_whole_turns_are_dropped(budget):
+    messages = conversation(6, fanout=3)
+
+    trimmed, _ = fit_messages_to_budget(messages, budget, keep_turns=1)
+
+    assert_no_orphans(trimmed)
+    assert isinstance(trimmed[2], AIMessage)
+
+
+def test_large_tool_output_is_summarised_instead_of_dropped():
+    messages = conversation(3, fanout=1)
+    messages[3] = ToolMessage(content="y" * 20000, tool_call_id="call_0_0")
+    budget = total_tokens(messages) - 4000  # Only that output is over budget
+
+    trimmed, stats = fit_messages_to_budget(messages, budget, excerpt_chars=300)
+
+    assert stats["summarised"] == 1 and stats["dropped"] == 0
+    assert len(trimmed) == len(messages)
+    assert trimmed[3].content.endswith(TRIMMED_MARKER)
+    assert stats["sent_tokens"] <= budget
+    assert messages[3].content == "y" * 20000  # The state keeps the full output
+
+
+def test_summarise_tool_output_keeps_json_structure():
+    content = json.dumps({"status": "FALSE", "articles": [{"text": "z" * 1000}]})
+
+    summary = json.loads(summarise_tool_output(content, max_chars=50))
+
+    assert summary["status"] == "FALSE"
+    assert summary["articles"][0]["text"].endswith(TRIMMED_MARKER)
+    assert summarise_tool_output("short", max_chars=50) == "short"
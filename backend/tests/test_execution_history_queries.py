@@ -0,0 +1,70 @@
+"""Offline tests for paging through execution history by config."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db_commands.execution_history_commands import (
+    _decode_page_token, _encode_page_token, get_execution_table_name,
+    list_execution_history, query_execution_history)
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def table(fake_tables):
+    """Execution history with 30 executions of config-a and 5 of config-b."""
+    table = fake_tables[get_execution_table_name()]
+    for config_id, count in (("config-a", 30), ("config-b", 5)):
+        for i in range(count):
+            table.put_item(
+                Item={
+                    "execution_id": f"{config_id}-{i:02d}",
+                    "config_id": config_id,
+                    "timestamp": (START + timedelta(minutes=i)).isoformat(),
+                    "result": "x" * 100,
+                }
+            )
+    table.calls.clear()
+    return table
+
+
+def test_page_token_round_trips():
+    key = {"config_id": "config-a", "execution_id": "e-1", "timestamp": "2026"}
+
+    assert _decode_page_token(_encode_page_token(key), "config-a") == key
+
+
+def test_pages_cover_every_execution_once(table):
+    seen, page_token = [], None
+    while True:
+        page = query_execution_history(
+            "config-a", limit=7, page_token=page_token, attributes=["execution_id"]
+        )
+        seen.extend(item["execution_id"] for item in page["items"])
+        page_token = page["next_page_token"]
+        if page_token is None:
+            break
+
+    assert seen == [f"config-a-{i:02d}" for i in reversed(range(30))]
+
+
+def test_page_token_from_another_config_is_rejected(table):
+    page = query_execution_history("config-a", limit=5)
+
+    with pytest.raises(ValueError):
+        query_execution_history("config-b", page_token=page["next_page_token"])
+    with pytest.raises(ValueError):
+        query_execution_history("config-a", page_token="not-a-token")
+
+
+def test_short_pages_are_topped_up(table, monkeypatch):
+    # Responses stop after two items, like DynamoDB's 1MB page limit
+    monkeypatch.setattr("tests.fakes.PAGE_BYTES", 600)
+
+    executions = list_execution_history("config-a", max_results=10)
+
+    assert [item["execution_id"] for item in executions] == [
+        f"config-a-{i:02d}" for i in reversed(range(20, 30))
+    ]
+    assert table.calls["query"] > 1
@@ -0,0 +1,210 @@
+"""Offline tests for the write-behind execution history writer."""
+
+import os
+from datetime import datetime
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+
+from app.db_commands.execution_history_commands import get_execution_table_name
+from app.db_commands.execution_history_writer import (ExecutionHistoryWriter,
+                                                      get_default_spool_path,
+                                                      is_write_behind_enabled)
+from tests.fakes import SlowTable, install_fake_dynamodb, throttling_error
+
+RESULT = {"result": "Credibility Score: 5/100", "metadata": {"tool_calls": 0}}
+
+
+@pytest.fixture
+def table(fake_tables):
+    """Execution history table with injectable latency and failures."""
+    return install_fake_dynamodb(
+        [(get_execution_table_name(), "execution_id")], table_class=SlowTable
+    )[get_execution_table_name()]
+
+
+@pytest.fixture
+def spool_path(tmp_path):
+    return str(tmp_path / "execution-history.spool")
+
+
+@pytest.fixture
+def make_writer(spool_path):
+    writers = []
+
+    def make(**kwargs):
+        options = {"backoff_seconds": 0.001, "spool_path": spool_path, **kwargs}
+        writers.append(ExecutionHistoryWriter(**options))
+        return writers[-1]
+
+    yield make
+    for writer in writers:
+        writer.close(timeout=5)
+
+
+def submit(writer, count, prefix="execution"):
+    return [
+        writer.submit("config", f"{prefix}-{i}", "claim", RESULT) for i in range(count)
+    ]
+
+
+def test_write_behind_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("EXECUTION_HISTORY_WRITE_BEHIND", raising=False)
+    assert not is_write_behind_enabled()
+
+    monkeypatch.setenv("EXECUTION_HISTORY_WRITE_BEHIND", "true")
+    assert is_write_behind_enabled()
+
+
+def test_items_are_written_in_batches_of_25(table, make_writer):
+    writer = make_writer(linger_seconds=1.0)
+
+    execution_ids = submit(writer, 60)
+
+    assert writer.flush(timeout=10)
+    assert sorted(table.items) == sorted(execution_ids)
+    assert table.calls["batch_write_item"] == 3  # 25 + 25 + 10
+    assert writer.stats["batches"] == 3
+    assert writer.stats["written"] == 60
+
+
+def test_throttled_batch_is_retried(table, make_writer):
+    writer = make_writer()
+    table.fail_next, table.failure = 2, throttling_error()
+
+    submit(writer, 5)
+
+    assert writer.flush(timeout=10)
+    assert len(table.items) == 5
+    assert writer.stats["retries"] == 2
+    assert writer.stats["spooled"] == 0
+
+
+def test_throttled_batch_is_spooled_and_replayed(table, make_writer, spool_path):
+    writer = make_writer(max_retries=1)
+    table.fail_next, table.failure = 2, throttling_error()
+
+    submit(writer, 5, prefix="throttled")
+
+    assert writer.flush(timeout=10)
+    assert table.items == {}
+    assert writer.stats["spooled"] == 5
+    assert os.path.exists(spool_path)
+
+    submit(writer, 1, prefix="recovered")
+
+    assert writer.flush(timeout=10)
+    assert len(table.items) == 6
+    assert writer.stats["replayed"] == 5
+    assert not os.path.exists(spool_path)
+    assert table.items["throttled-0"]["result"] == RESULT["result"]
+
+
+def test_spool_is_replayed_by_the_next_writer(table, make_writer, spool_path):
+    table.fail_next = 10**9
+    table.failure = EndpointConnectionError(endpoint_url="https://dynamodb")
+    writer = make_writer(max_retries=0)
+    submit(writer, 3)
+    assert writer.flush(timeout=10)
+    writer.close(timeout=5)
+    assert writer.stats["spooled"] == 3
+
+    table.fail_next = 0
+    restarted = make_writer()
+    submit(restarted, 1, prefix="next")
+
+    assert restarted.flush(timeout=10)
+    assert len(table.items) == 4
+    assert restarted.stats["replayed"] == 3
+
+
+def test_flush_times_out_while_a_write_is_pending(table, make_writer):
+    writer = make_writer(linger_seconds=0.0)
+    table.latency = 0.5
+
+    submit(writer, 1)
+
+    assert not writer.flush(timeout=0.05)
+    assert table.items == {}
+    assert writer.flush(timeout=10)
+    assert len(table.items) == 1
+
+
+def test_close_spools_items_left_after_timeout(table, make_writer, spool_path):
+    writer = make_writer(linger_seconds=0.0)
+    table.latency = 0.5
+
+    submit(writer, 30)
+    writer.close(timeout=0.05)
+
+    assert writer.stats["spooled"] > 0
+    assert os.path.exists(spool_path)
+
+
+def test_timestamp_is_the_submit_time(table, make_writer):
+    # The batch waits 0.3s for more items before it is written
+    writer = make_writer(linger_seconds=0.3)
+
+    before = datetime.utcnow().isoformat()
+    submit(writer, 1)
+    submitted = datetime.utcnow().isoformat()
+    assert writer.flush(timeout=10)
+
+    assert before <= table.items["execution-0"]["timestamp"] <= submitted
+
+
+def spool_items(writer, count, prefix="spooled"):
+    """Leave ``count`` unwritten items in the writer's spool file."""
+    writer._spool(
+        [{"execution_id": f"{prefix}-{i}", "config_id": "config"} for i in range(count)]
+    )
+
+
+@pytest.mark.parametrize("when", ["before_claim", "after_claim"])
+def test_spool_disappearing_mid_replay(table, make_writer, monkeypatch, when):
+    # Another process (or an operator) removes the spool during the replay
+    rename = os.rename
+
+    def vanish_then_rename(source, destination):
+        if when == "before_claim":
+            os.remove(source)
+            return rename(source, destination)
+        rename(source, destination)
+        os.remove(destination)
+
+    writer = make_writer()
+    spool_items(writer, 3)
+    monkeypatch.setattr(
+        "app.db_commands.execution_history_writer.os.rename", vanish_then_rename
+    )
+
+    submit(writer, 2)
+
+    assert writer.flush(timeout=10)
+    assert sorted(table.items) == ["execution-0", "execution-1"]
+    assert writer._thread.is_alive()
+    submit(writer, 1, prefix="later")
+    assert writer.flush(timeout=10)
+    assert "later-0" in table.items
+
+
+def test_abandoned_claim_is_replayed_by_the_next_writer(table, make_writer, spool_path):
+    writer = make_writer()
+    spool_items(writer, 3)
+    os.rename(spool_path, spool_path + ".0123abcd.replay")  # Writer died mid-replay
+
+    restarted = make_writer()
+    submit(restarted, 1)
+
+    assert restarted.flush(timeout=10)
+    assert len(table.items) == 4
+    assert restarted.stats["replayed"] == 3
+    assert os.listdir(os.path.dirname(spool_path)) == []
+
+
+def test_default_spool_path_is_per_process(monkeypatch):
+    monkeypatch.delenv("EXECUTION_HISTORY_SPOOL_PATH", raising=False)
+    assert str(os.getpid()) in get_default_spool_path()
+
+    monkeypatch.setenv("EXECUTION_HISTORY_SPOOL_PATH", "/var/spool/history-{pid}")
+    assert get_default_spool_path() == f"/var/spool/history-{os.getpid()}"
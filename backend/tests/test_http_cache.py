@@ -0,0 +1,274 @@
+"""Offline tests for the HTTP response cache (app/utils/http_cache.py)."""
+
+import os
+import time
+from email.utils import formatdate
+from typing import Dict, List
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from app.utils.http_cache import (
+    DISK_RESCAN_EVERY,
+    CachedResponse,
+    HTTPResponseCache,
+    _DiskTier,
+    freshness_lifetime,
+)
+
+URL = "https://example.com/news/1"
+BODY = b"<html>" + b"x" * 1000 + b"</html>"
+
+
+class FakeSession:
+    """Returns queued responses and records the request headers."""
+
+    def __init__(self):
+        self.responses: List[requests.Response] = []
+        self.requests: List[Dict[str, str]] = []
+
+    def queue(self, status: int, headers: Dict[str, str], body: bytes = b"") -> None:
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = URL
+        self.responses.append(response)
+
+    def get(self, url: str, headers=None, timeout=None) -> requests.Response:
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+class TestFreshnessLifetime:
+    def test_max_age(self):
+        assert freshness_lifetime({"Cache-Control": "max-age=60"}, time.time()) == 60
+
+    def test_max_age_minus_age(self):
+        headers = {"Cache-Control": "public, max-age=60", "Age": "15"}
+        assert freshness_lifetime(headers, time.time()) == 45
+
+    def test_s_maxage_wins_over_max_age(self):
+        headers = {"Cache-Control": "max-age=60, s-maxage=600"}
+        assert freshness_lifetime(headers, time.time()) == 600
+
+    def test_no_store_is_not_stored(self):
+        headers = {"Cache-Control": "no-store, max-age=60"}
+        assert freshness_lifetime(headers, time.time()) is None
+
+    def test_no_cache_must_revalidate(self):
+        headers = {"Cache-Control": "no-cache", "Expires": http_date(time.time())}
+        assert freshness_lifetime(headers, time.time()) == 0
+
+    def test_expires_relative_to_date(self):
+        now = time.time()
+        headers = {"Date": http_date(now), "Expires": http_date(now + 120)}
+        assert freshness_lifetime(headers, now) == pytest.approx(120, abs=1)
+
+    def test_invalid_expires_is_expired(self):
+        assert freshness_lifetime({"Expires": "0"}, time.time()) == 0
+
+    def test_last_modified_heuristic_is_capped(self):
+        now = time.time()
+        headers = {"Date": http_date(now), "Last-Modified": http_date(now - 86400)}
+        assert freshness_lifetime(headers, now, heuristic_max_seconds=300) == 300
+        headers["Last-Modified"] = http_date(now - 1000)
+        assert freshness_lifetime(headers, now) == pytest.approx(100, abs=1)
+
+
+class TestFetch:
+    def test_fresh_hit_skips_the_network(self, session):
+        cache = HTTPResponseCache()
+        session.queue(200, {"Cache-Control": "max-age=60"}, BODY)
+
+        first = cache.fetch(URL, session=session)
+        second = cache.fetch(URL, session=session)
+
+        assert len(session.requests) == 1
+        assert not first.from_cache and second.from_cache
+        assert second.content == BODY
+
+    def test_no_store_is_fetched_every_time(self, session):
+        cache = HTTPResponseCache()
+        session.queue(200, {"Cache-Control": "no-store"}, BODY)
+        session.queue(200, {"Cache-Control": "no-store"}, BODY)
+
+        cache.fetch(URL, session=session)
+        second = cache.fetch(URL, session=session)
+
+        assert len(session.requests) == 2
+        assert not second.from_cache
+
+    def test_revalidates_etag_with_304(self, session):
+        cache = HTTPResponseCache()
+        session.queue(200, {"Cache-Control": "no-cache", "ETag": '"v1"'}, BODY)
+        session.queue(304, {"ETag": '"v1"'})
+
+        cache.fetch(URL, session=session)
+        revalidated = cache.fetch(URL, session=session)
+
+        assert session.requests[1]["If-None-Match"] == '"v1"'
+        assert revalidated.from_cache
+        assert revalidated.status_code == 200
+        assert revalidated.content == BODY
+
+    def test_revalidates_last_modified_with_304(self, session):
+        cache = HTTPResponseCache()
+        last_modified = http_date(time.time() - 3600)
+        session.queue(
+            200,
+            {"Cache-Control": "max-age=0", "Last-Modified": last_modified},
+            BODY,
+        )
+        session.queue(304, {})
+
+        cache.fetch(URL, session=session)
+        revalidated = cache.fetch(URL, session=session)
+
+        assert session.requests[1]["If-Modified-Since"] == last_modified
+        assert "If-None-Match" not in session.requests[1]
+        assert revalidated.content == BODY
+
+    def test_changed_page_replaces_the_entry(self, session):
+        cache = HTTPResponseCache()
+        session.queue(200, {"Cache-Control": "no-cache", "ETag": '"v1"'}, BODY)
+        session.queue(200, {"Cache-Control": "max-age=60", "ETag": '"v2"'}, b"new")
+
+        cache.fetch(URL, session=session)
+        changed = cache.fetch(URL, session=session)
+
+        assert not changed.from_cache and changed.content == b"new"
+        assert cache.fetch(URL, session=session).content == b"new"
+
+    def test_stats_count_hits_and_bytes_saved(self, session):
+        cache = HTTPResponseCache()
+        session.queue(200, {"Cache-Control": "max-age=60"}, BODY)
+        other = URL + "?revalidate"
+        session.queue(200, {"Cache-Control": "no-cache", "ETag": '"a"'}, BODY)
+        session.queue(304, {})
+
+        cache.fetch(URL, session=session)  # miss
+        cache.fetch(URL, session=session)  # fresh hit
+        cache.fetch(other, session=session)  # miss
+        cache.fetch(other, session=session)  # 304
+
+        stats = cache.stats()
+        assert stats["requests"] == 4
+        assert stats["hits"] == 1
+        assert stats["revalidations"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == 0.5
+        assert stats["bytes_saved"] == 2 * len(BODY)
+        assert stats["bytes_downloaded"] == 2 * len(BODY)
+
+    def test_memory_tier_evicts_least_recently_used(self, session):
+        cache = HTTPResponseCache(max_entries=2)
+        for i in range(3):
+            session.queue(200, {"Cache-Control": "max-age=60"}, BODY)
+            cache.fetch(f"{URL}?{i}", session=session)
+
+        assert cache.stats()["memory_entries"] == 2
+        session.queue(200, {"Cache-Control": "max-age=60"}, BODY)
+        cache.fetch(f"{URL}?0", session=session)
+        assert len(session.requests) == 4
+
+
+class TestDiskTier:
+    def entry(self, url: str, body: bytes = BODY) -> CachedResponse:
+        now = time.time()
+        return CachedResponse(
+            url=url, status_code=200, content=body, stored_at=now, expires_at=now + 60
+        )
+
+    def test_shared_across_cache_instances(self, session, tmp_path):
+        session.queue(200, {"Cache-Control": "max-age=60"}, BODY)
+        HTTPResponseCache(disk_dir=str(tmp_path)).fetch(URL, session=session)
+
+        cache = HTTPResponseCache(disk_dir=str(tmp_path))
+        response = cache.fetch(URL, session=session)
+
+        assert len(session.requests) == 1
+        assert response.from_cache and response.content == BODY
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_truncated_body_is_a_miss(self, tmp_path):
+        disk = _DiskTier(str(tmp_path), max_bytes=1024 * 1024)
+        disk.set(self.entry(URL))
+        _, body_path = disk._paths(URL)
+        with open(body_path, "wb") as f:
+            f.write(BODY[:10])
+
+        assert disk.get(URL) is None
+
+    def test_prunes_oldest_files_above_max_bytes(self, tmp_path):
+        disk = _DiskTier(str(tmp_path), max_bytes=3 * len(BODY))
+        disk.set(self.entry(URL + "?old"))
+        for path in disk._paths(URL + "?old"):
+            os.utime(path, (time.time() - 3600, time.time() - 3600))
+
+        disk.set(self.entry(URL + "?new"))
+        disk.set(self.entry(URL + "?newer"))
+
+        total = sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+        assert total <= 3 * len(BODY)
+        assert disk.get(URL + "?old") is None
+        assert disk.get(URL + "?newer") is not None
+
+    def test_set_lists_the_directory_only_when_needed(self, tmp_path, monkeypatch):
+        disk = _DiskTier(str(tmp_path), max_bytes=1024 * 1024)
+        listings = []
+        listdir = os.listdir
+        monkeypatch.setattr(
+            "app.utils.http_cache.os.listdir",
+            lambda path: listings.append(path) or listdir(path),
+        )
+
+        for i in range(DISK_RESCAN_EVERY - 1):
+            disk.set(self.entry(f"{URL}?{i}"))
+        assert listings == []
+
+        disk.set(self.entry(URL + "?rescan"))
+        assert len(listings) == 1
+
+    def test_tracks_files_already_in_the_directory(self, tmp_path):
+        _DiskTier(str(tmp_path), max_bytes=1024 * 1024).set(self.entry(URL + "?old"))
+        for path in _DiskTier(str(tmp_path), 0)._paths(URL + "?old"):
+            os.utime(path, (time.time() - 3600, time.time() - 3600))
+
+        # The new entry alone fits; only the tracked ?old files push it over
+        disk = _DiskTier(str(tmp_path), max_bytes=len(BODY) * 3 // 2)
+        disk.set(self.entry(URL + "?new"))
+
+        assert disk.get(URL + "?old") is None
+        assert disk.get(URL + "?new") is not None
+
+
+def test_search_page_reuses_cached_page(session, monkeypatch):
+    from app.tools import search_tool
+
+    cache = HTTPResponseCache()
+    page = b"<html><body><p>Officials said the claim is false.</p></body></html>"
+    session.queue(200, {"Cache-Control": "max-age=60"}, page)
+    monkeypatch.setattr(
+        search_tool,
+        "fetch_url",
+        lambda url, **kwargs: cache.fetch(url, session=session, **kwargs),
+    )
+
+    first = search_tool.search_page(URL, "claim")
+    second = search_tool.search_page(URL, "claim")
+
+    assert first == second and first.found
+    assert len(session.requests) == 1
+    assert "Mozilla" in session.requests[0]["User-Agent"]
+    assert cache.stats()["bytes_saved"] == len(page)
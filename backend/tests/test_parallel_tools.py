@@ -0,0 +1,125 @@
+"""Offline tests for parallel tool calls in app/agents/agent_workflow.py."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import StructuredTool
+
+from app.agents.agent_factory import ainvoke_agent, invoke_agent
+from app.agents.agent_workflow import create_agent_workflow
+from tests.fakes import ScriptedChatModel
+
+FANOUT = 4
+
+
+class FanoutChatModel(ScriptedChatModel):
+    """
+    Requests FANOUT calls in one turn: earlier calls take longer, so they
+    finish last, and the second call fails.
+    """
+
+    tool_name: str = "check"
+    tool_fanout: int = FANOUT
+
+    def _next_message(self, messages):
+        message = super()._next_message(messages)
+        for i, tool_call in enumerate(message.tool_calls):
+            tool_call["args"] = {
+                "label": f"call-{i}",
+                "delay": 0.02 * (FANOUT - i),
+                "fail": i == 1,
+            }
+        return message
+
+
+class ConcurrencyProbe:
+    """The check tool, recording how many calls ran at the same time."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def _exit(self, label: str, fail: bool) -> str:
+        with self._lock:
+            self.running -= 1
+        if fail:
+            raise ValueError(f"{label} failed")
+        return f"{label} ok"
+
+    def check(self, label: str, delay: float, fail: bool) -> str:
+        self._enter()
+        time.sleep(delay)
+        return self._exit(label, fail)
+
+    async def acheck(self, label: str, delay: float, fail: bool) -> str:
+        self._enter()
+        await asyncio.sleep(delay)
+        return self._exit(label, fail)
+
+    def tool(self) -> StructuredTool:
+        return StructuredTool.from_function(
+            func=self.check,
+            coroutine=self.acheck,
+            name="check",
+            description="Check a claim.",
+        )
+
+
+@pytest.fixture
+def probe():
+    return ConcurrencyProbe()
+
+
+@pytest.fixture
+def agent(probe):
+    return create_agent_workflow(
+        llm=FanoutChatModel(),
+        tools={"check": probe.tool()},
+        system_prompt="You verify claims.",
+        max_iterations=2,
+        max_tool_concurrency=FANOUT,
+    )
+
+
+def assert_ordered_results(result):
+    tool_messages = [
+        message
+        for message in result["full_state"]["messages"]
+        if isinstance(message, ToolMessage)
+    ]
+    assert [message.tool_call_id for message in tool_messages] == [
+        f"call_0_{i}" for i in range(FANOUT)
+    ]
+    assert [message.content for message in tool_messages] == [
+        "call-0 ok",
+        "Error executing tool 'check': call-1 failed",
+        "call-2 ok",
+        "call-3 ok",
+    ]
+    outputs = [
+        tool_result["output"] for tool_result in result["metadata"]["tool_results"]
+    ]
+    assert outputs == [message.content for message in tool_messages]
+
+
+def test_parallel_tool_calls_keep_their_order(agent, probe):
+    result = invoke_agent(agent, "claim")
+
+    assert probe.peak > 1
+    assert_ordered_results(result)
+
+
+def test_async_parallel_tool_calls_keep_their_order(agent, probe):
+    result = asyncio.run(ainvoke_agent(agent, "claim"))
+
+    assert probe.peak > 1
+    assert_ordered_results(result)
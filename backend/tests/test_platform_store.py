@@ -0,0 +1,38 @@
+"""Offline tests for the memory-mapped verification store."""
+
+import os
+import stat
+
+import pytest
+
+from app.tools.platform_store import get_store_index, write_verification_store
+from app.tools.platform_verification_tool import VERIFICATION_PLATFORM_DB
+
+
+def test_store_is_world_readable(tmp_path):
+    path = str(tmp_path / "platform.store")
+    write_verification_store(VERIFICATION_PLATFORM_DB, path)
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert os.listdir(tmp_path) == ["platform.store"]
+
+
+def test_store_is_replaced_and_reloaded(tmp_path, monkeypatch):
+    monkeypatch.setenv("VERIFICATION_STORE_RELOAD_SECONDS", "0")
+    path = str(tmp_path / "platform.store")
+    write_verification_store(VERIFICATION_PLATFORM_DB, path)
+    assert get_store_index(path).match("bleach cures covid") is not None
+
+    write_verification_store({"moon landing staged": {"status": "FALSE"}}, path)
+    index = get_store_index(path)
+    assert index.match("bleach cures covid") is None
+    assert index.match("the moon landing was staged").key == "moon landing staged"
+
+
+def test_unreadable_store_error_keeps_its_cause(tmp_path):
+    path = tmp_path / "broken.store"
+    path.write_bytes(b"not a store")
+
+    with pytest.raises(Exception, match="Failed to open verification store") as info:
+        get_store_index(str(path))
+    assert isinstance(info.value.__cause__, ValueError)
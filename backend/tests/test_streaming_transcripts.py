@@ -0,0 +1,84 @@
+"""Offline tests: streamed executions persist the same transcript as invoked ones."""
+
+import asyncio
+
+import pytest
+
+from app.db_commands.execution_history_commands import (
+    load_execution_history, load_execution_transcript)
+from app.handlers.standalone_agent_handler import (
+    astream_standalone_agent_request, handle_standalone_agent_request,
+    stream_standalone_agent_request)
+from infra.transcript_store import LocalTranscriptStore, TranscriptStore
+from tests.fakes import USER_INPUT
+
+
+@pytest.fixture
+def transcript_dir(scripted_agent, tmp_path, monkeypatch):
+    monkeypatch.setenv("TRANSCRIPT_STORE", "local")
+    monkeypatch.setenv("TRANSCRIPT_DIR", str(tmp_path))
+    monkeypatch.setenv("VERDICT_CACHE_ENABLED", "false")
+    return tmp_path
+
+
+def load_transcript(execution_id):
+    return load_execution_transcript(load_execution_history(execution_id))
+
+
+def final_event(events):
+    events = list(events)
+    assert events[-1]["type"] == "final_verdict", events[-1]
+    return events[-1]
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+def test_stream_persists_messages(scripted_agent, transcript_dir):
+    response = handle_standalone_agent_request(scripted_agent.config_id, USER_INPUT)
+    final = final_event(
+        stream_standalone_agent_request(scripted_agent.config_id, USER_INPUT)
+    )
+
+    invoked = load_transcript(response["execution_id"])
+    streamed = load_transcript(final["execution_id"])
+    assert len(streamed["messages"]) == final["metadata"]["total_messages"] == 4
+    assert [message["type"] for message in streamed["messages"]] == [
+        message["type"] for message in invoked["messages"]
+    ]
+    assert streamed["messages"][-1]["data"]["content"] == final["result"]
+
+
+def test_astream_persists_messages(scripted_agent, transcript_dir):
+    events = asyncio.run(
+        collect(astream_standalone_agent_request(scripted_agent.config_id, USER_INPUT))
+    )
+    final = final_event(events)
+
+    streamed = load_transcript(final["execution_id"])
+    assert streamed["messages"][0]["data"]["content"] == USER_INPUT
+    assert len(streamed["messages"]) == final["metadata"]["total_messages"]
+
+
+def test_final_event_omits_full_state(scripted_agent):
+    final = final_event(
+        stream_standalone_agent_request(scripted_agent.config_id, USER_INPUT)
+    )
+
+    assert set(final) == {"type", "result", "metadata", "success", "execution_id"}
+
+
+def test_transcript_store_is_abstract(tmp_path):
+    class IncompleteStore(TranscriptStore):
+        def put(self, key, data):
+            pass
+
+        def get(self, key):
+            return b""
+
+    with pytest.raises(TypeError):
+        TranscriptStore()
+    with pytest.raises(TypeError):
+        IncompleteStore()
+    assert isinstance(LocalTranscriptStore(str(tmp_path)), TranscriptStore)
@@ -0,0 +1,157 @@
+"""Offline tests for verdict reuse in app/agents/verdict_cache.py."""
+
+import json
+
+import pytest
+
+from app.agents.agent_cache import compute_config_hash
+from app.agents.verdict_cache import (get_near_duplicate_index,
+                                      get_verdict_cache,
+                                      is_verdict_cache_enabled, lookup_verdict,
+                                      seed_agent_input, store_verdict)
+from app.utils.minhash_index import MinHashLSHIndex
+from tests.fakes import install_fake_dynamodb
+
+VERDICT = {"result": "Credibility Score: 90/100", "metadata": {"iterations": 2}}
+
+# Near-duplicates whose verdicts differ: similar enough that the old 0.85
+# reuse threshold served one's verdict for the other
+FLIPPED_PAIRS = [
+    (
+        "Health officials confirmed the new vaccine is safe for children under five",
+        "Health officials confirmed the new vaccine is not safe for children under five",
+    ),
+    (
+        "Official figures show unemployment rose 4.2 percent last quarter",
+        "Official figures show unemployment rose 6.2 percent last quarter",
+    ),
+]
+
+
+def test_exact_normalised_match_is_reused(scripted_agent):
+    store_verdict(scripted_agent, "Bleach cures COVID!", "execution-1", VERDICT)
+
+    cached = lookup_verdict(scripted_agent, '  "bleach   CURES covid" ')
+
+    assert cached["result"] == VERDICT["result"]
+    assert cached["metadata"]["cache_hit"] is True
+    assert cached["metadata"]["cached_execution_id"] == "execution-1"
+
+
+@pytest.mark.parametrize(
+    "cached_claim, new_claim", FLIPPED_PAIRS, ids=["negation", "number"]
+)
+def test_near_duplicate_only_seeds_the_agent(scripted_agent, cached_claim, new_claim):
+    store_verdict(scripted_agent, cached_claim, "execution-1", VERDICT)
+
+    assert lookup_verdict(scripted_agent, new_claim) is None
+
+    agent_input, seed = seed_agent_input(scripted_agent, new_claim)
+    assert seed["execution_id"] == "execution-1"
+    assert seed["similarity"] >= 0.85
+    assert agent_input.startswith(new_claim)
+    assert VERDICT["result"] in agent_input
+
+
+def test_unrelated_claim_is_not_seeded(scripted_agent):
+    store_verdict(scripted_agent, FLIPPED_PAIRS[0][0], "execution-1", VERDICT)
+
+    claim = "The moon landing was filmed in a studio"
+    assert seed_agent_input(scripted_agent, claim) == (claim, None)
+
+
+def test_failed_tool_runs_are_not_cached(scripted_agent):
+    result = {
+        "result": "Could not verify",
+        "metadata": {
+            "tool_results": [
+                {"tool_name": "search_internet", "output": "Error: timed out"}
+            ]
+        },
+    }
+
+    assert not store_verdict(scripted_agent, "claim", "execution-1", result)
+    assert lookup_verdict(scripted_agent, "claim") is None
+
+
+def test_persisted_verdict_omits_tool_results(scripted_agent, monkeypatch):
+    monkeypatch.setenv("VERDICT_CACHE_TABLE", "verdict-cache")
+    table = install_fake_dynamodb([("verdict-cache", "cache_key")])["verdict-cache"]
+    result = {
+        "result": VERDICT["result"],
+        "metadata": {
+            "iterations": 2,
+            "tool_calls": 1,
+            "tool_results": [{"tool_name": "search_internet", "output": "x" * 5000}],
+            "input_tokens": 120,
+            "output_tokens": 40,
+        },
+    }
+
+    store_verdict(scripted_agent, "claim", "execution-1", result)
+
+    (item,) = table.items.values()
+    metadata = json.loads(item["payload"])["metadata"]
+    assert "tool_results" not in metadata
+    assert metadata["config_hash"] == compute_config_hash(scripted_agent)
+    assert (metadata["input_tokens"], metadata["output_tokens"]) == (120, 40)
+
+
+def test_verdict_cache_is_opt_in(monkeypatch):
+    monkeypatch.delenv("VERDICT_CACHE_ENABLED", raising=False)
+
+    assert not is_verdict_cache_enabled()
+
+
+def test_seeding_works_after_the_index_is_full(scripted_agent, monkeypatch):
+    monkeypatch.setenv("NEAR_DUPLICATE_MAX_ENTRIES", "2")
+    claims = [
+        "The moon landing was filmed in a studio in Nevada",
+        "Drinking bleach cures COVID-19 within a few days",
+        FLIPPED_PAIRS[0][0],
+    ]
+    for i, claim in enumerate(claims):
+        store_verdict(scripted_agent, claim, f"execution-{i}", VERDICT)
+
+    _, seed = seed_agent_input(scripted_agent, FLIPPED_PAIRS[0][1])
+
+    assert seed["execution_id"] == "execution-2"
+    assert len(get_near_duplicate_index(scripted_agent)) == 2
+
+
+def test_evicted_verdicts_leave_the_index(scripted_agent, monkeypatch):
+    monkeypatch.setenv("VERDICT_CACHE_MAX_SIZE", "1")
+    monkeypatch.setattr("app.agents.verdict_cache._verdict_cache", None)
+    store_verdict(scripted_agent, FLIPPED_PAIRS[0][0], "execution-1", VERDICT)
+    store_verdict(scripted_agent, FLIPPED_PAIRS[1][0], "execution-2", VERDICT)
+
+    assert len(get_near_duplicate_index(scripted_agent)) == 1
+    assert seed_agent_input(scripted_agent, FLIPPED_PAIRS[0][1])[1] is None
+
+
+def test_claims_without_a_verdict_are_dropped_on_query(scripted_agent):
+    store_verdict(scripted_agent, FLIPPED_PAIRS[0][0], "execution-1", VERDICT)
+    get_verdict_cache().clear()
+
+    assert seed_agent_input(scripted_agent, FLIPPED_PAIRS[0][1])[1] is None
+    assert len(get_near_duplicate_index(scripted_agent)) == 0
+
+
+def test_index_remove_keeps_other_keys(tmp_path):
+    index = MinHashLSHIndex()
+    texts = {
+        f"key-{i}": f"claim number {i} about something else entirely" for i in range(5)
+    }
+    for key, text in texts.items():
+        index.add(key, text)
+
+    assert index.remove("key-1")
+    assert not index.remove("key-1")
+
+    path = str(tmp_path / "index.npz")
+    index.save(path)
+    for restored in (index, MinHashLSHIndex.load(path)):
+        assert "key-1" not in restored and restored.oldest_key() == "key-0"
+        for key, text in texts.items():
+            matches = dict(restored.query(text, threshold=1.0))
+            assert (key in matches) == (key != "key-1")
@@ -0,0 +1,135 @@
+"""Offline tests for the BM25 verification platform index."""
+
+import random
+
+import pytest
+
+from app.tools import platform_verification_tool
+from app.tools.platform_store import (MappedVerificationIndex,
+                                      write_verification_store)
+from app.tools.platform_verification_tool import (VERIFICATION_PLATFORM_DB,
+                                                  VerificationIndex)
+
+QUERIES = [
+    "5g covid",
+    "5G networks cause coronavirus",
+    "Drinking bleach cures COVID-19",
+    "Bleach does not cure COVID",
+    "5G towers are being used for mind control",
+    "mind control",
+    "NASA's Webb telescope found carbon dioxide on an exoplanet",
+    "UK inflation fell to 4.2 percent in November 2023",
+    "kidnappers posing as vaccine workers at your door",
+    "covid vaccine",
+    "the and of",
+    "",
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return VerificationIndex(VERIFICATION_PLATFORM_DB)
+
+
+def assert_same_match(actual, expected):
+    if expected is None:
+        assert actual is None
+        return
+    assert actual.key == expected.key
+    assert actual.score == pytest.approx(expected.score)
+    assert actual.confidence == pytest.approx(expected.confidence)
+
+
+def test_ranking(index):
+    matches = index.search("5g causes covid", top_k=3)
+
+    assert [match.key for match in matches] == [
+        "5g causes covid",
+        "bleach cures covid",
+        "5g towers mind control",
+    ]
+    assert matches[0].confidence == pytest.approx(1.0)
+    assert matches[0].score > matches[1].score > matches[2].score
+
+
+@pytest.mark.parametrize(
+    "query, key",
+    [
+        ("Drinking bleach cures COVID-19", "bleach cures covid"),
+        ("Bleach does not cure COVID", "bleach cures covid"),
+        ("5G networks cause coronavirus", "5g causes covid"),
+        ("5G towers are being used for mind control", "5g towers mind control"),
+        (
+            "UK inflation fell to 4.2 percent in November 2023",
+            "uk inflation 4.2 percent november 2023",
+        ),
+        ("5g covid", None),
+        ("mind control", None),
+        ("covid vaccine", None),
+    ],
+)
+def test_match(index, query, key):
+    match = index.match(query)
+
+    assert (match.key if match else None) == key
+
+
+def test_match_below_threshold(index):
+    best = index.search("5g covid", top_k=1)[0]
+
+    assert best.key == "5g causes covid"
+    assert best.confidence == pytest.approx(0.57, abs=0.01)
+    assert best.confidence < platform_verification_tool.MIN_MATCH_CONFIDENCE
+    assert index.match("5g covid") is None
+
+
+def test_threshold_is_inclusive(index, monkeypatch):
+    confidence = index.search("5g covid", top_k=1)[0].confidence
+
+    monkeypatch.setattr(platform_verification_tool, "MIN_MATCH_CONFIDENCE", confidence)
+    assert index.match("5g covid").key == "5g causes covid"
+    assert index.match_many(["5g covid"])[0].key == "5g causes covid"
+
+    monkeypatch.setattr(
+        platform_verification_tool, "MIN_MATCH_CONFIDENCE", confidence + 0.01
+    )
+    assert index.match("5g covid") is None
+    assert index.match_many(["5g covid"]) == [None]
+
+
+def test_match_many_equals_match(index):
+    for actual, query in zip(index.match_many(QUERIES), QUERIES):
+        assert_same_match(actual, index.match(query))
+
+
+def test_match_many_equals_match_on_synthetic_corpus():
+    rng = random.Random(3)
+    vocabulary = [f"term{i}" for i in range(300)]
+    entries = {
+        " ".join(rng.choices(vocabulary, k=rng.randint(2, 6))): {"claim_id": i}
+        for i in range(2000)
+    }
+    keys = list(entries)
+    queries = [
+        " ".join(rng.sample(keys[rng.randrange(len(keys))].split(), k=2))
+        + " "
+        + " ".join(rng.choices(vocabulary, k=rng.randint(0, 4)))
+        for _ in range(300)
+    ]
+    synthetic = VerificationIndex(entries)
+
+    matches = synthetic.match_many(queries)
+    assert any(matches)
+    for actual, query in zip(matches, queries):
+        assert_same_match(actual, synthetic.match(query))
+
+
+def test_mapped_store_matches_in_memory_index(index, tmp_path):
+    path = str(tmp_path / "platform.store")
+    write_verification_store(VERIFICATION_PLATFORM_DB, path)
+    mapped = MappedVerificationIndex(path)
+
+    for query in QUERIES:
+        assert_same_match(mapped.match(query), index.match(query))
+    for actual, expected in zip(mapped.match_many(QUERIES), index.match_many(QUERIES)):
+        assert_same_match(actual, expected)